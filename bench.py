@@ -0,0 +1,163 @@
+# bench.py
+"""
+Benchmark com cenários roteirizados. Roda o mesmo update_world/draw_world do jogo no modo
+headless (dt fixo, seed fixa) e grava p50/p95/p99 por fase e alocações em JSON, para
+comparar entre commits:
+
+    python bench.py --out antes.json
+    python bench.py --out depois.json --compare antes.json
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+import pygame
+import numpy as np
+
+from settings import *
+import main as game
+import ui
+from enemy import Grunt, Draken
+from particles import particle_system
+from bullets import bullet_engine
+from profiler import frame_profiler
+
+DT = SIM_DT
+
+def _horde(n):
+    """Completa o grupo de inimigos até n Grunts espalhados pela tela (onde a câmera estiver)."""
+    view = game.camera.rect
+    for _ in range(n - len(game.enemies)):
+        pos = (view.x + random.uniform(0, SCREEN_WIDTH), view.y + random.uniform(0, SCREEN_HEIGHT))
+        game.enemies.add(Grunt.spawn((SCREEN_WIDTH, SCREEN_HEIGHT), False, pos))
+
+class Scenario:
+    def __init__(self, name, setup, tick=None, fire_interval=250, use_abilities=False):
+        self.name = name; self.setup = setup; self.tick = tick
+        self.fire_interval = fire_interval; self.use_abilities = use_abilities
+
+def grunt_horde(n):
+    return Scenario(f'grunts_{n}', lambda: _horde(n), lambda: _horde(n))
+
+def _draken_setup():
+    game.game_state = 'BOSS_FIGHT'; game.camera.lock(); arena = game.camera.rect
+    boss = game.current_boss = Draken((SCREEN_WIDTH, SCREEN_HEIGHT), arena.topleft)
+    boss.max_hp = boss.hp = 10 ** 9; game.bosses.add(boss)
+    game.player.rect.center = (arena.x + 100, arena.y + SCREEN_HEIGHT / 2)
+
+def _draken_tick():
+    # prende o Draken no METEOR_RAIN: a cada 3 s caem 40 meteoros novos
+    boss = game.current_boss
+    if boss.actions[boss.action_index]['name'] != 'METEOR_RAIN':
+        boss.action_index = next(i for i, action in enumerate(boss.actions) if action['name'] == 'METEOR_RAIN')
+        boss.action_timer = boss.actions[boss.action_index]['duration']
+
+def _valkyrie_setup():
+    game.player.has_chain_lightning = True; game.player.has_fire_arrows = True
+    _horde(300)
+
+def _valkyrie_tick():
+    _horde(300)
+    valkyrie = game.player.valkyrie
+    if not valkyrie.active: valkyrie.cooldown_timer = 0
+    for ability in game.player.instant_abilities: ability.cooldown_timer = 0
+
+SCENARIOS = [
+    grunt_horde(50), grunt_horde(500), grunt_horde(5000),
+    Scenario('draken_meteor_rain', _draken_setup, _draken_tick),
+    Scenario('valkyrie_chain_spam', _valkyrie_setup, _valkyrie_tick, fire_interval=50, use_abilities=True),
+]
+
+def run_scenario(scenario, frames, warmup, seed, sounds, screen, world_surface, grass_tile, font):
+    game.seed_everything(seed); game.gameclock.sim_clock.reset()
+    game.reset_game(); game.game_state = 'PLAYING'; game.cycle_timer = 0
+    game.spawned_bosses = set(game.BOSS_SPAWN_TRIGGERS.values())  # sem troca para luta de chefe no meio
+    game.player.max_hp = game.player.hp = 10 ** 9
+    scenario.setup()
+    pilot = game.HeadlessPilot(seed, scenario.fire_interval, scenario.use_abilities)
+    counts = {'enemies': 0, 'projectiles': 0, 'particles': 0}
+    frame_profiler.reset(history=frames)
+    for i in range(warmup + frames):
+        if i == warmup: frame_profiler.reset(history=frames)
+        pygame.event.clear()
+        if game.game_state == 'LEVEL_UP':
+            pilot.choose_upgrade(); game.game_state = 'PLAYING' if not game.current_boss else 'BOSS_FIGHT'
+        if scenario.tick: scenario.tick()
+        frame_profiler.begin_frame()
+        keys = pilot.control(DT, sounds)
+        frame_profiler.mark('input')
+        game.update_world(DT, sounds, keys)
+        game.draw_world(world_surface, grass_tile)
+        screen.blit(world_surface, (0, 0))
+        ui.draw_hud(screen, game.player, game.score, game.kills, font, FPS)
+        frame_profiler.mark('hud')
+        pygame.display.flip()
+        frame_profiler.mark('flip'); frame_profiler.end_frame()
+        if i >= warmup:
+            counts['enemies'] += len(game.enemies) + len(game.bosses)
+            counts['projectiles'] += sum(len(g) for g in game.projectiles.values()) + bullet_engine.count
+            counts['particles'] += particle_system.count
+    result = frame_profiler.summary()
+    result['avg_counts'] = {k: round(v / frames, 1) for k, v in counts.items()}
+    return result
+
+def run(names=None, frames=600, warmup=60, alloc_frames=120, seed=1234):
+    sounds = game.init_headless((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.display.get_surface(); world_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    grass_tile = ui.load_sprite('grama.png', (64, 64)); font = ui.get_font(None, 36)
+    args = (sounds, screen, world_surface, grass_tile, font)
+    report = {'meta': {
+        'commit': _git_head(), 'python': platform.python_version(), 'pygame': pygame.version.ver,
+        'numpy': np.__version__, 'frames': frames, 'warmup': warmup, 'alloc_frames': alloc_frames,
+        'seed': seed, 'dt_ms': round(DT, 4),
+    }, 'scenarios': {}}
+    for scenario in SCENARIOS:
+        if names and scenario.name not in names: continue
+        started = time.perf_counter()
+        result = run_scenario(scenario, frames, warmup, seed, *args)
+        # alocações numa passada separada: o tracemalloc distorce os tempos
+        tracemalloc.start(); frame_profiler.track_memory = True
+        try: result['alloc_kib'] = run_scenario(scenario, alloc_frames, warmup, seed, *args)['alloc_kib']
+        finally: frame_profiler.track_memory = False; tracemalloc.stop()
+        report['scenarios'][scenario.name] = result
+        print(f"{scenario.name:22s} frame p50 {result['frame']['p50']:7.3f} ms  p95 {result['frame']['p95']:7.3f}  "
+              f"p99 {result['frame']['p99']:7.3f}  ({time.perf_counter() - started:.1f}s)")
+    frame_profiler.reset(history=240)
+    return report
+
+def compare(old, new):
+    """Imprime a variação do p50/p95 de cada fase entre dois relatórios."""
+    for name, result in new['scenarios'].items():
+        before = old.get('scenarios', {}).get(name)
+        if not before: continue
+        print(f"\n{name}")
+        rows = [('frame', before['frame'], result['frame'])]
+        rows += [(p, before['phases'].get(p, {}), s) for p, s in result['phases'].items()]
+        for phase, a, b in rows:
+            if not a or not b: continue
+            ratio = b['p50'] / a['p50'] if a['p50'] else float('inf')
+            print(f"  {phase:12s} p50 {a['p50']:8.3f} -> {b['p50']:8.3f} ms ({ratio:5.2f}x)   p95 {a['p95']:8.3f} -> {b['p95']:8.3f}")
+
+def _git_head():
+    try: return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError): return None
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark por fase dos cenários roteirizados")
+    parser.add_argument('--only', help="cenários separados por vírgula: " + ", ".join(s.name for s in SCENARIOS))
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--warmup', type=int, default=60)
+    parser.add_argument('--alloc-frames', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--compare', help="relatório anterior para comparar")
+    args = parser.parse_args()
+    report = run(args.only.split(',') if args.only else None, args.frames, args.warmup, args.alloc_frames, args.seed)
+    with open(args.out, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2, sort_keys=True)
+    print(f"resultado salvo em {args.out}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f: compare(json.load(f), report)
+    pygame.quit()
@@ -0,0 +1,179 @@
+# bullets.py
+import math
+import random
+import numpy as np
+from settings import *
+from ui import circle_sprite, ellipse_sprite
+from navigation import obstacle_map
+from world import camera
+
+# Tipos de projétil de chefe. 'life' é a duração (ms) do estado normal (None = até sair da
+# área ativa em volta da câmera); com 'blast' o projétil não some ao fim dela: passa para o estado de explosão por
+# 'blast' ms. 'speed' em px por passo de 60 Hz (0 = parado). 'hit' decide o que acontece
+# ao tocar o jogador: 'consume' (dá dano e some), 'repeat' (dá dano enquanto encostar, o
+# cooldown do jogador segura) ou 'once' (uma vez só); 'blast_hit' vale para a explosão.
+BULLET_KINDS = {
+    'fire_cone': {'size': (18, 6), 'speed': 10, 'damage': 18, 'life': 700, 'hit': 'consume',
+                  'light': 40, 'image': lambda: ellipse_sprite((18, 6), FIRE_RED)},
+    # o telegraph do meteoro também machuca (comportamento original, mantido de propósito)
+    'meteor':    {'size': (56, 56), 'damage': 35, 'life': 700, 'hit': 'repeat',
+                  'blast': 150, 'blast_hit': 'once', 'blast_light': 56,
+                  'image': lambda: circle_sprite(28, (*FIRE_RED, 90), 3), 'blast_image': lambda: circle_sprite(28, (*ORANGE, 190))},
+}
+
+# Padrões de disparo. Mirados: um projétil por ângulo (radianos) somado à direção do alvo.
+# Com 'area' = (x0, y0, x1, y1) caem 'count' projéteis em pontos sorteados nessa faixa,
+# com x1/y1 medidos a partir da borda direita/de baixo da tela.
+PATTERNS = {
+    'draken_cone': {'kind': 'fire_cone', 'angles': (-0.4, -0.3, -0.2, -0.1, 0, 0.1, 0.2, 0.3, 0.4)},
+    'draken_meteor_rain': {'kind': 'meteor', 'count': 40, 'area': (80, 120, 80, 40)},
+}
+
+HIT_MODES = ('consume', 'repeat', 'once')
+
+class BulletEngine:
+    """
+    Projéteis dos chefes em arrays NumPy (structure of arrays), como o ParticleSystem:
+    os vivos ficam compactados em [0, count), na ordem em que foram disparados. update
+    move, conta o tempo e descarta todos de uma vez; hit_player testa todos contra o
+    jogador numa passada só. Cada projétil tem dois estados (0 = normal, 1 = explosão)
+    e a imagem de cada (tipo, estado) é uma Surface compartilhada. Posições são float;
+    `prev` guarda a do passo anterior para o desenho interpolar (snapshot + alpha).
+    """
+    def __init__(self, capacity=256):
+        self.kind_ids = {name: i for i, name in enumerate(BULLET_KINDS)}
+        kinds = list(BULLET_KINDS.values())
+        self.k_size = np.array([k['size'] for k in kinds], np.int64)
+        self.k_speed = [k.get('speed', 0) for k in kinds]
+        self.k_life = np.array([k['life'] if k['life'] is not None else np.inf for k in kinds])
+        self.k_blast = np.array([k.get('blast', 0) for k in kinds], np.float64)
+        self.k_hit = [(HIT_MODES.index(k['hit']), HIT_MODES.index(k.get('blast_hit', k['hit']))) for k in kinds]
+        self.k_light = np.array([(k.get('light', 0), k.get('blast_light', 0)) for k in kinds], np.int64)
+        self._images = None
+        self.count = 0; self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old, n = getattr(self, 'pos', None), self.count
+        self.capacity = capacity
+        arrays = {'pos': ((capacity, 2), np.float64),     # canto superior esquerdo
+                  'prev': ((capacity, 2), np.float64),    # pos antes do último passo
+                  'vel': ((capacity, 2), np.float64),     # px por frame de 60 FPS
+                  'timer': (capacity, np.float64),        # ms restantes no estado atual
+                  'damage': (capacity, np.int32),
+                  'kind': (capacity, np.int8),
+                  'state': (capacity, np.int8),
+                  'has_hit': (capacity, bool)}
+        for name, (shape, dtype) in arrays.items():
+            arr = np.zeros(shape, dtype)
+            if old is not None: arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+
+    def images(self):
+        if self._images is None:
+            self._images = []
+            for k in BULLET_KINDS.values():
+                image = k['image'](); self._images += [image, k['blast_image']() if 'blast_image' in k else image]
+        return self._images
+
+    def spawn(self, kind, center, angle=0.0):
+        k = self.kind_ids[kind]
+        if self.count == self.capacity: self._allocate(self.capacity * 2)
+        i = self.count; self.count += 1
+        w, h = self.k_size[k].tolist(); speed = self.k_speed[k]
+        self.pos[i] = self.prev[i] = (center[0] - w // 2, center[1] - h // 2)
+        self.vel[i] = (math.cos(angle) * speed, math.sin(angle) * speed) if speed else (0, 0)
+        self.timer[i] = self.k_life[k]; self.damage[i] = BULLET_KINDS[kind]['damage']
+        self.kind[i] = k; self.state[i] = 0; self.has_hit[i] = False
+
+    def fire(self, pattern, origin, target=None, bounds=(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """Dispara um padrão de PATTERNS a partir de `origin` (mirado em `target`); os de área caem dentro de `bounds`."""
+        cfg = PATTERNS[pattern]; kind = cfg['kind']
+        if 'area' in cfg:
+            x0, y0, x1, y1 = cfg['area']; bx, by, w, h = bounds
+            for _ in range(cfg['count']): self.spawn(kind, (bx + random.randint(x0, w - x1), by + random.randint(y0, h - y1)))
+        else:
+            base = math.atan2(target[1] - origin[1], target[0] - origin[0]) if target is not None else 0.0
+            for offset in cfg['angles']: self.spawn(kind, origin, base + offset)
+
+    def update(self, dt):
+        n = self.count
+        if not n: return
+        kind, state, pos, timer = self.kind[:n], self.state[:n], self.pos[:n], self.timer[:n]
+        step = self.vel[:n] * (dt / 16.67); size = self.k_size[kind]
+        blocked = np.zeros(n, bool)
+        if obstacle_map.index:
+            # varredura do passo inteiro contra os obstáculos: projétil rápido não atravessa pedra
+            moving = np.flatnonzero(step.any(axis=1))
+            if moving.size:
+                t = obstacle_map.index.sweep_boxes(pos[moving, 0], pos[moving, 1], step[moving, 0], step[moving, 1],
+                                                   size[moving, 0].astype(np.float64), size[moving, 1].astype(np.float64))
+                blocked[moving] = t <= 1
+        pos += step
+        timer -= dt
+        expired = timer <= 0
+        blast = self.k_blast[kind]
+        to_blast = expired & (state == 0) & (blast > 0)
+        dead = (expired & ~to_blast) | blocked
+        state[to_blast] = 1; timer[to_blast] = blast[to_blast]
+        ax, ay, aw, ah = camera.active
+        dead |= ~((pos[:, 0] < ax + aw) & (pos[:, 0] + size[:, 0] > ax) & (pos[:, 1] < ay + ah) & (pos[:, 1] + size[:, 1] > ay))
+        if dead.any(): self._compact(~dead)
+
+    def hit_player(self, player):
+        """Aplica no jogador o dano de todos os projéteis que encostam nele, na ordem de disparo."""
+        n = self.count
+        if not n: return
+        r = player.rect; pos = self.pos[:n]; size = self.k_size[self.kind[:n]]
+        touching = (pos[:, 0] < r.right) & (pos[:, 0] + size[:, 0] > r.left) & (pos[:, 1] < r.bottom) & (pos[:, 1] + size[:, 1] > r.top)
+        hits = np.flatnonzero(touching)
+        if not hits.size: return
+        alive = np.ones(n, bool)
+        for i, k, s in zip(hits.tolist(), self.kind[hits].tolist(), self.state[hits].tolist()):
+            mode = self.k_hit[k][s]
+            if mode == 2:
+                if self.has_hit[i]: continue
+                self.has_hit[i] = True
+            player.take_damage(int(self.damage[i]))
+            if mode == 0: alive[i] = False
+        if not alive.all(): self._compact(alive)
+
+    def _compact(self, keep):
+        n = self.count; m = int(keep.sum())
+        for arr in (self.pos, self.prev, self.vel, self.timer, self.damage, self.kind, self.state, self.has_hit):
+            arr[:m] = arr[:n][keep]
+        self.count = m
+
+    def snapshot(self):
+        """Guarda as posições atuais como o estado anterior (chamado antes do último passo do frame)."""
+        self.prev[:self.count] = self.pos[:self.count]
+
+    def drawn_pos(self, alpha=1.0, origin=(0, 0)):
+        n = self.count; pos = self.pos[:n]
+        if alpha < 1: pos = self.prev[:n] + (pos - self.prev[:n]) * alpha
+        return np.rint(pos).astype(np.int64) - origin
+
+    def blits(self, alpha=1.0, origin=(0, 0)):
+        """Pares (Surface, (x, y)) para Surface.blits, na ordem de disparo, interpolados por `alpha` e relativos a `origin` (câmera)."""
+        n = self.count
+        if not n: return []
+        images = self.images()
+        image_ids = (self.kind[:n].astype(np.int64) * 2 + self.state[:n]).tolist()
+        return [(images[i], xy) for i, xy in zip(image_ids, self.drawn_pos(alpha, origin).tolist())]
+
+    def lights(self):
+        """[((x, y), raio)] dos projéteis que iluminam a noite (cone de fogo, meteoro explodindo)."""
+        n = self.count
+        if not n: return []
+        kind = self.kind[:n]; radius = self.k_light[kind, self.state[:n]]; lit = radius > 0
+        centers = np.rint(self.pos[:n][lit]).astype(np.int64) + self.k_size[kind[lit]] // 2
+        return [(tuple(c), r) for c, r in zip(centers.tolist(), radius[lit].tolist())]
+
+    def boxes(self, alpha=1.0, origin=(0, 0)):
+        """(x0, y0, x1, y1) de cada projétil vivo como blits(alpha, origin) desenha — usado pelo modo dirty rects."""
+        n = self.count; xy = self.drawn_pos(alpha, origin); wh = self.k_size[self.kind[:n]]
+        return xy[:, 0], xy[:, 1], xy[:, 0] + wh[:, 0], xy[:, 1] + wh[:, 1]
+
+    def clear(self):
+        self.count = 0
+
+bullet_engine = BulletEngine()
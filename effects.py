@@ -0,0 +1,114 @@
+# effects.py
+import heapq
+import itertools
+from particles import create_particles
+
+# Tipos de efeito. 'tick' = intervalo (ms) entre danos (None = sem dano periódico);
+# 'stacking' decide o que uma nova aplicação faz com um efeito já ativo no alvo:
+#   'refresh'   substitui duração e dano e reinicia o intervalo (comportamento original do fogo)
+#   'stack'     soma uma pilha (até 'max_stacks'): dano por tick = dano x pilhas; renova a duração
+#   'extend'    soma a duração restante (até 'max_duration')
+#   'strongest' fica com a maior intensidade e a maior duração
+# 'move' multiplica a velocidade do alvo enquanto o efeito dura (0 = parado).
+EFFECT_TYPES = {
+    'fire':   {'tick': 1000, 'stacking': 'refresh', 'particles': 'sparks'},
+    'poison': {'tick': 500, 'stacking': 'stack', 'max_stacks': 5, 'particles': 'sparks'},
+    'slow':   {'tick': None, 'stacking': 'strongest', 'move': 0.5},
+    'stun':   {'tick': None, 'stacking': 'extend', 'max_duration': 3000, 'move': 0.0},
+}
+
+EXPIRE, TICK = 0, 1  # no mesmo instante a expiração vem antes do tick, como no loop antigo
+
+class StatusEffects:
+    """
+    Efeitos de status de todos os alvos numa tabela só, {(alvo, tipo): registro}, com um
+    min-heap de eventos (instante, ordem, EXPIRE/TICK, chave, geração). Cada passo só
+    mexe nos eventos vencidos; reaplicar um efeito troca a geração do registro e os
+    eventos antigos viram lixo descartado quando chegam ao topo. Os danos vencidos no
+    mesmo passo são somados por alvo e aplicados de uma vez.
+    Como no loop antigo, o próximo tick conta a partir do passo em que o anterior caiu:
+    um fogo de 3000 ms dá dano duas vezes (~1 s e ~2 s) e some em 3 s.
+    """
+    def __init__(self):
+        self.now = 0.0; self.table = {}; self.heap = []; self._order = itertools.count()
+
+    def _push(self, when, kind, key, gen):
+        heapq.heappush(self.heap, (when, next(self._order), kind, key, gen))
+
+    def apply(self, target, effect_type, duration, damage_per_tick=0, magnitude=None):
+        cfg = EFFECT_TYPES[effect_type]; key = (target, effect_type); now = self.now
+        rec = self.table.get(key); tick = cfg['tick']
+        if magnitude is None: magnitude = cfg.get('move', 1.0)
+        if rec is None:
+            rec = self.table[key] = {'expires': now + duration, 'damage': damage_per_tick, 'stacks': 1,
+                                     'magnitude': magnitude, 'next_tick': now + tick if tick else None, 'gen': next(self._order)}
+        else:
+            rule = cfg['stacking']
+            if rule == 'refresh':
+                rec.update(expires=now + duration, damage=damage_per_tick, magnitude=magnitude, next_tick=now + tick if tick else None)
+            elif rule == 'stack':
+                rec['stacks'] = min(rec['stacks'] + 1, cfg.get('max_stacks', 1)); rec['expires'] = now + duration
+                rec['damage'] = max(rec['damage'], damage_per_tick)
+            elif rule == 'extend':
+                rec['expires'] = min(rec['expires'] + duration, now + cfg.get('max_duration', float('inf')))
+            else:
+                rec['expires'] = max(rec['expires'], now + duration)
+                rec['magnitude'] = min(rec['magnitude'], magnitude)  # mais lento = mais forte
+            rec['gen'] = next(self._order)  # geração única: evento velho nunca casa com registro novo
+        gen = rec['gen']
+        self._push(rec['expires'], EXPIRE, key, gen)
+        # a geração nova invalida os eventos pendentes; o próximo tick (reiniciado ou não) vai de novo para o heap
+        if rec['next_tick'] is not None: self._push(rec['next_tick'], TICK, key, gen)
+        if 'move' in cfg: self._refresh_move(target)
+
+    def update(self, dt):
+        """Avança `dt` ms; devolve os alvos mortos pelos ticks (a recompensa fica com quem chamou)."""
+        self.now += dt; now = self.now; heap = self.heap; table = self.table
+        damage = {}; moved = set(); killed = []
+        while heap and heap[0][0] <= now:
+            when, _, kind, key, gen = heapq.heappop(heap)
+            rec = table.get(key)
+            if rec is None or rec['gen'] != gen: continue
+            target, effect_type = key
+            if kind == EXPIRE or not target.alive():
+                del table[key]
+                if 'move' in EFFECT_TYPES[effect_type]: moved.add(target)
+                continue
+            cfg = EFFECT_TYPES[effect_type]
+            rec['next_tick'] = now + cfg['tick']; self._push(rec['next_tick'], TICK, key, gen)
+            ticks = damage.setdefault(target, [])
+            ticks.append((rec['damage'] * rec['stacks'], cfg.get('particles')))
+        for target in moved: self._refresh_move(target)
+        for target, ticks in damage.items():
+            target.hp -= sum(amount for amount, _ in ticks)
+            for _, p_type in ticks:
+                if p_type: create_particles(target.rect.center, p_type)
+            if target.hp <= 0 and target.alive(): target.kill(); killed.append(target)
+        return killed
+
+    def _refresh_move(self, target):
+        scale = 1.0
+        for effect_type, cfg in EFFECT_TYPES.items():
+            if 'move' in cfg:
+                rec = self.table.get((target, effect_type))
+                if rec is not None: scale *= rec['magnitude']
+        target.move_scale = scale
+
+    def drop(self, target):
+        """Tira todos os efeitos de `target` (ex.: instância que voltou do pool); eventos pendentes viram lixo."""
+        for effect_type in EFFECT_TYPES: self.table.pop((target, effect_type), None)
+        target.move_scale = 1.0
+
+    def has(self, target, effect_type):
+        return (target, effect_type) in self.table
+
+    def targets(self, effect_type):
+        """Alvos vivos com o efeito ativo."""
+        return [target for target, kind in self.table if kind == effect_type and target.alive()]
+
+    def clear(self):
+        for target, effect_type in self.table:
+            if 'move' in EFFECT_TYPES[effect_type]: target.move_scale = 1.0
+        self.table.clear(); self.heap.clear(); self.now = 0.0
+
+status_effects = StatusEffects()
@@ -2,193 +2,267 @@
 import pygame
 import math
 import random
+import numpy as np
+import gameclock
 from settings import *
-from ui import load_sprite
-from particles import create_particles
+from ui import load_sprite, solid_sprite, circle_sprite, TRANSLUCENT, FLIP_X, FLASH
 from player import LeapExplosion
+from spatial import center_distance_sq
+from pool import PooledSprite
+from bullets import bullet_engine
+from effects import status_effects
+from navigation import flow_field, obstacle_map
+from world import camera
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, pos, speed, hp, score, xp, screen_dims):
-        super().__init__()
+class EnemySwarm:
+    """
+    Centro float de todos os inimigos comuns vivos num array NumPy compacto [0, n).
+    O inimigo entra ao ser adicionado a um Group e sai quando não está em mais nenhum
+    (kill/empty), então o passo de perseguição não precisa montar nada por frame.
+
+    Nível de detalhe (LOD): a cada passo schedule() decide quem anda e quem pensa (update)
+    agora. Longe do jogador o update roda a cada AI_LOD_FAR_PERIOD passos e fora da tela a
+    perseguição também espaça para AI_LOD_OFFSCREEN_PERIOD; quem pula passos acumula o dt
+    e recebe tudo de uma vez quando chega a vez, então distâncias e timers não atrasam.
+    A fase de cada inimigo é fixada ao entrar, espalhando os atrasados pelos passos.
+    """
+    ARRAYS = ('pos', 'move_acc', 'think_acc', 'phase')
+
+    def __init__(self, capacity=256):
+        self.pos = np.zeros((capacity, 2), np.float64); self.sprites = []
+        self.move_acc = np.zeros(capacity); self.think_acc = np.zeros(capacity)  # ms acumulados desde a última vez
+        self.phase = np.zeros(capacity, np.int64); self.tick = 0; self._next_phase = 0
+        self.think_dt = np.zeros(0)
+    def add(self, sprite):
+        n = len(self.sprites)
+        if n == len(self.pos):
+            for name in self.ARRAYS: arr = getattr(self, name); setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+        self.pos[n] = sprite._fx, sprite._fy; self.move_acc[n] = self.think_acc[n] = 0
+        self.phase[n] = self._next_phase; self._next_phase = (self._next_phase + 1) % AI_LOD_OFFSCREEN_PERIOD
+        sprite._slot = n; self.sprites.append(sprite)
+    def remove(self, sprite):
+        i, last = sprite._slot, len(self.sprites) - 1
+        sprite._fx, sprite._fy = self.pos[i].tolist(); sprite._slot = None
+        if i != last:
+            moved = self.sprites[i] = self.sprites[last]; moved._slot = i
+            for name in self.ARRAYS: arr = getattr(self, name); arr[i] = arr[last]
+        self.sprites.pop()
+    def clear(self):
+        for sprite in list(self.sprites): self.remove(sprite)
+        self.tick = 0; self._next_phase = 0
+    def schedule(self, target, dt, view=ARENA_RECT):
+        """dt de movimento de cada slot neste passo (0 = espera); o de update fica em think_dt."""
+        n = len(self.sprites); self.tick += 1
+        pos = self.pos[:n]; x, y, w, h = view; m = AI_LOD_VIEW_MARGIN
+        visible = (pos[:, 0] > x - m) & (pos[:, 0] < x + w + m) & (pos[:, 1] > y - m) & (pos[:, 1] < y + h + m)
+        near = ((pos - np.array(target, np.float64)) ** 2).sum(axis=1) < AI_LOD_NEAR ** 2
+        period = np.where(visible, np.where(near, 1, AI_LOD_FAR_PERIOD), AI_LOD_OFFSCREEN_PERIOD)
+        due = (self.tick + self.phase[:n]) % period == 0
+        move_acc, think_acc = self.move_acc[:n], self.think_acc[:n]
+        move_acc += dt; think_acc += dt
+        moving = visible | due  # na tela o movimento é sempre contínuo; só o update espaça
+        move_dt = np.where(moving, move_acc, 0.0); move_acc[moving] = 0
+        self.think_dt = np.where(due, think_acc, 0.0); think_acc[due] = 0
+        return move_dt
+    def steer(self, target, dt, view=ARENA_RECT):
+        """Mesmo passo de Enemy.move para todos de uma vez (multiplicadores noturnos já estão no speed)."""
+        n = len(self.sprites)
+        if not n: self.think_dt = np.zeros(0); return
+        move_dt = self.schedule(target, dt, view)
+        pos = self.pos[:n]
+        speed = np.fromiter(map(_speed_of, self.sprites), np.float64, n) * (move_dt / 16.67)
+        delta = np.array(target, np.float64) - pos
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        if flow_field.active: pos += flow_field.steer(pos, delta * np.divide(1, dist, out=np.zeros_like(dist), where=dist != 0)[:, None]) * speed[:, None]
+        else: pos += delta * np.divide(speed, dist, out=np.zeros_like(dist), where=dist != 0)[:, None]
+        for sprite, center in zip(self.sprites, np.rint(pos).astype(np.int64).tolist()):
+            sprite.rect.center = center
+
+_speed_of = lambda sprite: sprite.speed * sprite.move_scale
+swarm = EnemySwarm()
+
+def steer_enemies(player_rect, dt, view=ARENA_RECT):
+    """Perseguição em lote dos inimigos comuns; depois chame update_enemies."""
+    flow_field.update(player_rect.center)
+    swarm.steer(player_rect.center, dt, view)
+
+def update_enemies(enemies, player_rect, projectiles, dt):
+    """update de cada inimigo com o dt que o LOD liberou neste passo (quem não está na vez espera)."""
+    think = swarm.think_dt.tolist()
+    plan = [(sprite, think[sprite._slot] if sprite._slot is not None and sprite._slot < len(think) else dt) for sprite in enemies.sprites()]
+    for sprite, sprite_dt in plan:
+        if sprite_dt: sprite.update(player_rect, projectiles, enemies, sprite_dt, steered=True)
+
+class Enemy(PooledSprite):
+    batch_steer = True  # perseguição feita em lote pelo swarm (bosses fazem a própria)
+    plain_draw = True   # draw() é só um blit de image em rect: a RenderQueue desenha em lote
+
+    # inimigos comuns vêm do pool (spawner.py): reset() deixa a instância como recém-criada
+    def reset(self, pos, speed, hp, score, xp, screen_dims):
+        status_effects.drop(self)  # efeitos da vida anterior não passam para a nova
         self.speed = speed; self.max_hp = hp; self.hp = hp; self.score_value = score; self.xp_value = xp
         self.screen_width, self.screen_height = screen_dims
-        self.last_hit_time = 0; self.flash_timer = 0; self.flash_duration = 100; self.effects = {}
-        self.projectiles = None
-    def apply_effect(self, effect_type, duration, damage_per_tick=0):
-        self.effects[effect_type] = {'duration': duration, 'damage': damage_per_tick, 'timer': 1000}
+        self.last_hit_time = 0; self.flash_timer = 0; self.flash_duration = 100
+        self.projectiles = None; self.move_scale = 1.0  # lentidão/atordoamento (effects.py)
+        self._fx, self._fy = pos; self._slot = None  # centro sub-pixel: mova sempre por set_center
+    def add_internal(self, group):
+        super().add_internal(group)
+        if self.batch_steer and self._slot is None: swarm.add(self)
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if self._slot is not None and not self.alive(): swarm.remove(self)
+    def kill(self):
+        super().kill()
+        if self._slot is not None: swarm.remove(self)
+    def float_center(self):
+        if self._slot is None: return self._fx, self._fy
+        x, y = swarm.pos[self._slot].tolist(); return x, y
+    def set_center(self, x, y):
+        if self._slot is None: self._fx, self._fy = x, y
+        else: swarm.pos[self._slot] = x, y
+        self.rect.center = (round(x), round(y))
+    def apply_effect(self, effect_type, duration, damage_per_tick=0, magnitude=None):
+        status_effects.apply(self, effect_type, duration, damage_per_tick, magnitude)
     def take_damage(self, amount, sounds, knockback=(0, 0)):
         self.hp -= amount; self.flash_timer = self.flash_duration
-        sounds['hit'].play(); self.rect.x += knockback[0]; self.rect.y += knockback[1]
+        sounds['hit'].play()
+        if knockback[0] or knockback[1]:
+            x, y = self.float_center(); self.set_center(x + knockback[0], y + knockback[1])
         if self.hp <= 0: self.kill()
 
     # ALTERADO: Assinatura de update (sem 'obstacles')
-    def update(self, player_rect, projectiles, enemies, dt):
+    def update(self, player_rect, projectiles, enemies, dt, steered=False):
         self.projectiles = projectiles
-        self.move(player_rect, dt)
+        if not steered: self.move(player_rect, dt)
         if self.flash_timer > 0: self.flash_timer -= dt
-        to_remove = []
-        for effect, data in self.effects.items():
-            data['duration'] -= dt
-            if data['duration'] <= 0: to_remove.append(effect)
-            else:
-                if 'damage' in data:
-                    data['timer'] -= dt
-                    if data['timer'] <= 0:
-                        data['timer'] = 1000; self.hp -= data['damage']
-                        create_particles(self.rect.center, 'sparks', projectiles['vfx'])
-                        if self.hp <= 0: self.kill()
-        for effect in to_remove: del self.effects[effect]
     def draw(self, surface):
         surface.blit(self.image, self.rect)
     
     # ALTERADO: Assinatura de move (sem 'obstacles')
     def move(self, player_rect, dt, move_multiplier=1):
-        dx, dy = player_rect.centerx - self.rect.centerx, player_rect.centery - self.rect.centery
+        x, y = self.float_center()
+        dx, dy = player_rect.centerx - x, player_rect.centery - y
         dist = math.hypot(dx, dy)
         if dist != 0:
-            move_speed = self.speed * (dt / 16.67) * move_multiplier
-            self.rect.x += (dx / dist) * move_speed; self.rect.y += (dy / dist) * move_speed
+            move_speed = self.speed * self.move_scale * (dt / 16.67) * move_multiplier
+            flow = flow_field.direction(x, y)  # contorna obstáculos; None = caminho reto
+            if flow: dx, dy = flow; dist = 1
+            self.set_center(x + (dx / dist) * move_speed, y + (dy / dist) * move_speed)
+
+def edge_position(view, side=None):
+    """Ponto de entrada logo fora da borda `side` ('top', 'left', 'right'; sorteada se None) do rect `view` (x, y, w, h)."""
+    if side is None: side = random.choice(['top', 'left', 'right'])
+    x, y, w, h = view
+    if side == 'top': return (x + random.randint(0, w), y - 30)
+    elif side == 'left': return (x - 30, y + random.randint(0, h))
+    else: return (x + w + 30, y + random.randint(0, h))
 
 class Grunt(Enemy):
-    def __init__(self, screen_dims, is_night):
-        side = random.choice(['top', 'left', 'right'])
-        if side == 'top': pos = (random.randint(0, screen_dims[0]), -30)
-        elif side == 'left': pos = (-30, random.randint(0, screen_dims[1]))
-        else: pos = (screen_dims[0] + 30, random.randint(0, screen_dims[1]))
+    def reset(self, screen_dims, is_night, pos=None):
+        if pos is None: pos = edge_position(camera.rect)  # borda da tela, onde quer que a câmera esteja
         speed = random.uniform(1.5, 2.5); hp = 100
         if is_night: speed *= 1.2; hp = int(hp * 1.5)
-        super().__init__(pos, speed, hp, 10, 10, screen_dims)
+        super().reset(pos, speed, hp, 10, 10, screen_dims)
         self.frames = [load_sprite('Grunt-1.png', (60, 60)), load_sprite('Grunt-2.png', (60, 60))]
+        self.flash_frames = [load_sprite('Grunt-1.png', (60, 60), FLASH), load_sprite('Grunt-2.png', (60, 60), FLASH)]
         self.current_frame = 0; self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect(center=pos)
         self.anim_timer = 0; self.anim_speed = 300
-    def update(self, player_rect, projectiles, enemies, dt):
-        super().update(player_rect, projectiles, enemies, dt)
+    def update(self, player_rect, projectiles, enemies, dt, steered=False):
+        super().update(player_rect, projectiles, enemies, dt, steered)
         self.anim_timer += dt
         if self.anim_timer >= self.anim_speed:
             self.anim_timer = 0; self.current_frame = (self.current_frame + 1) % len(self.frames)
             self.image = self.frames[self.current_frame]
+    @property
+    def plain_draw(self): return self.flash_timer <= 0
     def draw(self, surface):
-        if self.flash_timer > 0:
-            flash_img = self.image.copy(); flash_img.fill(WHITE, special_flags=pygame.BLEND_RGB_ADD)
-            surface.blit(flash_img, self.rect)
-        else:
-            surface.blit(self.image, self.rect)
+        surface.blit(self.flash_frames[self.current_frame] if self.flash_timer > 0 else self.image, self.rect)
 
 class Tank(Grunt):
-    def __init__(self, screen_dims, is_night):
-        super().__init__(screen_dims, is_night)
+    def reset(self, screen_dims, is_night, pos=None):
+        super().reset(screen_dims, is_night, pos)
         self.frames = [load_sprite('Tank-1.png', (70, 70)), load_sprite('Tank-2.png', (70, 70))]
+        self.flash_frames = [load_sprite('Tank-1.png', (70, 70), FLASH), load_sprite('Tank-2.png', (70, 70), FLASH)]
         self.image = self.frames[0]; self.rect = self.image.get_rect(center=self.rect.center)
         self.speed = 1.5; self.max_hp = self.hp = 300; self.score_value = 30; self.xp_value = 25; self.anim_speed = 400
         if is_night: self.speed *= 1.2; self.hp = int(self.hp * 1.5)
 
 class Bomber(Grunt):
-    def __init__(self, screen_dims, is_night):
-        super().__init__(screen_dims, is_night)
-        self.image = pygame.Surface((35,35)); self.image.fill(ORANGE)
+    def reset(self, screen_dims, is_night, pos=None):
+        super().reset(screen_dims, is_night, pos)
+        self.frames = [solid_sprite((35, 35), ORANGE)]; self.flash_frames = [solid_sprite((35, 35), WHITE)]
+        self.current_frame = 0; self.image = self.frames[0]
         self.rect = self.image.get_rect(center=self.rect.center)
         self.original_color = ORANGE; self.speed *= 1.5; self.xp_value = 15; self.score_value=5
-    def update(self, player_rect, projectiles, enemies, dt):
-        super().update(player_rect, projectiles, enemies, dt)
+    def update(self, player_rect, projectiles, enemies, dt, steered=False):
+        super().update(player_rect, projectiles, enemies, dt, steered)
         if self.rect.colliderect(player_rect): 
             self.kill()
     def kill(self):
         if self.projectiles:
-            self.projectiles['enemy_explosions'].add(LeapExplosion(self.rect.center))
+            self.projectiles['enemy_explosions'].add(LeapExplosion.spawn(self.rect.center))
         super(Grunt, self).kill()
-    def draw(self, surface):
-        color = WHITE if self.flash_timer > 0 else self.original_color
-        self.image.fill(color); surface.blit(self.image, self.rect)
 
 class Assassin(Grunt):
-    def __init__(self, screen_dims, is_night):
-        super().__init__(screen_dims, is_night)
-        self.image = pygame.Surface((30,30), pygame.SRCALPHA); self.original_color = (60,60,60)
-        self.image.fill(self.original_color); self.rect = self.image.get_rect(center=self.rect.center)
-        self.speed *= 1.2; self.alpha = 50; self.image.set_alpha(self.alpha); self.reveal_distance = 120; self.xp_value = 20
+    def reset(self, screen_dims, is_night, pos=None):
+        super().reset(screen_dims, is_night, pos)
+        self.original_color = (60,60,60); self.alpha = 50
+        self.image = solid_sprite((30, 30), self.original_color, self.alpha); self.rect = self.image.get_rect(center=self.rect.center)
+        self.speed *= 1.2; self.reveal_distance = 120; self.xp_value = 20
         self.hp = 25
     def take_damage(self, amount, sounds, knockback=(0, 0)):
         if self.alpha < 255: return
         super().take_damage(amount, sounds, knockback)
-    def update(self, player_rect, projectiles, enemies, dt):
-        super().update(player_rect, projectiles, enemies, dt)
-        dist = math.hypot(player_rect.centerx - self.rect.centerx, player_rect.centery - self.rect.centery)
-        self.alpha = 255 if dist < self.reveal_distance else 50
-    def draw(self, surface): 
-        temp_image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        color_to_draw = WHITE if self.flash_timer > 0 else self.original_color
-        temp_image.fill(color_to_draw); temp_image.set_alpha(self.alpha)
-        surface.blit(temp_image, self.rect)
+    def update(self, player_rect, projectiles, enemies, dt, steered=False):
+        super().update(player_rect, projectiles, enemies, dt, steered)
+        near = center_distance_sq(player_rect, self.rect) < self.reveal_distance ** 2
+        self.alpha = 255 if near and obstacle_map.index.line_of_sight(player_rect.center, self.rect.center) else 50
+        self.image = solid_sprite((30, 30), self.original_color, self.alpha)
+    def draw(self, surface):
+        surface.blit(solid_sprite((30, 30), WHITE, self.alpha) if self.flash_timer > 0 else self.image, self.rect)
         
-class Shockwave(pygame.sprite.Sprite):
-    def __init__(self, x, y, target, angle_offset=0):
-        super().__init__(); self.image = pygame.Surface([10, 40]); self.image.fill(ORANGE)
-        self.rect = self.image.get_rect(center=(x, y))
-        angle = math.atan2(target.centery - y, target.centerx - x) + math.radians(angle_offset)
-        self.vel_x = math.cos(angle) * 6; self.vel_y = math.sin(angle) * 6; self.damage = 30
-    def update(self, dt):
-        move_speed = dt / 16.67; self.rect.x += self.vel_x * move_speed; self.rect.y += self.vel_y * move_speed
-        if not pygame.display.get_surface().get_rect().colliderect(self.rect): self.kill()
-    def draw(self, surface): surface.blit(self.image, self.rect)
-
-class PoisonFog(pygame.sprite.Sprite):
-    def __init__(self, center_pos):
-        super().__init__(); self.radius = 100
-        self.image = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (*PURPLE, 100), (self.radius, self.radius), self.radius)
+class PoisonFog(PooledSprite):
+    plain_draw = True
+    pool_limit = 4
+    def reset(self, center_pos):
+        self.radius = 100; self.image = circle_sprite(self.radius, (*PURPLE, 100))
         self.rect = self.image.get_rect(center=center_pos)
         self.duration = 8000; self.damage = 5; self.damage_interval = 500; self.last_damage_time = 0
     def update(self, dt):
         self.duration -= dt
         if self.duration <= 0: self.kill()
     def damage_player(self, player):
-        now = pygame.time.get_ticks()
+        now = gameclock.get_ticks()
         if now - self.last_damage_time > self.damage_interval: player.take_damage(self.damage); self.last_damage_time = now
     def draw(self, surface): surface.blit(self.image, self.rect)
 
 # NOVO: Classe Illusion readicionada ao arquivo
 class Illusion(Enemy):
-    def __init__(self, pos, screen_width, screen_height):
+    pool_limit = 8
+    def reset(self, pos, screen_width, screen_height):
         offset_pos = (pos[0] + random.randint(-50, 50), pos[1] + random.randint(-50, 50))
-        super().__init__(offset_pos, 1.5, 1, 0, 0, (screen_width, screen_height))
-        self.image = load_sprite('Morgana-Flutuando.png', (90, 120))
-        self.image.set_alpha(128)
+        super().reset(offset_pos, 1.5, 1, 0, 0, (screen_width, screen_height))
+        self.image = load_sprite('Morgana-Flutuando.png', (90, 120), TRANSLUCENT)
         self.rect = self.image.get_rect(center=offset_pos)
     def draw(self, surface): # Ilusões não piscam ao tomar dano
         surface.blit(self.image, self.rect)
 
-class FireCone(pygame.sprite.Sprite):
-    def __init__(self, start, angle):
-        super().__init__(); self.image = pygame.Surface((18, 6), pygame.SRCALPHA)
-        pygame.draw.ellipse(self.image, FIRE_RED, self.image.get_rect()); self.rect = self.image.get_rect(center=start)
-        self.vx, self.vy = math.cos(angle)*10, math.sin(angle)*10; self.damage = 18; self.lifetime = 700
-    def update(self, dt):
-        f = dt/16.67; self.rect.x += int(self.vx*f); self.rect.y += int(self.vy*f); self.lifetime -= dt
-        if self.lifetime <= 0 or not pygame.display.get_surface().get_rect().colliderect(self.rect): self.kill()
-    def draw(self, surf): surf.blit(self.image, self.rect)
+def load_boss_sprites(files, size, flags=0):
+    """{chave: arquivo ou [arquivos]} -> mesmas chaves com os sprites (variante `flags`) do cache."""
+    return {key: [load_sprite(f, size, flags) for f in name] if isinstance(name, list) else load_sprite(name, size, flags)
+            for key, name in files.items()}
 
-class Meteor(pygame.sprite.Sprite):
-    def __init__(self, target_pos):
-        super().__init__(); self.telegraph_time = 700; self.exploded = False; self.has_damaged = False
-        self.radius = 28; self.image = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (*FIRE_RED, 90), (self.radius, self.radius), self.radius, 3)
-        self.rect = self.image.get_rect(center=target_pos); self.damage = 35
-    def update(self, dt):
-        self.telegraph_time -= dt
-        if self.telegraph_time <= 0 and not self.exploded:
-            self.exploded = True; self.image.fill((0,0,0,0))
-            pygame.draw.circle(self.image, (*ORANGE, 190), (self.radius, self.radius), self.radius)
-            self.telegraph_time = 150 
-        elif self.exploded and self.telegraph_time <= 0: self.kill()
-    def draw(self, surf): surf.blit(self.image, self.rect)
-        
 class Boss(Enemy):
-    def __init__(self, pos, speed, hp, score, xp, screen_dims, name):
+    batch_steer = False; plain_draw = False
+    pool_limit = 0  # um por luta: criado direto, não volta para pool
+    # `origin` = canto do mundo onde fica a arena da luta (a tela com a câmera travada)
+    def __init__(self, pos, speed, hp, score, xp, screen_dims, name, origin=(0, 0)):
         super().__init__(pos, speed, hp, score, xp, screen_dims)
-        self.name = name; self.action_timer = 0; self.action_index = 0; self.actions = []
+        self.name = name; self.origin = origin; self.action_timer = 0; self.action_index = 0; self.actions = []
     def take_damage(self, amount, sounds, knockback=(0, 0)):
         super().take_damage(amount, sounds, knockback=(knockback[0]/5.0, knockback[1]/5.0))
+    def apply_effect(self, effect_type, duration, damage_per_tick=0, magnitude=None): pass  # chefes não sofrem efeitos de status
     def start_action_sequence(self):
         self.action_index = 0; action = self.actions[self.action_index]; self.action_timer = action['duration']
     def next_action(self):
@@ -201,19 +275,23 @@ class Boss(Enemy):
         if self.flash_timer > 0: self.flash_timer -= dt
         if self.action_timer <= 0: self.next_action()
     def perform_action(self, p_rect, pr, en, dt): pass
+    def load_sprites(self, files, size):
+        # as versões espelhadas saem prontas do cache: nada de transform.flip por frame
+        self.sprites = load_boss_sprites(files, size); self.sprites_left = load_boss_sprites(files, size, FLIP_X)
+    def facing_sprites(self): return self.sprites if self.facing_right else self.sprites_left
 
 class TitanusRex(Boss):
-    def __init__(self, screen_dims):
-        pos = (screen_dims[0] - 80, screen_dims[1] / 2)
-        super().__init__(pos, 2.0, 500, 500, 100, screen_dims, "TITANUS REX")
+    def __init__(self, screen_dims, origin=(0, 0)):
+        pos = (origin[0] + screen_dims[0] - 80, origin[1] + screen_dims[1] / 2)
+        super().__init__(pos, 2.0, 500, 500, 100, screen_dims, "TITANUS REX", origin)
         sprite_size = (150, 150)
-        self.sprites = {
-            'idle': load_sprite('Rex-Idle.png', sprite_size),
-            'walk': [load_sprite('Rex-direita.png', sprite_size), load_sprite('Rex-Walk-2.png', sprite_size)],
-            'prepare_dash': load_sprite('Rex-Prepare-Dash.png', sprite_size),
-            'dash': load_sprite('Rex-Dash.png', sprite_size),
-            'hurt': load_sprite('Rex-Dano.png', sprite_size)
-        }
+        self.load_sprites({
+            'idle': 'Rex-Idle.png',
+            'walk': ['Rex-direita.png', 'Rex-Walk-2.png'],
+            'prepare_dash': 'Rex-Prepare-Dash.png',
+            'dash': 'Rex-Dash.png',
+            'hurt': 'Rex-Dano.png'
+        }, sprite_size)
         self.current_walk_frame = 0; self.anim_timer = 0; self.anim_speed = 400
         self.image = self.sprites['idle']; self.rect = self.image.get_rect(center=pos); self.facing_right = False
         self.actions = [
@@ -227,16 +305,17 @@ class TitanusRex(Boss):
     # ALTERADO: Assinatura da função update
     def update(self, player_rect, projectiles, enemies, dt):
         super().update(player_rect, projectiles, enemies, dt)
-        action_name = self.actions[self.action_index]['name']; current_sprite_base = self.sprites['idle']
+        action_name = self.actions[self.action_index]['name']; current_sprite_key = 'idle'
         if action_name == 'WALK' or action_name == 'COOLDOWN':
             self.anim_timer += dt
             if self.anim_timer >= self.anim_speed:
                 self.anim_timer = 0; self.current_walk_frame = (self.current_walk_frame + 1) % len(self.sprites['walk'])
-            current_sprite_base = self.sprites['walk'][self.current_walk_frame]
+            current_sprite_key = 'walk'
             self.facing_right = self.rect.centerx < player_rect.centerx
-        elif action_name == 'PREPARE_DASH': current_sprite_base = self.sprites['prepare_dash']
-        elif action_name == 'DASH': current_sprite_base = self.sprites['dash']
-        self.image = pygame.transform.flip(current_sprite_base, not self.facing_right, False)
+        elif action_name == 'PREPARE_DASH': current_sprite_key = 'prepare_dash'
+        elif action_name == 'DASH': current_sprite_key = 'dash'
+        sprite = self.facing_sprites()[current_sprite_key]
+        self.image = sprite[self.current_walk_frame] if current_sprite_key == 'walk' else sprite
         
     def perform_action(self, p_rect, pr, en, dt):
         action = self.actions[self.action_index]; name = action['name']
@@ -247,26 +326,22 @@ class TitanusRex(Boss):
                 dist = math.hypot(dx, dy)
                 if dist > 0: self.dash_direction = (dx / dist, dy / dist)
         elif name == 'DASH':
-            move_speed = self.speed * (dt / 16.67) * action['speed_multiplier']
-            self.rect.x += self.dash_direction[0] * move_speed; self.rect.y += self.dash_direction[1] * move_speed
+            move_speed = self.speed * self.move_scale * (dt / 16.67) * action['speed_multiplier']
+            x, y = self.float_center()
+            self.set_center(x + self.dash_direction[0] * move_speed, y + self.dash_direction[1] * move_speed)
             
     def draw(self, surface):
-        if self.flash_timer > 0:
-            flash_image = self.sprites['hurt'].copy()
-            if not self.facing_right: flash_image = pygame.transform.flip(flash_image, True, False)
-            surface.blit(flash_image, self.rect)
-        else:
-            surface.blit(self.image, self.rect)
+        surface.blit(self.facing_sprites()['hurt'] if self.flash_timer > 0 else self.image, self.rect)
 
 class Morgana(Boss):
-    def __init__(self, screen_dims):
-        pos = (screen_dims[0] - 60, screen_dims[1] / 2)
-        super().__init__(pos, 2, 300, 500, 100, screen_dims, "MORGANA")
+    def __init__(self, screen_dims, origin=(0, 0)):
+        pos = (origin[0] + screen_dims[0] - 60, origin[1] + screen_dims[1] / 2)
+        super().__init__(pos, 2, 300, 500, 100, screen_dims, "MORGANA", origin)
         self.is_visible = True; sprite_size = (90, 120)
-        self.sprites = {
-            'idle': load_sprite('Morgana-Flutuando.png', sprite_size), 'casting': load_sprite('Morgana-Casting.png', sprite_size),
-            'hurt': load_sprite('Morgana-Dano.png', sprite_size), 'move': load_sprite('Morgana-Kiting-Direita.png', sprite_size)
-        }
+        self.load_sprites({
+            'idle': 'Morgana-Flutuando.png', 'casting': 'Morgana-Casting.png',
+            'hurt': 'Morgana-Dano.png', 'move': 'Morgana-Kiting-Direita.png'
+        }, sprite_size)
         self.image = self.sprites['idle']; self.rect = self.image.get_rect(center=pos); self.facing_right = False
         self.preferred_distance = 350
         self.actions = [ {'name': 'KITE', 'duration': 4000}, {'name': 'POISON_FOG', 'duration': 2000}, {'name': 'KITE', 'duration': 4000},
@@ -281,7 +356,7 @@ class Morgana(Boss):
         if action_name == 'KITE':
             self.facing_right = self.rect.centerx < player_rect.centerx; current_sprite_key = 'move'
         elif action_name in ['POISON_FOG', 'PREPARE_ILLUSIONS']: current_sprite_key = 'casting'
-        self.image = pygame.transform.flip(self.sprites[current_sprite_key], not self.facing_right, False)
+        self.image = self.facing_sprites()[current_sprite_key]
     def draw(self, surface):
         if not self.is_visible: return
         if self.flash_timer > 0: surface.blit(self.sprites['hurt'], self.rect)
@@ -294,26 +369,27 @@ class Morgana(Boss):
                 dx, dy = p_rect.centerx - self.rect.centerx, p_rect.centery - self.rect.centery
                 strafe_dx, strafe_dy = -dy, dx; dist_strafe = math.hypot(strafe_dx, strafe_dy)
                 if dist_strafe > 0:
-                    move_speed = self.speed * (dt / 16.67)
-                    self.rect.x += (strafe_dx / dist_strafe) * move_speed; self.rect.y += (strafe_dy / dist_strafe) * move_speed
+                    move_speed = self.speed * self.move_scale * (dt / 16.67)
+                    x, y = self.float_center()
+                    self.set_center(x + (strafe_dx / dist_strafe) * move_speed, y + (strafe_dy / dist_strafe) * move_speed)
             else: self.move(p_rect, dt)
         elif name == 'POISON_FOG':
-            if self.action_timer > action['duration'] - dt*2: pr['environment'].add(PoisonFog(p_rect.center))
+            if self.action_timer > action['duration'] - dt*2: pr['environment'].add(PoisonFog.spawn(p_rect.center))
         elif name == 'REAPPEAR':
             if self.action_timer > action['duration'] - dt*2:
-                self.rect.center = (random.randint(100, 700), random.randint(150, 550))
-                for _ in range(2): en.add(Illusion(self.rect.center, self.screen_width, self.screen_height))
+                self.set_center(self.origin[0] + random.randint(100, 700), self.origin[1] + random.randint(150, 550))
+                for _ in range(2): en.add(Illusion.spawn(self.rect.center, self.screen_width, self.screen_height))
 
 class Draken(Boss):
-    def __init__(self, screen_dims):
-        w, h = screen_dims; pos = (w - 80, h / 2)
-        super().__init__(pos, 2.2, 450, 500, 150, screen_dims, "DRAKEN")
+    def __init__(self, screen_dims, origin=(0, 0)):
+        w, h = screen_dims; pos = (origin[0] + w - 80, origin[1] + h / 2)
+        super().__init__(pos, 2.2, 450, 500, 150, screen_dims, "DRAKEN", origin)
         sprite_size = (110, 110)
-        self.sprites = {
-            'idle': load_sprite('Draken-Idle.png', sprite_size), 'chase': load_sprite('Draken-Chase-Direita.png', sprite_size),
-            'cone': load_sprite('Draken-Rajada.png', sprite_size), 'meteor': load_sprite('Draken-Chuva.png', sprite_size),
-            'hurt': load_sprite('Draken-Dano.png', sprite_size),
-        }
+        self.load_sprites({
+            'idle': 'Draken-Idle.png', 'chase': 'Draken-Chase-Direita.png',
+            'cone': 'Draken-Rajada.png', 'meteor': 'Draken-Chuva.png',
+            'hurt': 'Draken-Dano.png',
+        }, sprite_size)
         self.image = self.sprites['idle']; self.rect = self.image.get_rect(center=pos); self.facing_right = False
         self.actions = [
             {'name': 'CHASE', 'duration': 3500, 'speed_multiplier': 1.2}, {'name': 'FIRE_CONE', 'duration': 1200},
@@ -330,7 +406,7 @@ class Draken(Boss):
             self.facing_right = self.rect.centerx < player_rect.centerx; current_sprite_key = 'chase'
         elif action_name == 'FIRE_CONE': current_sprite_key = 'cone'
         elif action_name == 'METEOR_RAIN': current_sprite_key = 'meteor'
-        self.image = pygame.transform.flip(self.sprites[current_sprite_key], not self.facing_right, False)
+        self.image = self.facing_sprites()[current_sprite_key]
     def draw(self, surface):
         if self.flash_timer > 0: surface.blit(self.sprites['hurt'], self.rect)
         else: surface.blit(self.image, self.rect)
@@ -339,11 +415,7 @@ class Draken(Boss):
         if name in ('CHASE', 'COOLDOWN'): self.move(p_rect, dt, action.get('speed_multiplier', 1.0))
         elif name == 'FIRE_CONE':
             if self.action_timer > action['duration'] - dt * 2:
-                base_angle = math.atan2(p_rect.centery - self.rect.centery, p_rect.centerx - self.rect.centerx)
-                for spread in (-0.4, -0.3, -0.2, -0.1, 0, 0.1, 0.2, 0.3, 0.4): 
-                    pr['enemy'].add(FireCone(self.rect.center, base_angle + spread))
+                bullet_engine.fire('draken_cone', self.rect.center, p_rect.center)
         elif name == 'METEOR_RAIN':
             if self.action_timer > action['duration'] - dt * 2:
-                for _ in range(40):
-                    target = (random.randint(80, self.screen_width-80), random.randint(120, self.screen_height-40))
-                    pr['enemy'].add(Meteor(target))
\ No newline at end of file
+                bullet_engine.fire('draken_meteor_rain', self.rect.center, bounds=(*self.origin, self.screen_width, self.screen_height))
\ No newline at end of file
@@ -0,0 +1,22 @@
+# gameclock.py
+
+class SimClock:
+    """
+    Relógio da simulação em ms. Só anda quando o loop chama advance(dt), então pausa,
+    menus e o modo headless não dependem do relógio de parede (pygame.time.get_ticks).
+    """
+    def __init__(self): self.now = 0
+    def ticks(self): return int(self.now)
+    def advance(self, dt): self.now += dt
+    def reset(self): self.now = 0
+
+sim_clock = SimClock()
+
+def get_ticks():
+    return sim_clock.ticks()
+
+def set_clock(clock):
+    """Troca o relógio usado pela lógica do jogo (ex.: testes); devolve o anterior."""
+    global sim_clock
+    previous, sim_clock = sim_clock, clock
+    return previous
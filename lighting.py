@@ -0,0 +1,64 @@
+# lighting.py
+import pygame
+import numpy as np
+from settings import *
+
+PLAYER_LIGHT_RADIUS = 150
+FIRE_ARROW_LIGHT_RADIUS = 40
+BURNING_LIGHT_RADIUS = 45
+LIGHT_FALLOFF = 0.35  # fração externa do raio em que a luz vai sumindo até a escuridão
+
+class LightMap:
+    """
+    Máscara de noite persistente, aplicada por multiplicação: cada pixel do mundo vezes
+    (255 - escuridão)/255 dá o mesmo resultado do blit de um preto com alpha = escuridão,
+    mas BLEND_RGB_MULT numa Surface sem alpha custa bem menos que o blend por alpha.
+    Cada luz é um carimbo radial em tons de cinza (branco no centro, preto na borda)
+    aplicado com BLEND_RGB_MAX; o carimbo é gerado uma vez por raio e serve para qualquer
+    escuridão. Com scale > 1 a máscara é montada em resolução menor e esticada numa
+    Surface reservada, então nenhuma Surface é alocada por frame.
+    """
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), scale=1):
+        self.size = size; self._stamps = {}
+        self.full = pygame.Surface(size)
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        self.scale = max(1, int(scale)); self._key = None
+        if self.scale == 1: self.mask = self.full
+        else: self.mask = pygame.Surface((self.size[0] // self.scale, self.size[1] // self.scale))
+
+    def light_stamp(self, radius):
+        stamp = self._stamps.get(radius)
+        if stamp is None:
+            side = max(2, radius * 2)
+            c = (side - 1) / 2
+            yy, xx = np.mgrid[0:side, 0:side]
+            d = np.hypot(xx - c, yy - c) / max(radius, 1)
+            t = np.clip((d - (1 - LIGHT_FALLOFF)) / LIGHT_FALLOFF, 0.0, 1.0)
+            level = (255 * (1 - t * t * (3 - 2 * t))).astype(np.uint8).T  # smoothstep
+            stamp = self._stamps[radius] = pygame.Surface((side, side))
+            pygame.surfarray.blit_array(stamp, np.repeat(level[:, :, None], 3, axis=2))
+        return stamp
+
+    def render(self, surface, darkness, lights, areas=None):
+        """
+        Escurece `surface` com `darkness` (0-255) clareado por `lights` = [((x, y), raio), ...].
+        Com `areas` (rects disjuntos, modo dirty rects) só multiplica dentro delas.
+        """
+        if darkness <= 0: return
+        s = self.scale
+        key = (darkness, tuple(lights))
+        if key != self._key:
+            self._key = key
+            mask = self.mask
+            level = 255 - darkness
+            mask.fill((level, level, level))
+            for (x, y), radius in lights:
+                r = int(radius) // s
+                if r > 0: mask.blit(self.light_stamp(r), (int(x) // s - r, int(y) // s - r), special_flags=pygame.BLEND_RGB_MAX)
+            if s != 1: pygame.transform.scale(mask, self.size, self.full)
+        if areas is None: surface.blit(self.full, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        else: surface.blits([(self.full, a, a, pygame.BLEND_RGB_MULT) for a in areas], doreturn=False)
+
+light_map = LightMap()
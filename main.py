@@ -1,14 +1,26 @@
 # main.py
 import pygame
 import random
+import math
 import os
+import argparse
 
 from settings import *
 import ui
 import combat
+import gameclock
 from player import Player, Arrow
-from enemy import Grunt, Tank, Bomber, Assassin, TitanusRex, Morgana, Draken
-from particles import Particle
+from enemy import TitanusRex, Morgana, Draken, steer_enemies, update_enemies, swarm
+from particles import particle_system
+from bullets import bullet_engine
+from effects import status_effects
+from navigation import obstacle_map, scenery_chunk
+from spawner import spawn_director
+from world import camera
+from profiler import frame_profiler
+from quality import quality_governor
+from lighting import PLAYER_LIGHT_RADIUS, FIRE_ARROW_LIGHT_RADIUS, BURNING_LIGHT_RADIUS
+from renderer import DirtyRectRenderer, RenderQueue, Z_PLAYER, Z_ENEMIES, Z_PROJECTILES
 
 # --- Variáveis Globais de Estado ---
 player, enemies, bosses, projectiles, score, kills = None, None, None, None, 0, 0
@@ -16,6 +28,11 @@ game_state, current_boss = 'MENU', None  # Agora inicia no MENU
 current_music = None
 spawned_bosses = set()
 upgrade_cards = pygame.sprite.Group()
+cycle_timer = 0
+sim_accumulator = 0.0  # ms de tempo real ainda não simulados (menos que um SIM_DT)
+render_queue = RenderQueue()
+
+BOSS_SPAWN_TRIGGERS = {2: TitanusRex, 4: Morgana, 7: Draken}
 
 def load_sounds():
     sounds = {}; sound_files = {'shoot': "shoot.wav", 'hit': "hit.wav", 'enemy_death': "enemy_death.wav", 'game_over': "game_over.wav"}
@@ -29,7 +46,7 @@ def load_sounds():
 
 def play_music(track):
     global current_music
-    if track == current_music: return
+    if track == current_music or not pygame.mixer.get_init(): return
     
     music_map = {'background': 'background_music.mp3', 'boss': 'RAFAEL.mp3'}
     file = music_map.get(track)
@@ -47,57 +64,179 @@ def play_music(track):
 
 def reset_game():
     global player, enemies, bosses, projectiles, score, kills, game_state, current_boss, spawned_bosses
-    player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2); camera.reset(player.rect.center)
     enemies, bosses = pygame.sprite.Group(), pygame.sprite.Group()
     projectiles = {
         'player': pygame.sprite.Group(), 'player_explosions': pygame.sprite.Group(), 
-        'enemy': pygame.sprite.Group(), 'environment': pygame.sprite.Group(),
-        'vfx': pygame.sprite.Group(), 'enemy_explosions': pygame.sprite.Group()
+        'environment': pygame.sprite.Group(), 'vfx': pygame.sprite.Group(),
+        'enemy_explosions': pygame.sprite.Group()  # balas dos chefes ficam no bullet_engine
     }
     score, kills = 0, 0
     # NÃO alteramos o game_state aqui para permitir controlar fora (MENU, etc.)
     current_boss = None
     spawned_bosses = set(); play_music('background'); upgrade_cards.empty()
-
-def get_available_enemies(player_level):
-    enemy_pool = [Grunt, Tank]
-    if player_level >= 3: enemy_pool.append(Bomber)
-    if player_level >= 4: enemy_pool.append(Assassin)
-    return enemy_pool
+    particle_system.clear(); bullet_engine.clear(); swarm.clear(); status_effects.clear()
+    obstacle_map.load(scenery_chunk if OBSTACLES else []); obstacle_map.follow(camera.active); spawn_director.reset()
+    render_queue.snapshot(); render_queue.alpha = 1.0
 
 def handle_state_transitions(boss_spawn_triggers):
-    global game_state, current_boss, spawned_bosses, kills, score, player, spawn_event
+    global game_state, current_boss, spawned_bosses, kills, score, player
     if game_state == 'PLAYING':
         for k, boss_class in boss_spawn_triggers.items():
             if kills >= k and boss_class not in spawned_bosses:
-                game_state = 'BOSS_FIGHT'; enemies.empty()
-                current_boss = boss_class((SCREEN_WIDTH, SCREEN_HEIGHT))
+                game_state = 'BOSS_FIGHT'; enemies.empty(); spawn_director.interrupt()
+                camera.lock(); arena = camera.rect  # a luta fica na tela atual
+                current_boss = boss_class((SCREEN_WIDTH, SCREEN_HEIGHT), arena.topleft)
                 bosses.add(current_boss); spawned_bosses.add(boss_class)
-                pygame.time.set_timer(spawn_event, 0)
-                player.rect.center = (100, SCREEN_HEIGHT / 2); play_music('boss')
+                player.rect.center = (arena.x + 100, arena.y + SCREEN_HEIGHT / 2); play_music('boss')
                 return
     elif game_state == 'BOSS_FIGHT' and current_boss and not current_boss.alive():
-        game_state = 'PLAYING'; current_boss = None
-        pygame.time.set_timer(spawn_event, 2000); score += 500; play_music('background')
+        game_state = 'PLAYING'; current_boss = None; camera.unlock()
+        score += 500; play_music('background')
+
+def update_world(dt, sounds, keys=None):
+    """
+    Um passo da simulação (PLAYING/BOSS_FIGHT). Não lê relógio de parede nem display:
+    o tempo vem só de `dt` (que também avança o gameclock), então o mesmo dt + seed
+    reproduz a mesma partida com ou sem janela.
+    """
+    global score, kills, game_state, cycle_timer
+    gameclock.sim_clock.advance(dt)
+    cycle_timer += dt
+    handle_state_transitions(BOSS_SPAWN_TRIGGERS)
+    if game_state == 'PLAYING': spawn_director.update(dt, enemies, player.level, ui.is_night(cycle_timer))
+
+    player.update(projectiles, dt, keys)
+    camera.follow(player.rect.center); obstacle_map.follow(camera.active)
+    frame_profiler.mark('player')
+    steer_enemies(player.rect, dt, camera.rect)
+    update_enemies(enemies, player.rect, projectiles, dt)
+    bosses.update(player.rect, projectiles, enemies, dt)
+    burned = status_effects.update(dt)
+    frame_profiler.mark('enemies')
+    for group in projectiles.values(): group.update(dt)
+    bullet_engine.update(dt)
+    particle_system.update(dt)
+    frame_profiler.mark('projectiles')
+
+    score_change, kills_change = combat.handle_collisions(player, enemies, bosses, projectiles, sounds, burned)
+    score += score_change; kills += kills_change
+    frame_profiler.mark('collisions')
+
+    if player.leveled_up_flag:
+        game_state = 'LEVEL_UP'
+        player.leveled_up_flag = False
+        upgrade_cards.empty()
+        card_positions = [(SCREEN_WIDTH/2 - 200, SCREEN_HEIGHT/2), (SCREEN_WIDTH/2, SCREEN_HEIGHT/2), (SCREEN_WIDTH/2 + 200, SCREEN_HEIGHT/2)]
+        for i, upgrade_data in enumerate(player.available_upgrades):
+            title, desc, up_id = upgrade_data
+            card = ui.UpgradeCard(card_positions[i][0], card_positions[i][1], up_id, title, desc)
+            upgrade_cards.add(card)
+
+    if player.hp <= 0: game_state = 'GAME_OVER'; sounds['game_over'].play()
+
+def snapshot_world():
+    """Posições antes do passo para o desenho interpolar entre os dois últimos estados."""
+    render_queue.snapshot([player], enemies, bosses, *projectiles.values())
+    bullet_engine.snapshot()
+
+def step_simulation(frame_dt, sounds, keys=None):
+    """
+    Acumula o tempo do frame e roda quantos passos fixos de SIM_DT couberem, então a
+    simulação é a mesma a 60 Hz, 144 Hz ou com engasgos (até MAX_FRAME_MS por frame).
+    Devolve o alpha de interpolação: a fração de passo que sobrou no acumulador.
+    """
+    global sim_accumulator
+    sim_accumulator += min(frame_dt, MAX_FRAME_MS)
+    steps = int(sim_accumulator // SIM_DT)
+    for i in range(steps):
+        if i == steps - 1: snapshot_world()
+        update_world(SIM_DT, sounds, keys)
+        sim_accumulator -= SIM_DT
+        if game_state not in ('PLAYING', 'BOSS_FIGHT'): sim_accumulator = 0.0; break
+    return sim_accumulator / SIM_DT if game_state in ('PLAYING', 'BOSS_FIGHT') else 1.0
+
+def scene_lights():
+    """Luzes da noite além do jogador: sprites com light_radius, balas dos chefes, flechas de fogo e inimigos queimando."""
+    lights = []; fire_arrows = player.has_fire_arrows
+    for group in projectiles.values():
+        for sprite in group:
+            radius = getattr(sprite, 'light_radius', 0)
+            if not radius and fire_arrows and isinstance(sprite, Arrow): radius = FIRE_ARROW_LIGHT_RADIUS
+            if radius: lights.append((sprite.rect.center, radius))
+    lights.extend(bullet_engine.lights())
+    for enemy in status_effects.targets('fire'): lights.append((enemy.rect.center, BURNING_LIGHT_RADIUS))
+    return lights
+
+def place_camera(alpha=1.0):
+    """Posiciona a câmera do frame no centro interpolado do jogador; True se a tela rolou desde o último."""
+    render_queue.alpha = alpha; render_queue.origin = (0, 0)
+    moved = camera.place(render_queue.place(player).center)
+    render_queue.origin = camera.origin
+    return moved
+
+def draw_world(surface, grass_tile, areas=None, alpha=1.0):
+    """Desenha a parte do mundo vista pela câmera ou, no modo dirty rects, só restaura o fundo dentro de `areas`."""
+    place_camera(alpha); origin = camera.origin
+    ui.draw_background(surface, grass_tile, camera.view, areas)  # opaco e do tamanho da tela: dispensa o fill
+    render_queue.push(Z_PLAYER, player)
+    render_queue.push_group(Z_ENEMIES, enemies); render_queue.push_group(Z_ENEMIES, bosses)
+    for name, group in projectiles.items():
+        render_queue.push_group(Z_PROJECTILES, group)
+        if name == 'player_explosions': render_queue.push_blits(Z_PROJECTILES, bullet_engine.blits(alpha, origin))  # balas dos chefes: mesma camada
+    render_queue.flush(surface)
+    particle_system.draw(surface, origin)
+    frame_profiler.mark('render')
+
+    ui.draw_day_night_cycle(surface, cycle_timer, player, scene_lights() if ui.get_darkness(cycle_timer) else (), areas, origin)
+    frame_profiler.mark('daynight')
+
+def mark_dirty(renderer, darkness, show_profiler, alpha=1.0):
+    """Marca no renderer tudo que um frame de jogo desenha: sprites, luzes, partículas e HUD."""
+    if place_camera(alpha): renderer.invalidate()  # a câmera andou: a tela inteira rolou
+    place = render_queue.place; ox, oy = camera.origin
+    rects = [place(player)]
+    if player.shield.active and player.shield.sprite: rects.append(player.shield.sprite.image.get_rect(center=rects[0].center))
+    for group in [enemies, bosses, *projectiles.values()]: rects.extend(map(place, group))
+    if darkness:
+        for (x, y), r in [(player.rect.center, PLAYER_LIGHT_RADIUS), *scene_lights()]: rects.append(pygame.Rect(x - ox - r, y - oy - r, 2 * r, 2 * r))
+    rects.extend(ui.hud_dirty_rects(player))
+    if current_boss: rects.append(ui.BOSS_UI_RECT)
+    if show_profiler and ui.profiler_overlay_rect(): rects.append(ui.profiler_overlay_rect())
+    renderer.mark_rects(rects)
+    renderer.mark_boxes(*particle_system.boxes(camera.origin))
+    renderer.mark_boxes(*bullet_engine.boxes(alpha, camera.origin))
+
+def live_counts():
+    """Contadores mostrados no profiler (F3)."""
+    if not player: return {'partículas': particle_system.count}
+    counts = {'inimigos': len(enemies), 'chefes': len(bosses)}
+    for name, group in projectiles.items(): counts[name] = len(group)
+    counts['balas'] = bullet_engine.count
+    counts['partículas'] = particle_system.count
+    counts['onda'] = spawn_director.wave; counts['fila'] = len(spawn_director.queue)
+    counts['qualidade'] = quality_governor.label()
+    return counts
 
 # --- Loop Principal do Jogo ---
-def main():
-    global score, kills, game_state, current_boss, spawn_event, projectiles, player, enemies, bosses, spawned_bosses
+def main(dirty_rects=DIRTY_RECTS):
+    global score, kills, game_state, current_boss, projectiles, player, enemies, bosses, spawned_bosses
     pygame.init(); pygame.mixer.init()
     
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     world_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Action RPG - Menu + Opções")
-    clock, font = pygame.time.Clock(), pygame.font.Font(None, 36)
+    clock, font = pygame.time.Clock(), ui.get_font(None, 36)
     
     sounds = load_sounds()
+    ui.preload_sprites(); spawn_director.prewarm()
     grass_tile = ui.load_sprite('grama.png', (64,64))
-    boss_spawn_triggers = {2: TitanusRex, 4: Morgana, 7: Draken}
     
-    spawn_event, SHAKE_EVENT = pygame.USEREVENT + 1, pygame.USEREVENT + 2
-    pygame.time.set_timer(spawn_event, 2000)
+    SHAKE_EVENT = pygame.USEREVENT + 2
     shake_timer, shake_magnitude = 0, 0
-    running = True; cycle_timer = 0
+    running = True; show_profiler = False
+    renderer = DirtyRectRenderer() if dirty_rects else None
+    last_darkness, was_shaking = 0, False
 
     # Estados de seleção para menus
     menu_selected = 0
@@ -108,7 +247,12 @@ def main():
 
     while running:
         dt = clock.tick(FPS)
+        frame_profiler.begin_frame()
         events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_profiler = not show_profiler
+                if renderer: renderer.invalidate()
 
         # ---- INPUT POR ESTADO ----
         if game_state == 'MENU':
@@ -150,7 +294,7 @@ def main():
             # PLAYING, BOSS_FIGHT, LEVEL_UP, PAUSED
             for event in events:
                 if event.type == pygame.QUIT: running = False
-                if event.type == SHAKE_EVENT: shake_timer, shake_magnitude = event.duration, event.magnitude
+                if event.type == SHAKE_EVENT and quality_governor.settings['shake']: shake_timer, shake_magnitude = event.duration, event.magnitude
 
                 if event.type == pygame.KEYDOWN:
                     # Toggle Pause apenas quando em gameplay ou pausa
@@ -174,61 +318,51 @@ def main():
                 
                 if game_state in ['PLAYING', 'BOSS_FIGHT'] and player.hp > 0:
                     if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        projectiles['player'].add(Arrow(player.rect.center, pygame.mouse.get_pos())); sounds['shoot'].play()
+                        projectiles['player'].add(Arrow.spawn(player.rect.center, camera.to_world(pygame.mouse.get_pos()))); sounds['shoot'].play()
                     if event.type == pygame.KEYDOWN:
+                        player.aim_pos = camera.to_world(pygame.mouse.get_pos())  # F/R miram no mouse de agora, como antes
                         if event.key == pygame.K_q: player.valkyrie.activate(player, projectiles, sounds)
                         if event.key == pygame.K_e: player.shield.activate(player, projectiles, sounds)
                         if event.key == pygame.K_f: player.thunder_leap.activate(player, projectiles, sounds)
                         if event.key == pygame.K_r: player.phoenix_call.activate(player, projectiles, sounds)
 
-                if event.type == spawn_event and game_state == 'PLAYING':
-                    enemy_class = random.choice(get_available_enemies(player.level))
-                    enemies.add(enemy_class((SCREEN_WIDTH, SCREEN_HEIGHT), ui.is_night(cycle_timer)))
+
+        frame_profiler.mark('input')
 
         # ---- UPDATE POR ESTADO ----
+        alpha = 1.0
         if game_state in ['PLAYING', 'BOSS_FIGHT']:
-            cycle_timer += dt
-            handle_state_transitions(boss_spawn_triggers)
-            
-            player.update(projectiles, dt)
-            enemies.update(player.rect, projectiles, enemies, dt)
-            bosses.update(player.rect, projectiles, enemies, dt)
-            for group in projectiles.values(): group.update(dt)
-            
-            score_change, kills_change = combat.handle_collisions(player, enemies, bosses, projectiles, sounds)
-            score += score_change; kills += kills_change
-            
-            if player.leveled_up_flag:
-                game_state = 'LEVEL_UP'
-                player.leveled_up_flag = False
-                upgrade_cards.empty()
-                card_positions = [(SCREEN_WIDTH/2 - 200, SCREEN_HEIGHT/2), (SCREEN_WIDTH/2, SCREEN_HEIGHT/2), (SCREEN_WIDTH/2 + 200, SCREEN_HEIGHT/2)]
-                for i, upgrade_data in enumerate(player.available_upgrades):
-                    title, desc, up_id = upgrade_data
-                    card = ui.UpgradeCard(card_positions[i][0], card_positions[i][1], up_id, title, desc)
-                    upgrade_cards.add(card)
-
-            if player.hp <= 0: game_state = 'GAME_OVER'; sounds['game_over'].play()
+            player.aim_pos = camera.to_world(pygame.mouse.get_pos())
+            alpha = step_simulation(dt, sounds)
 
         # ---- DRAW ----
-        screen.fill(BLACK)
+        areas = None  # None = tela inteira; no modo dirty rects, a lista de áreas que mudaram
+        if renderer:
+            if game_state in ['PLAYING', 'BOSS_FIGHT']:
+                renderer.static_key = None
+                darkness = ui.get_darkness(cycle_timer)
+                # tremida e mudança de escuridão mexem na tela toda
+                if shake_timer > 0 or was_shaking or darkness != last_darkness: renderer.invalidate()
+                was_shaking, last_darkness = shake_timer > 0, darkness
+                mark_dirty(renderer, darkness, show_profiler, alpha)
+                areas = renderer.end()
+            else:
+                static_key = (game_state, menu_selected, gameover_selected, pygame.mouse.get_pos() if game_state == 'LEVEL_UP' else None)
+                if renderer.unchanged(static_key) and not events and not show_profiler:
+                    frame_profiler.end_frame(); continue
+                renderer.invalidate()  # ao voltar para o jogo a tela é redesenhada inteira
+
+        if areas is None: screen.fill(BLACK)
         if game_state in ['PLAYING', 'BOSS_FIGHT', 'LEVEL_UP', 'PAUSED', 'GAME_OVER']:
             # Render do mundo
             if not player:
                 # Se o usuário entrar em PLAYING pela primeira vez
                 reset_game()
-            world_surface.fill(BLACK)
-            ui.draw_background(world_surface, grass_tile)
-            player.draw(world_surface)
-
-            for group in [enemies, bosses, *projectiles.values()]:
-                for sprite in group:
-                    if hasattr(sprite, 'draw'): sprite.draw(world_surface)
-
-            ui.draw_day_night_cycle(world_surface, cycle_timer, player)
+            draw_world(world_surface, grass_tile, areas, alpha)
             render_offset = [0, 0]
             if shake_timer > 0: shake_timer -= dt; render_offset = [random.randint(-shake_magnitude, shake_magnitude) for _ in range(2)]
-            screen.blit(world_surface, render_offset)
+            if areas is None: screen.blit(world_surface, render_offset)
+            else: screen.blits([(world_surface, a, a) for a in areas], doreturn=False)
             
             ui.draw_hud(screen, player, score, kills, font, clock.get_fps())
             if game_state == 'BOSS_FIGHT':
@@ -237,6 +371,7 @@ def main():
             if game_state == 'GAME_OVER': ui.draw_game_over(screen, font, gameover_selected)
             elif game_state == 'PAUSED': ui.draw_pause(screen, font)
             elif game_state == 'LEVEL_UP': ui.draw_level_up_screen(screen, font, upgrade_cards)
+            frame_profiler.mark('hud')
 
         elif game_state == 'MENU':
             ui.draw_main_menu(screen, font, menu_selected)
@@ -244,9 +379,100 @@ def main():
         elif game_state == 'OPTIONS':
             ui.draw_options(screen, font)
 
-        pygame.display.flip()
-        
+        if show_profiler:
+            ui.draw_profiler_overlay(screen, frame_profiler, live_counts()); frame_profiler.mark('overlay')
+
+        if areas is None: pygame.display.flip()
+        else: pygame.display.update(areas)
+        frame_profiler.mark('flip'); frame_profiler.end_frame()
+        if game_state in ['PLAYING', 'BOSS_FIGHT'] and quality_governor.record(frame_profiler.frame_times[-1]):
+            if renderer: renderer.invalidate()  # a máscara da noite mudou de resolução
+
     pygame.quit()
 
+# --- Modo headless (CI / simulação mais rápida que tempo real) ---
+def seed_everything(seed):
+    random.seed(seed); particle_system.seed(seed)
+
+class HeadlessPilot:
+    """Piloto automático: circula pelo centro da arena (mundo ou tela travada), mira no inimigo mais próximo e usa tudo fora de cooldown."""
+    def __init__(self, seed, fire_interval=250, use_abilities=True):
+        self.rng = random.Random(seed); self.fire_interval = fire_interval; self.use_abilities = use_abilities
+        self.fire_timer = 0; self.orbit = 0.0
+
+    def control(self, dt, sounds):
+        self.orbit += dt * 0.0008
+        (ax, ay), view = camera.bounds.center, camera.rect
+        cx, cy = ax + math.cos(self.orbit) * 200, ay + math.sin(self.orbit) * 150
+        px, py = player.rect.center
+        keys = {pygame.K_w: py - cy > 8, pygame.K_s: cy - py > 8, pygame.K_a: px - cx > 8, pygame.K_d: cx - px > 8}
+
+        target = combat.collision_grid.nearest(player.rect.center, 'enemies')
+        aim = target[0].rect.center if target else (view.x + self.rng.randrange(SCREEN_WIDTH), view.y + self.rng.randrange(SCREEN_HEIGHT))
+        player.aim_pos = aim
+        self.fire_timer += dt
+        if self.fire_timer >= self.fire_interval:
+            self.fire_timer -= self.fire_interval
+            projectiles['player'].add(Arrow.spawn(player.rect.center, aim)); sounds['shoot'].play()
+        if target and self.use_abilities:
+            player.valkyrie.activate(player, projectiles, sounds); player.shield.activate(player, projectiles, sounds)
+            player.phoenix_call.activate(player, projectiles, sounds)
+            player.aim_pos = (view.x + self.rng.randrange(60, SCREEN_WIDTH - 60), view.y + self.rng.randrange(60, SCREEN_HEIGHT - 60))
+            player.thunder_leap.activate(player, projectiles, sounds)
+        return keys
+
+    def choose_upgrade(self):
+        card = self.rng.choice(sorted(upgrade_cards, key=lambda c: c.upgrade_id))
+        player.apply_upgrade(card.upgrade_id); upgrade_cards.empty()
+
+def init_headless(size=(1, 1)):
+    """Display falso e sem mixer; devolve os sons (todos DummySound)."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy'); os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.display.init(); pygame.font.init()
+    pygame.display.set_mode(size)  # convert_alpha() precisa de um modo de vídeo, mesmo falso
+    ui.preload_sprites(); spawn_director.prewarm()
+    return load_sounds()
+
+def run_headless(duration_ms, seed=0, dt=SIM_DT):
+    """
+    Roda o pipeline de update sem janela, sem áudio e sem pacing real: dt fixo, RNGs
+    semeados e gameclock. Quando o jogador morre a partida recomeça, até completar
+    `duration_ms` de tempo simulado. Mesma seed + dt => mesmo resumo.
+    """
+    global game_state, cycle_timer
+    sounds = init_headless()
+    seed_everything(seed); gameclock.sim_clock.reset()
+    pilot = HeadlessPilot(seed)
+    reset_game(); game_state = 'PLAYING'; cycle_timer = 0
+    elapsed, steps, deaths, total_kills, best_level = 0, 0, 0, 0, 1
+    while elapsed < duration_ms:
+        pygame.event.clear()  # descarta os SHAKE_EVENT postados por take_damage
+        if game_state == 'GAME_OVER':
+            deaths += 1; total_kills += kills
+            reset_game(); game_state = 'PLAYING'
+        if game_state == 'LEVEL_UP':
+            pilot.choose_upgrade(); game_state = 'PLAYING' if not current_boss else 'BOSS_FIGHT'
+        keys = pilot.control(dt, sounds)
+        update_world(dt, sounds, keys)
+        best_level = max(best_level, player.level)
+        elapsed += dt; steps += 1
+
+    return {
+        'seed': seed, 'sim_seconds': round(elapsed / 1000, 3), 'steps': steps, 'deaths': deaths,
+        'kills': total_kills + kills, 'score': score, 'best_level': best_level, 'state': game_state,
+        'bosses_defeated': sorted(b.__name__ for b in spawned_bosses if b is not type(current_boss)),
+        'player_hp': player.hp, 'enemies': len(enemies),
+    }
+
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Action RPG")
+    parser.add_argument('--headless', action='store_true', help="simula sem janela/áudio, mais rápido que tempo real")
+    parser.add_argument('--seconds', type=float, default=600, help="tempo de jogo simulado no modo headless")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dirty-rects', action='store_true', default=DIRTY_RECTS, help="só redesenha as áreas que mudaram (máquinas fracas)")
+    args = parser.parse_args()
+    if args.headless:
+        print(run_headless(args.seconds * 1000, args.seed))
+        pygame.quit()
+    else:
+        main(args.dirty_rects)
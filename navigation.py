@@ -0,0 +1,163 @@
+# navigation.py
+import pygame
+import numpy as np
+from collections import OrderedDict
+from settings import *
+from ui import chunk_decorations, TERRAIN_CHUNK
+from spatial import StaticRectIndex
+
+NAV_CELL = 32
+NAV_CLEARANCE = 12  # folga (px) em volta de cada obstáculo na grade: sprites grandes não raspam na pedra
+NAV_MARGIN = 256    # px além da área ativa da câmera cobertos pela janela de navegação
+NAV_CACHE_CHUNKS = 24  # teto de chunks com os rects de obstáculo guardados (nunca menos que uma janela)
+UNREACHED = np.iinfo(np.int32).max
+
+# vizinhos testados para a direção: ortogonais primeiro (ganham nos empates), depois diagonais
+NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+def scenery_chunk(col, row, world=ARENA_RECT):
+    """Rects das pedras de SCENERY_LAYERS no chunk (col, row), nas mesmas posições em que o chão as desenha."""
+    return [pygame.Rect(pos, image.get_size()) for image, pos in chunk_decorations(col, row, world)]
+
+class ObstacleMap:
+    """
+    Obstáculos fixos do mapa, só numa janela em volta da câmera: follow() move a janela
+    (área ativa + NAV_MARGIN, alinhada à grade) quando a área sai dela e refaz os rects
+    (colisão do jogador), o `index` (spatial.StaticRectIndex: segment-cast, swept-rect e
+    linha de visão) e a grade da navegação, `blocked[linha, coluna]` = célula de NAV_CELL
+    px da janela tocada por algum obstáculo (com NAV_CLEARANCE de folga). Fora da janela
+    não há obstáculo: a memória e a BFS não crescem com o tamanho do mundo.
+    `source` é uma lista fixa de rects ou uma função (col, row) -> rects do chunk de
+    TERRAIN_CHUNK px (cada rect inteiro dentro do seu chunk), lida sob demanda e guardada
+    num cache LRU como os chunks do chão. `version` muda a cada janela nova ou load.
+    """
+    def __init__(self, world=ARENA_RECT, cell=NAV_CELL, chunk=TERRAIN_CHUNK, capacity=NAV_CACHE_CHUNKS):
+        self.world = pygame.Rect(world); self.cell = cell; self.chunk = chunk; self.version = 0
+        self.chunks = OrderedDict()  # (coluna, linha) -> rects, do menos para o mais recente
+        span = lambda n: -(-(n + 2 * (ACTIVE_MARGIN + NAV_MARGIN + NAV_CLEARANCE) + cell) // chunk) + 1  # chunks que uma janela pode tocar
+        self.capacity = max(capacity, span(SCREEN_WIDTH) * span(SCREEN_HEIGHT))
+        self.load([])
+
+    def load(self, source):
+        """Troca a fonte de obstáculos; a janela fica vazia até o próximo follow()."""
+        self.source = source; self.chunks.clear()
+        self.window = pygame.Rect(self.world.topleft, (0, 0)); self._build()
+
+    def follow(self, area):
+        """Garante a janela cobrindo `area` (rect do mundo); devolve True se ela mudou."""
+        area = area.clip(self.world)
+        if self.window.contains(area): return False
+        c = self.cell; view = area.inflate(NAV_MARGIN * 2, NAV_MARGIN * 2).clip(self.world)
+        left, top = view.left // c * c, view.top // c * c
+        self.window = pygame.Rect(left, top, -(-view.right // c) * c - left, -(-view.bottom // c) * c - top)
+        self._build()
+        return True
+
+    def _chunk_rects(self, key):
+        rects = self.chunks.get(key)
+        if rects is None:
+            rects = self.chunks[key] = self.source(*key)
+            if len(self.chunks) > self.capacity: self.chunks.popitem(last=False)
+        else: self.chunks.move_to_end(key)
+        return rects
+
+    def _build(self):
+        c = self.cell; self.version += 1; self.origin = self.window.topleft
+        self.cols, self.rows = self.window.width // c, self.window.height // c
+        reach = self.window.inflate(NAV_CLEARANCE * 2, NAV_CLEARANCE * 2)  # pedra logo fora ainda fecha a borda da grade
+        if not self.window: rects = []
+        elif callable(self.source):
+            k = self.chunk
+            rects = [r for row in range(reach.top // k, (reach.bottom - 1) // k + 1) for col in range(reach.left // k, (reach.right - 1) // k + 1)
+                     for r in self._chunk_rects((col, row)) if r.colliderect(reach)]
+        else: rects = [pygame.Rect(r) for r in self.source if reach.colliderect(r)]
+        self.rects = rects
+        self.index = StaticRectIndex(rects, vis_cell=c)
+        self.blocked = np.zeros((self.rows, self.cols), bool); ox, oy = self.origin
+        for r in rects:
+            r = r.inflate(NAV_CLEARANCE * 2, NAV_CLEARANCE * 2).move(-ox, -oy)
+            self.blocked[max(0, r.top // c):max(0, (r.bottom - 1) // c + 1), max(0, r.left // c):max(0, (r.right - 1) // c + 1)] = True
+
+    def cell_of(self, x, y):
+        """(linha, coluna) da grade da janela mais perto do ponto de mundo (x, y)."""
+        ox, oy = self.origin
+        return min(max(int((y - oy) // self.cell), 0), self.rows - 1), min(max(int((x - ox) // self.cell), 0), self.cols - 1)
+
+    def slide(self, rect, old, new):
+        """Centro float old -> new de `rect`, eixo por eixo, parando no eixo que entraria num obstáculo."""
+        (ox, oy), (nx, ny) = old, new
+        probe = rect.copy(); probe.center = (round(ox), round(oy))
+        if probe.collidelist(self.rects) != -1: return new  # já estava dentro (teleporte): deixa sair
+        probe.center = (round(nx), round(oy))
+        if probe.collidelist(self.rects) != -1: nx = ox
+        probe.center = (round(nx), round(ny))
+        if probe.collidelist(self.rects) != -1: ny = oy
+        return nx, ny
+
+class FlowField:
+    """
+    Campo de direções até o jogador sobre a grade do ObstacleMap (a janela em volta da
+    câmera), dividido por todos os inimigos; fora da janela eles seguem reto.
+    update() só recalcula quando o alvo muda de célula (ou a janela muda): uma BFS
+    em NumPy, a frente de onda inteira dilatada nas 4 direções por iteração, dá `dist` em
+    células; cada célula aponta para o vizinho (8) mais perto do alvo, sem cortar quina de
+    obstáculo. Ler a direção de um inimigo é um índice na grade, O(1).
+    """
+    def __init__(self, obstacles):
+        self.obstacles = obstacles; self.key = None
+        self.dist = None; self.dir = None
+
+    @property
+    def active(self): return bool(self.obstacles.rects)
+
+    def update(self, target):
+        if not self.active: return False
+        key = (self.obstacles.cell_of(*target), self.obstacles.version)
+        if key == self.key: return False
+        self.key = key; self._compute(key[0])
+        return True
+
+    def _compute(self, source):
+        blocked = self.obstacles.blocked; rows, cols = blocked.shape
+        free = ~blocked; free[source] = True  # o jogador encostado numa pedra ainda é alcançável
+        dist = np.full((rows, cols), UNREACHED, np.int32); dist[source] = 0
+        frontier = np.zeros((rows, cols), bool); frontier[source] = True; d = 0
+        while frontier.any():
+            d += 1; grown = np.zeros_like(frontier)
+            grown[1:] |= frontier[:-1]; grown[:-1] |= frontier[1:]
+            grown[:, 1:] |= frontier[:, :-1]; grown[:, :-1] |= frontier[:, 1:]
+            frontier = grown & free & (dist == UNREACHED); dist[frontier] = d
+        pad_dist = np.pad(dist, 1, constant_values=UNREACHED); pad_free = np.pad(free, 1, constant_values=False)
+        best = dist.copy(); step = np.zeros((rows, cols, 2), np.float64)
+        for dy, dx in NEIGHBORS:
+            better = pad_dist[1 + dy:1 + dy + rows, 1 + dx:1 + dx + cols] < best
+            if dx and dy: better &= pad_free[1 + dy:1 + dy + rows, 1:1 + cols] & pad_free[1:1 + rows, 1 + dx:1 + dx + cols]
+            best = np.where(better, pad_dist[1 + dy:1 + dy + rows, 1 + dx:1 + dx + cols], best)
+            step[better] = (dx, dy)
+        norm = np.hypot(step[..., 0], step[..., 1])
+        self.dist = dist; self.dir = step / np.where(norm > 0, norm, 1)[..., None]
+
+    def steer(self, pos, fallback):
+        """
+        Direções unitárias para os centros `pos` (n, 2): a da célula de cada um ou `fallback`
+        (reta até o alvo) fora da grade, na célula do alvo ou vizinha, ou sem caminho.
+        """
+        if not self.active or self.dir is None or not len(pos): return fallback
+        c = self.obstacles.cell; ox, oy = self.obstacles.origin
+        col = ((pos[:, 0] - ox) // c).astype(np.int64); row = ((pos[:, 1] - oy) // c).astype(np.int64)
+        inside = (col >= 0) & (col < self.obstacles.cols) & (row >= 0) & (row < self.obstacles.rows)
+        row, col = np.where(inside, row, 0), np.where(inside, col, 0)
+        dist = self.dist[row, col]; use = inside & (dist > 1) & (dist != UNREACHED)
+        return np.where(use[:, None], self.dir[row, col], fallback)
+
+    def direction(self, x, y):
+        """Versão de um ponto só de steer(); None = siga reto até o alvo."""
+        if not self.active or self.dir is None: return None
+        c = self.obstacles.cell; ox, oy = self.obstacles.origin; row, col = int((y - oy) // c), int((x - ox) // c)
+        if not (0 <= row < self.obstacles.rows and 0 <= col < self.obstacles.cols): return None
+        dist = self.dist[row, col]
+        if dist <= 1 or dist == UNREACHED: return None
+        dx, dy = self.dir[row, col].tolist(); return dx, dy
+
+obstacle_map = ObstacleMap()
+flow_field = FlowField(obstacle_map)
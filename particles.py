@@ -1,49 +1,119 @@
 # particles.py
 import pygame
 import math
-import random
+import functools
+import numpy as np
 from settings import *
+from pool import PooledSprite
+
+# Presets de emissão: quantidade, cor, tamanho (faixa de w, faixa de h), vida em ms e
+# velocidade (faixa de vx, faixa de vy) em px por frame de 60 FPS
+EMITTERS = {
+    'blood':     {'count': (8, 15), 'color': RED,            'size': ((2, 4), (2, 4)), 'life': (200, 400), 'vel': ((-3, 3), (-3, 3))},
+    'fragments': {'count': (8, 15), 'color': GREY,           'size': ((2, 4), (2, 4)), 'life': (200, 400), 'vel': ((-3, 3), (-3, 3))},
+    'dust':      {'count': (1, 1),  'color': (139, 115, 85), 'size': ((3, 6), (3, 6)), 'life': (400, 400), 'vel': ((-0.5, 0.5), (-0.5, -1))},
+    'sparks':    {'count': (8, 15), 'color': ORANGE,         'size': ((3, 3), (3, 3)), 'life': (200, 200), 'vel': ((-2, 2), (-2, 2))},
+}
+
+class ParticleSystem:
+    """
+    Todas as partículas vivas em arrays NumPy de capacidade fixa (structure of arrays).
+    As vivas ficam compactadas em [0, count); update integra todas de uma vez e draw
+    manda um único Surface.blits com carimbos pré-rasterizados por (cor, tamanho).
+    """
+    def __init__(self, capacity=4096, seed=None):
+        self.capacity = capacity; self.count = 0
+        self.pos = np.zeros((capacity, 2), np.float32)    # canto superior esquerdo
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.float32)        # ms restantes
+        self.size = np.zeros((capacity, 2), np.int16)
+        self.stamp = np.zeros(capacity, np.int32)         # índice em self.stamps (o carimbo já tem a cor)
+        self.stamps = []; self._stamp_ids = {}
+        self.rng = np.random.default_rng(seed)
+        self.density = 1.0  # fração de cada emissão que nasce de fato (quality.py reduz sob carga)
+
+    def _stamp_id(self, color, w, h):
+        key = (color, w, h)
+        sid = self._stamp_ids.get(key)
+        if sid is None:
+            surf = pygame.Surface((w, h)); surf.fill(color)
+            sid = self._stamp_ids[key] = len(self.stamps); self.stamps.append(surf)
+        return sid
+
+    def _uniform(self, bounds, k):
+        lo, hi = bounds
+        return lo + (hi - lo) * self.rng.random(k)
+
+    def emit(self, pos, p_type):
+        cfg = EMITTERS.get(p_type)
+        if cfg is None: return 0
+        k = int(self.rng.integers(cfg['count'][0], cfg['count'][1] + 1))
+        if self.density < 1: k = max(1, int(k * self.density))
+        k = min(k, self.capacity - self.count)
+        if k <= 0: return 0
+        i, j = self.count, self.count + k
+        (w_lo, w_hi), (h_lo, h_hi) = cfg['size']
+        w = self.rng.integers(w_lo, w_hi + 1, k); h = self.rng.integers(h_lo, h_hi + 1, k)
+        self.size[i:j, 0] = w; self.size[i:j, 1] = h
+        self.pos[i:j, 0] = pos[0] - w // 2; self.pos[i:j, 1] = pos[1] - h // 2
+        self.vel[i:j, 0] = self._uniform(cfg['vel'][0], k); self.vel[i:j, 1] = self._uniform(cfg['vel'][1], k)
+        self.life[i:j] = self.rng.integers(cfg['life'][0], cfg['life'][1] + 1, k)
+        self.stamp[i:j] = [self._stamp_id(cfg['color'], ww, hh) for ww, hh in zip(w.tolist(), h.tolist())]
+        self.count = j
+        return k
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, pos, color, size, life, velocity):
-        super().__init__()
-        self.image = pygame.Surface(size); self.image.fill(color)
-        self.rect = self.image.get_rect(center=pos)
-        self.life = life; self.creation_time = pygame.time.get_ticks()
-        self.vx, self.vy = velocity
     def update(self, dt):
-        if pygame.time.get_ticks() - self.creation_time > self.life: self.kill()
-        self.rect.x += self.vx * (dt / 16.67); self.rect.y += self.vy * (dt / 16.67)
-    def draw(self, surface): surface.blit(self.image, self.rect)
-
-def create_particles(pos, p_type, group):
-    count = random.randint(8, 15)
-    color = RED
-    if p_type == 'blood': color = RED
-    elif p_type == 'fragments': color = GREY
-    
-    if p_type in ['blood', 'fragments']:
-        for _ in range(count):
-            vel = (random.uniform(-3, 3), random.uniform(-3, 3))
-            group.add(Particle(pos, color, (random.randint(2,4), random.randint(2,4)), random.randint(200, 400), vel))
-    elif p_type == 'dust':
-        vel = (random.uniform(-0.5, 0.5), random.uniform(-0.5, -1))
-        group.add(Particle(pos, (139, 115, 85), (random.randint(3,6), random.randint(3,6)), 400, vel))
-    elif p_type == 'sparks':
-        for _ in range(count):
-            vel = (random.uniform(-2, 2), random.uniform(-2, 2))
-            group.add(Particle(pos, ORANGE, (3, 3), 200, vel))
-
-class LightningBolt(pygame.sprite.Sprite):
-    def __init__(self, start_pos, end_pos):
-        super().__init__()
-        self.lifetime = 100; self.creation_time = pygame.time.get_ticks()
+        n = self.count
+        if not n: return
+        self.life[:n] -= dt
+        self.pos[:n] += self.vel[:n] * (dt / 16.67)
+        alive = self.life[:n] > 0
+        if not alive.all():
+            m = int(alive.sum())
+            for arr in (self.pos, self.vel, self.life, self.size, self.stamp):
+                arr[:m] = arr[:n][alive]
+            self.count = m
+
+    def draw(self, surface, origin=(0, 0)):
+        """Desenha as vivas com a câmera em `origin` (canto do mundo que cai em (0, 0) da tela)."""
+        n = self.count
+        if not n: return
+        stamps = self.stamps
+        xy = self.pos[:n].astype(np.int32) - np.array(origin, np.int32)
+        surface.blits([(stamps[sid], p) for sid, p in zip(self.stamp[:n].tolist(), xy.tolist())], doreturn=False)
+
+    def boxes(self, origin=(0, 0)):
+        """(x0, y0, x1, y1) de cada partícula viva, como o draw(origin) arredonda — usado pelo modo dirty rects."""
+        n = self.count; xy = self.pos[:n].astype(np.int32).astype(np.int64) - origin; wh = self.size[:n].astype(np.int64)
+        return xy[:, 0], xy[:, 1], xy[:, 0] + wh[:, 0], xy[:, 1] + wh[:, 1]
+
+    def clear(self):
+        self.count = 0
+
+    def seed(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+particle_system = ParticleSystem()
+
+def create_particles(pos, p_type):
+    return particle_system.emit(pos, p_type)
+
+@functools.lru_cache(maxsize=512)
+def bolt_image(length, angle):
+    """Raio de `length` px girado `angle` graus (inteiro: o cache acerta bem mais). Compartilhado."""
+    image = pygame.Surface((length, 2), pygame.SRCALPHA); image.fill(YELLOW)
+    return pygame.transform.rotate(image, angle)
+
+class LightningBolt(PooledSprite):
+    plain_draw = True
+    def reset(self, start_pos, end_pos):
+        self.lifetime = 100
         dx, dy = end_pos[0] - start_pos[0], end_pos[1] - start_pos[1]
-        length = int(math.hypot(dx, dy)); angle = math.degrees(math.atan2(-dy, dx))
+        length = int(math.hypot(dx, dy)); angle = round(math.degrees(math.atan2(-dy, dx)))
         if length == 0: length = 1
-        self.image = pygame.Surface((length, 2), pygame.SRCALPHA); self.image.fill(YELLOW)
-        self.image = pygame.transform.rotate(self.image, angle)
+        self.image = bolt_image(length, angle)
         self.rect = self.image.get_rect(center=start_pos)
     def update(self, dt):
-        if pygame.time.get_ticks() - self.creation_time > self.lifetime: self.kill()
+        self.lifetime -= dt
+        if self.lifetime < 0: self.kill()
     def draw(self, surface): surface.blit(self.image, self.rect)
\ No newline at end of file
@@ -4,6 +4,11 @@ import math
 import random
 from settings import *
 from particles import create_particles
+from ui import solid_sprite, circle_sprite, ellipse_sprite
+from pool import PooledSprite
+from quality import quality_governor
+from navigation import obstacle_map
+from world import camera
 
 class Ability:
     def __init__(self, cooldown): self.cooldown = cooldown; self.cooldown_timer = 0
@@ -31,9 +36,12 @@ class DurationAbility(Ability):
     def on_activate(self, p, pr, s): pass
     def on_deactivate(self, projectiles):
         if self.sprite: self.sprite.kill(); self.sprite = None
-    def draw(self, surface):
-        if self.active and self.sprite: self.sprite.draw(surface)
+    def draw(self, surface, center=None):
+        if not (self.active and self.sprite): return
+        if center is None: self.sprite.draw(surface)
+        else: surface.blit(self.sprite.image, self.sprite.image.get_rect(center=center))  # centrada no jogador como desenhado
 class BaseAuraSprite(pygame.sprite.Sprite):
+    plain_draw = True
     def __init__(self, center_pos, radius):
         super().__init__(); self.radius = radius; self.angle = 0
     def follow(self, player_center, dt): self.rect.center = player_center
@@ -63,40 +71,49 @@ class Valkyrie(DurationAbility):
     def on_activate(self, p, pr, s): self.sprite = ValkyrieSprite(p.rect.center); pr['vfx'].add(self.sprite)
 class ThunderLeap(InstantAbility):
     def __init__(self): super().__init__(cooldown=10000)
-    def effect(self, p, pr, s): p.rect.center = pygame.mouse.get_pos(); pr['player_explosions'].add(LeapExplosion(p.rect.center))
+    def effect(self, p, pr, s): p.rect.center = p.aim_pos; pr['player_explosions'].add(LeapExplosion.spawn(p.rect.center))
 class PhoenixCall(InstantAbility):
     def __init__(self): super().__init__(cooldown=20000)
-    def effect(self, p, pr, s): pr['player'].add(Phoenix(p.rect.center, pygame.mouse.get_pos()))
-class LeapExplosion(pygame.sprite.Sprite):
-    def __init__(self, center):
-        super().__init__(); self.radius = 80
-        self.image = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (*YELLOW, 200), (self.radius, self.radius), self.radius)
+    def effect(self, p, pr, s): pr['player'].add(Phoenix.spawn(p.rect.center, p.aim_pos))
+class LeapExplosion(PooledSprite):
+    plain_draw = True
+    light_radius = 120
+    def reset(self, center):
+        self.radius = 80; self.image = circle_sprite(self.radius, (*YELLOW, 200))
         self.rect = self.image.get_rect(center=center); self.lifetime = 200; self.damage = 60
     def update(self, dt):
         self.lifetime -= dt
         if self.lifetime <= 0: self.kill()
     def draw(self, surface): surface.blit(self.image, self.rect)
-class Phoenix(pygame.sprite.Sprite):
-    def __init__(self, start, target):
-        super().__init__(); self.image = pygame.Surface((50, 30), pygame.SRCALPHA)
-        pygame.draw.ellipse(self.image, FIRE_RED, self.image.get_rect()); self.rect = self.image.get_rect(center=start)
+class Phoenix(PooledSprite):
+    plain_draw = True
+    light_radius = 90
+    pool_limit = 4
+    def reset(self, start, target):
+        self.image = ellipse_sprite((50, 30), FIRE_RED); self.rect = self.image.get_rect(center=start); self.fx, self.fy = start
         dx, dy = target[0] - start[0], target[1] - start[1]; dist = math.hypot(dx, dy)
         self.vel_x, self.vel_y = (dx/dist)*10 if dist>0 else 0, (dy/dist)*10 if dist>0 else 0
         self.hit_enemies = set()
     def update(self, dt):
-        move_speed = dt / 16.67; self.rect.x += self.vel_x * move_speed; self.rect.y += self.vel_y * move_speed
-        if not pygame.display.get_surface().get_rect().colliderect(self.rect): self.kill()
+        move_speed = dt / 16.67; dx, dy = self.vel_x * move_speed, self.vel_y * move_speed
+        if obstacle_map.index and obstacle_map.index.sweep_rect(self.rect, dx, dy): self.kill(); return
+        self.fx += dx; self.fy += dy
+        self.rect.center = (round(self.fx), round(self.fy))
+        if not self.rect.colliderect(camera.active): self.kill()
     def draw(self, surface): surface.blit(self.image, self.rect)
-class Arrow(pygame.sprite.Sprite):
-    def __init__(self, start, target):
-        super().__init__(); self.image = pygame.Surface([10, 3]); self.image.fill(WHITE)
-        self.rect = self.image.get_rect(center=start)
+class Arrow(PooledSprite):
+    plain_draw = True
+    def reset(self, start, target):
+        self.image = solid_sprite((10, 3), WHITE); self.rect = self.image.get_rect(center=start); self.fx, self.fy = start
         dx, dy = target[0] - start[0], target[1] - start[1]; dist = math.hypot(dx, dy)
         self.vel_x, self.vel_y = (dx/dist)*12 if dist>0 else 0, (dy/dist)*12 if dist>0 else 0
     def update(self, dt):
-        move_speed = dt / 16.67; self.rect.x += self.vel_x * move_speed; self.rect.y += self.vel_y * move_speed
-        if not pygame.display.get_surface().get_rect().colliderect(self.rect): self.kill()
+        move_speed = dt / 16.67; x, y = self.fx + self.vel_x * move_speed, self.fy + self.vel_y * move_speed
+        hit = obstacle_map.index.segment_cast((self.fx, self.fy), (x, y)) if obstacle_map.index else None
+        if hit: create_particles((round(self.fx + (x - self.fx) * hit[0]), round(self.fy + (y - self.fy) * hit[0])), 'fragments'); self.kill(); return
+        self.fx, self.fy = x, y
+        self.rect.center = (round(self.fx), round(self.fy))
+        if not self.rect.colliderect(camera.active): self.kill()
     def draw(self, surface): surface.blit(self.image, self.rect)
 
 class Player(pygame.sprite.Sprite):
@@ -113,6 +130,8 @@ class Player(pygame.sprite.Sprite):
         self.available_upgrades = []; self.leveled_up_flag = False
         self.has_fire_arrows = False; self.has_chain_lightning = False; self.has_passive_heal = False
         self.passive_heal_timer = 0; self.passive_heal_interval = 2500
+        self.aim_pos = (x, y)  # alvo de ThunderLeap/PhoenixCall; o loop copia o mouse aqui
+        self._fx, self._fy = self.rect.center  # centro sub-pixel (movimento lento não se perde no arredondamento)
 
     def gain_xp(self, amount):
         self.xp += amount
@@ -142,25 +161,36 @@ class Player(pygame.sprite.Sprite):
         elif upgrade_id == "PASSIVE_HEAL": self.has_passive_heal = True
 
     # ALTERADO: Assinatura da função update (sem 'obstacles')
-    def update(self, projectiles, dt):
+    def update(self, projectiles, dt, keys=None):
         if self.xp >= self.xp_to_next_level: self.level_up()
         if self.has_passive_heal:
             self.passive_heal_timer += dt
             if self.passive_heal_timer >= self.passive_heal_interval:
                 self.passive_heal_timer = 0; self.hp = min(self.max_hp, self.hp + 10)
-        keys = pygame.key.get_pressed(); move_speed = self.speed * (dt / 16.67)
-        moved = False
-        if keys[pygame.K_w]: self.rect.y -= move_speed; moved = True
-        if keys[pygame.K_s]: self.rect.y += move_speed; moved = True
-        if keys[pygame.K_a]: self.rect.x -= move_speed; moved = True
-        if keys[pygame.K_d]: self.rect.x += move_speed; moved = True
-        if moved and random.random() < 0.2: create_particles(self.rect.midbottom, 'dust', projectiles['vfx'])
-        self.rect.clamp_ip(pygame.display.get_surface().get_rect())
+        if keys is None: keys = pygame.key.get_pressed()
+        move_speed = self.speed * (dt / 16.67)
+        moved = False; x, y = self.float_center()
+        if keys[pygame.K_w]: y -= move_speed; moved = True
+        if keys[pygame.K_s]: y += move_speed; moved = True
+        if keys[pygame.K_a]: x -= move_speed; moved = True
+        if keys[pygame.K_d]: x += move_speed; moved = True
+        if moved and obstacle_map.rects: x, y = obstacle_map.slide(self.rect, self.float_center(), (x, y))
+        cx, cy = round(x), round(y); self.rect.center = (cx, cy)
+        if moved and random.random() < 0.2 and quality_governor.settings['dust']: create_particles(self.rect.midbottom, 'dust')
+        self.rect.clamp_ip(camera.bounds)
+        if self.rect.centerx != cx: x = self.rect.centerx
+        if self.rect.centery != cy: y = self.rect.centery
+        self._fx, self._fy = x, y
         if self.damage_cooldown_timer > 0: self.damage_cooldown_timer -= dt
         if self.flash_timer > 0: self.flash_timer -= dt
         for ability in self.duration_abilities: ability.update(self, projectiles, dt)
         for ability in self.instant_abilities: ability.update_cooldown(dt)
             
+    def float_center(self):
+        # teleportes (ThunderLeap, entrada de chefe) escrevem direto no rect
+        if self.rect.center != (round(self._fx), round(self._fy)): self._fx, self._fy = self.rect.center
+        return self._fx, self._fy
+
     def take_damage(self, amount):
         if not self.shield.active and self.damage_cooldown_timer <= 0:
             self.hp -= amount; self.flash_timer = self.flash_duration
@@ -170,4 +200,4 @@ class Player(pygame.sprite.Sprite):
     def draw(self, surface):
         color = WHITE if self.flash_timer > 0 else BLUE
         self.image.fill(color); surface.blit(self.image, self.rect)
-        for ability in self.duration_abilities: ability.draw(surface)
+        for ability in self.duration_abilities: ability.draw(surface, self.rect.center)
@@ -0,0 +1,46 @@
+# pool.py
+import pygame
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Sprite reaproveitável. Em vez de __init__ a subclasse implementa reset(*args), que
+    deixa a instância como nova (posição, velocidade, timers) usando só imagens
+    compartilhadas — nunca desenhe nelas. spawn(*args) tira uma instância do pool da
+    classe (ou cria uma) e chama reset; kill() tira dos grupos e devolve ao pool.
+    Cada subclasse tem o próprio pool, com no máximo `pool_limit` instâncias paradas.
+    """
+    pool_limit = 256
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    def __init__(self, *args):
+        super().__init__(); self.released = False
+        self.reset(*args)
+
+    @classmethod
+    def spawn(cls, *args):
+        pool = cls._pool
+        if not pool: return cls(*args)
+        sprite = pool.pop(); sprite.released = False
+        sprite.reset(*args)
+        return sprite
+
+    @classmethod
+    def prewarm(cls, count, *args):
+        """Deixa `count` instâncias prontas no pool (criadas com `args`)."""
+        for _ in range(min(count, cls.pool_limit) - len(cls._pool)):
+            sprite = cls(*args); sprite.release()
+
+    def reset(self, *args): pass
+
+    def kill(self):
+        super().kill(); self.release()
+
+    def release(self):
+        # kill() pode ser chamado mais de uma vez no mesmo frame (ex.: flecha que acerta dois inimigos)
+        if self.released: return
+        self.released = True
+        pool = type(self)._pool
+        if len(pool) < self.pool_limit: pool.append(self)
@@ -0,0 +1,73 @@
+# profiler.py
+import time
+import tracemalloc
+from collections import deque
+import numpy as np
+
+class FrameProfiler:
+    """
+    Cronômetro por fase do frame. O loop chama begin_frame(), depois mark('fase') ao fim de
+    cada etapa (o tempo desde o mark anterior vai para a fase) e end_frame(). Guarda as
+    últimas `history` amostras de cada fase em ms. Com track_memory=True (e tracemalloc
+    ligado) também guarda o pico de bytes alocados dentro de cada fase.
+    """
+    def __init__(self, history=240):
+        self.history = history
+        self.samples = {}                     # fase -> deque de ms
+        self.allocs = {}                      # fase -> deque de bytes (pico dentro da fase)
+        self.frame_times = deque(maxlen=history)
+        self.track_memory = False
+        self.active = False; self._current = {}; self._last = self._start = 0.0; self._mem_base = 0
+
+    def reset(self, history=None):
+        if history: self.history = history
+        self.samples = {}; self.allocs = {}; self.frame_times = deque(maxlen=self.history); self.active = False
+
+    def begin_frame(self):
+        self._current = {}; self.active = True
+        if self.track_memory: tracemalloc.reset_peak(); self._mem_base = tracemalloc.get_traced_memory()[0]
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, phase):
+        if not self.active: return
+        now = time.perf_counter(); current = self._current
+        current[phase] = current.get(phase, 0.0) + (now - self._last) * 1000
+        if self.track_memory:
+            used, peak = tracemalloc.get_traced_memory()
+            self.allocs.setdefault(phase, deque(maxlen=self.history)).append(max(0, peak - self._mem_base))
+            tracemalloc.reset_peak(); self._mem_base = used
+            now = time.perf_counter()         # não cobra o custo do tracemalloc da próxima fase
+        self._last = now
+
+    def end_frame(self):
+        if not self.active: return
+        self.active = False
+        for phase, ms in self._current.items():
+            buf = self.samples.get(phase)
+            if buf is None: buf = self.samples[phase] = deque(maxlen=self.history)
+            buf.append(ms)
+        self.frame_times.append((time.perf_counter() - self._start) * 1000)
+
+    def last(self, phase):
+        """Tempo (ms) da fase no último frame em que ela rodou."""
+        buf = self.samples.get(phase)
+        return buf[-1] if buf else 0.0
+
+    def mean(self, phase):
+        buf = self.samples.get(phase)
+        return sum(buf) / len(buf) if buf else 0.0
+
+    def summary(self):
+        """p50/p95/p99/média/máx por fase e do frame inteiro, em ms (e KiB alocados se houver)."""
+        result = {'frame': _stats(self.frame_times), 'phases': {p: _stats(buf) for p, buf in self.samples.items()}}
+        if self.allocs: result['alloc_kib'] = {p: _stats(np.asarray(buf) / 1024) for p, buf in self.allocs.items()}
+        return result
+
+def _stats(values):
+    a = np.asarray(values, dtype=np.float64)
+    if not a.size: return {}
+    p50, p95, p99 = np.percentile(a, (50, 95, 99))
+    return {'p50': round(float(p50), 4), 'p95': round(float(p95), 4), 'p99': round(float(p99), 4),
+            'mean': round(float(a.mean()), 4), 'max': round(float(a.max()), 4)}
+
+frame_profiler = FrameProfiler()
@@ -0,0 +1,64 @@
+# quality.py
+from collections import deque
+from settings import *
+from lighting import light_map
+from particles import particle_system
+
+# Degraus de qualidade, do melhor para o mais leve. Cada degrau corta mais um trabalho
+# opcional, na ordem em que dá para abrir mão dele sem mexer na jogabilidade: partículas,
+# poeira do jogador, tremida de tela, resolução da máscara da noite e raios encadeados
+# (1 em cada `bolt_every` é desenhado; o dano continua igual).
+QUALITY_TIERS = [
+    {'name': 'alta',     'particles': 1.0,  'dust': True,  'shake': True,  'mask_scale': 1, 'bolt_every': 1},
+    {'name': 'média',    'particles': 0.5,  'dust': True,  'shake': True,  'mask_scale': 1, 'bolt_every': 1},
+    {'name': 'baixa',    'particles': 0.5,  'dust': False, 'shake': True,  'mask_scale': 1, 'bolt_every': 1},
+    {'name': 'sem shake', 'particles': 0.5, 'dust': False, 'shake': False, 'mask_scale': 1, 'bolt_every': 1},
+    {'name': 'máscara/2', 'particles': 0.25, 'dust': False, 'shake': False, 'mask_scale': 2, 'bolt_every': 1},
+    {'name': 'mínima',   'particles': 0.25, 'dust': False, 'shake': False, 'mask_scale': 4, 'bolt_every': 3},
+]
+
+DOWNGRADE_RATIO = 1.0   # média da janela acima do orçamento: desce um degrau
+UPGRADE_RATIO = 0.6     # só sobe com folga clara (histerese, para não ficar oscilando)
+WINDOW_FRAMES = 30      # frames da média móvel
+UPGRADE_HOLD = 180      # frames seguidos com folga antes de subir um degrau
+
+class QualityGovernor:
+    """
+    Observa o tempo de trabalho de cada frame (sem a espera do clock.tick) e troca de
+    degrau em QUALITY_TIERS: desce assim que a média de WINDOW_FRAMES passa do
+    orçamento e sobe de volta depois de UPGRADE_HOLD frames com folga. Depois de cada
+    troca a janela recomeça, então a próxima decisão já mede o degrau novo.
+    """
+    def __init__(self, budget_ms=1000 / FPS, enabled=ADAPTIVE_QUALITY):
+        self.budget = budget_ms; self.enabled = enabled
+        self.frames = deque(maxlen=WINDOW_FRAMES); self.calm = 0; self.bolt_counter = 0
+        self.level = 0; self.settings = QUALITY_TIERS[0]
+
+    def set_level(self, level):
+        self.level = max(0, min(len(QUALITY_TIERS) - 1, level)); self.settings = QUALITY_TIERS[self.level]
+        self.frames.clear(); self.calm = 0
+        particle_system.density = self.settings['particles']
+        light_map.set_scale(self.settings['mask_scale'])
+
+    def record(self, frame_ms):
+        """Registra o frame; devolve True se o degrau mudou (a tela inteira precisa ser redesenhada)."""
+        if not self.enabled: return False
+        frames = self.frames; frames.append(frame_ms)
+        if len(frames) < frames.maxlen: return False
+        avg = sum(frames) / len(frames)
+        if avg > self.budget * DOWNGRADE_RATIO and self.level < len(QUALITY_TIERS) - 1:
+            self.set_level(self.level + 1); return True
+        self.calm = self.calm + 1 if avg < self.budget * UPGRADE_RATIO else 0
+        if self.calm >= UPGRADE_HOLD and self.level > 0:
+            self.set_level(self.level - 1); return True
+        return False
+
+    def draw_bolt(self):
+        """False para os raios encadeados que o degrau atual manda pular."""
+        self.bolt_counter += 1
+        return self.bolt_counter % self.settings['bolt_every'] == 0
+
+    def label(self):
+        return f"{self.level} ({self.settings['name']})"
+
+quality_governor = QualityGovernor()
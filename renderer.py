@@ -0,0 +1,144 @@
+# renderer.py
+import pygame
+import numpy as np
+from settings import *
+
+DIRTY_TILE = 32
+FULL_REDRAW_RATIO = 0.5  # acima dessa fração da tela suja, um flip completo sai mais barato
+
+class DirtyRectRenderer:
+    """
+    Modo de retângulos sujos (settings.DIRTY_RECTS). A tela é dividida em tiles de
+    DIRTY_TILE px; a cada frame de jogo o main marca os tiles tocados pelo que desenhou
+    (sprites, luzes, partículas, widgets do HUD) e end() devolve a união com o frame
+    anterior como faixas disjuntas — disjuntas porque a máscara da noite é multiplicada
+    por área e não pode cair duas vezes no mesmo pixel. Telas paradas (menus, pausa,
+    level up) nem são redesenhadas enquanto nada muda.
+    """
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), tile=DIRTY_TILE):
+        self.size = size; self.tile = tile; self.screen_rect = pygame.Rect((0, 0), size)
+        self.cols, self.rows = -(-size[0] // tile), -(-size[1] // tile)
+        self.grid = np.zeros((self.rows, self.cols), bool); self.prev = np.zeros_like(self.grid)
+        self.full = True; self.static_key = None
+
+    def invalidate(self):
+        """Força o próximo frame de jogo a redesenhar e enviar a tela inteira."""
+        self.full = True
+
+    def unchanged(self, key):
+        """True se a tela parada identificada por `key` já está na tela como foi desenhada."""
+        same = key == self.static_key; self.static_key = key
+        return same
+
+    def mark_rects(self, rects):
+        boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], np.int64).reshape(-1, 4)
+        self.mark_boxes(boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3])
+
+    def mark_boxes(self, x0, y0, x1, y1):
+        """Marca as caixas [x0, x1) x [y0, y1) (arrays NumPy em coordenadas de tela)."""
+        w, h = self.size
+        visible = (x1 > x0) & (y1 > y0) & (x1 > 0) & (y1 > 0) & (x0 < w) & (y0 < h)
+        t = self.tile
+        c0 = np.clip(x0[visible] // t, 0, self.cols - 1); c1 = np.clip((x1[visible] - 1) // t, 0, self.cols - 1)
+        r0 = np.clip(y0[visible] // t, 0, self.rows - 1); r1 = np.clip((y1[visible] - 1) // t, 0, self.rows - 1)
+        span_c, span_r = c1 - c0, r1 - r0
+        # caixas de até 3x3 tiles (quase todos os sprites) vão em lote; as grandes, uma a uma
+        small = (span_c <= 2) & (span_r <= 2)
+        grid = self.grid
+        for i in range(3):
+            for j in range(3):
+                sel = small & (span_c >= i) & (span_r >= j)
+                grid[r0[sel] + j, c0[sel] + i] = True
+        big = ~small
+        for a, b, c, d in zip(r0[big].tolist(), r1[big].tolist(), c0[big].tolist(), c1[big].tolist()):
+            grid[a:b + 1, c:d + 1] = True
+
+    def end(self):
+        """Rects sujos do frame (este + anterior) ou None quando é para mandar a tela toda."""
+        dirty = self.grid | self.prev
+        self.prev, self.grid = self.grid, self.prev
+        self.grid[:] = False
+        if self.full:
+            self.full = False; return None
+        if dirty.mean() > FULL_REDRAW_RATIO: return None
+        t = self.tile; rects = []
+        for row in np.flatnonzero(dirty.any(axis=1)).tolist():
+            edges = np.flatnonzero(np.diff(np.concatenate(([0], dirty[row].view(np.int8), [0])))).tolist()
+            for start, stop in zip(edges[::2], edges[1::2]):
+                rects.append(pygame.Rect(start * t, row * t, (stop - start) * t, t).clip(self.screen_rect))
+        return rects
+
+Z_PLAYER, Z_ENEMIES, Z_PROJECTILES = 0, 1, 2
+
+class RenderQueue:
+    """
+    Fila de desenho do mundo por camada (z). Sprites com `plain_draw` verdadeiro (o draw
+    deles é só blit de image em rect) entram em listas (image, rect) enviadas num único
+    Surface.blits; os outros caem no próprio draw(). Um fallback fecha o lote corrente,
+    então a ordem dentro da camada é exatamente a de inserção. `origin` é a câmera (o
+    canto do mundo que cai em (0, 0) da tela): todo rect é deslocado por ela, e sprites
+    fora de `view` (em coordenadas de tela) são descartados antes de entrar na fila.
+
+    Interpolação: snapshot() guarda a posição de cada sprite antes do último passo da
+    simulação e `alpha` (fração do passo seguinte já acumulada) coloca o desenho entre as
+    duas. Fallbacks têm o rect deslocado (interpolação + câmera) só durante o próprio draw().
+    """
+    def __init__(self, view=(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.view = pygame.Rect(view); self.layers = {}
+        self.prev = {}; self.alpha = 1.0; self.origin = (0, 0)
+
+    def snapshot(self, *groups):
+        # o rect entra na chave da "vida": um sprite que voltou do pool tem rect novo e não é interpolado
+        self.prev = {sprite: (sprite.rect, sprite.rect.x, sprite.rect.y) for group in groups for sprite in group}
+
+    def offset(self, sprite):
+        """(dx, dy) do rect atual (mundo) até onde o sprite é desenhado na tela com o alpha corrente."""
+        ox, oy = self.origin
+        prev = self.prev.get(sprite)
+        if prev is None or self.alpha >= 1: return -ox, -oy
+        rect, x, y = prev
+        if rect is not sprite.rect: return -ox, -oy
+        k = 1 - self.alpha; dx, dy = x - rect.x, y - rect.y
+        if abs(dx) > SNAP_DISTANCE or abs(dy) > SNAP_DISTANCE: return -ox, -oy  # teleporte: não arrasta pelo caminho
+        return round(dx * k) - ox, round(dy * k) - oy
+
+    def place(self, sprite):
+        """Rect (na tela) onde o sprite vai ser desenhado."""
+        dx, dy = self.offset(sprite)
+        return sprite.rect.move(dx, dy) if dx or dy else sprite.rect
+
+    def push(self, z, sprite):
+        self.layers.setdefault(z, []).append((sprite, *self.offset(sprite)))
+
+    def push_group(self, z, sprites):
+        ops = self.layers.setdefault(z, [])
+        batch = ops[-1] if ops and type(ops[-1]) is list else None
+        visible = self.view.colliderect; offset = self.offset
+        for sprite in sprites:
+            dx, dy = offset(sprite); rect = sprite.rect
+            if dx or dy: rect = rect.move(dx, dy)
+            if not visible(rect): continue
+            if getattr(sprite, 'plain_draw', False):
+                if batch is None: batch = []; ops.append(batch)
+                batch.append((sprite.image, rect))
+            elif hasattr(sprite, 'draw'):
+                ops.append((sprite, dx, dy)); batch = None
+
+    def push_blits(self, z, items):
+        """Pares (Surface, posição) já prontos (ex.: bullet_engine) entram no lote corrente da camada."""
+        if not items: return
+        ops = self.layers.setdefault(z, [])
+        if ops and type(ops[-1]) is list: ops[-1].extend(items)
+        else: ops.append(list(items))
+
+    def flush(self, surface):
+        """Desenha as camadas em ordem crescente de z e esvazia a fila."""
+        blits = surface.blits
+        for z in sorted(self.layers):
+            for op in self.layers[z]:
+                if type(op) is list: blits(op, doreturn=False); continue
+                sprite, dx, dy = op
+                if dx or dy: sprite.rect.move_ip(dx, dy)
+                sprite.draw(surface)
+                if dx or dy: sprite.rect.move_ip(-dx, -dy)
+        self.layers.clear()
@@ -2,7 +2,24 @@
 
 # Configurações da Tela
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
-FPS = 120
+FPS = 120  # limite de quadros desenhados; a simulação anda em passos fixos de SIM_DT
+SIM_HZ = 60
+SIM_DT = 1000 / SIM_HZ
+MAX_FRAME_MS = 250  # um engasgo maior que isso não vira uma rajada de passos (a simulação desacelera)
+SNAP_DISTANCE = 96  # saltos maiores que isso num passo (teleportes) não são interpolados
+# Nível de detalhe da IA: inimigo comum perto do jogador e na tela roda todo passo; longe (na
+# tela) pensa a cada AI_LOD_FAR_PERIOD passos; fora da tela também anda só a cada AI_LOD_OFFSCREEN_PERIOD
+AI_LOD_NEAR = 200
+AI_LOD_FAR_PERIOD = 2
+AI_LOD_OFFSCREEN_PERIOD = 4
+AI_LOD_VIEW_MARGIN = 24  # px além da borda em que o centro ainda conta como na tela
+# Mundo: maior que a tela; a câmera (world.py) segue o jogador e tudo roda em coordenadas de mundo
+WORLD_WIDTH, WORLD_HEIGHT = SCREEN_WIDTH * 4, SCREEN_HEIGHT * 4
+ARENA_RECT = (0, 0, WORLD_WIDTH, WORLD_HEIGHT)  # área jogável; independe de existir uma janela
+ACTIVE_MARGIN = 160  # px além da câmera em que projéteis ainda existem (fora disso somem)
+DIRTY_RECTS = False  # só redesenha/envia as áreas que mudaram (renderer.py); também via --dirty-rects
+OBSTACLES = False  # pedras (ui.SCENERY_LAYERS) que bloqueiam o jogador e que os inimigos contornam (navigation.py)
+ADAPTIVE_QUALITY = True  # corta efeitos opcionais quando o frame estoura o orçamento (quality.py)
 
 # Cores
 SKY_BLUE = (135, 206, 235); GRASS_GREEN = (34, 139, 34); BLACK = (0, 0, 0)
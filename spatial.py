@@ -0,0 +1,300 @@
+# spatial.py
+import pygame
+import math
+import heapq
+import numpy as np
+from collections import defaultdict
+
+class SpatialHash:
+    """
+    Broadphase em grade uniforme, separada por camadas ('enemies', 'enemy', ...).
+    Cada sprite é registrado em todas as células que o rect dele toca (consultas por
+    área) e, à parte, só na célula do seu centro (consultas de vizinho mais próximo).
+    Os resultados de área saem na ordem de inserção, igual a iterar os Groups originais.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.layers = {}       # camada -> {(cx, cy): [sprites cujo rect toca a célula]}
+        self.points = {}       # camada -> {(cx, cy): [sprites cujo centro está na célula]}
+        self.bounds = {}       # camada -> [cx0, cy0, cx1, cy1] das células de centro ocupadas
+        self.spans = {}        # sprite -> (camada, (cx0, cy0, cx1, cy1), célula do centro)
+        self.order = {}        # sprite -> ordem de inserção
+        self._next_order = 0
+
+    def _span(self, rect):
+        cs = self.cell_size
+        return rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs
+
+    def _cell(self, x, y):
+        cs = self.cell_size
+        return int(x // cs), int(y // cs)
+
+    def clear(self):
+        self.layers.clear(); self.points.clear(); self.bounds.clear()
+        self.spans.clear(); self.order.clear(); self._next_order = 0
+
+    def rebuild(self, layer, *groups):
+        """Recria uma camada a partir dos Groups (na ordem em que são passados)."""
+        for sprite in [s for s, entry in self.spans.items() if entry[0] == layer]:
+            del self.spans[sprite]; del self.order[sprite]
+        self.layers[layer] = defaultdict(list); self.points[layer] = defaultdict(list)
+        self.bounds.pop(layer, None)
+        for group in groups:
+            for sprite in group: self.insert(layer, sprite)
+
+    def insert(self, layer, sprite):
+        cells = self.layers.get(layer)
+        if cells is None:
+            cells = self.layers[layer] = defaultdict(list); self.points[layer] = defaultdict(list)
+        span = x0, y0, x1, y1 = self._span(sprite.rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1): cells[(cx, cy)].append(sprite)
+        center = ccx, ccy = self._cell(*sprite.rect.center)
+        self.points[layer][center].append(sprite)
+        b = self.bounds.get(layer)
+        if b is None: self.bounds[layer] = [ccx, ccy, ccx, ccy]
+        else: b[0] = min(b[0], ccx); b[1] = min(b[1], ccy); b[2] = max(b[2], ccx); b[3] = max(b[3], ccy)
+        self.spans[sprite] = (layer, span, center)
+        if sprite not in self.order:
+            self.order[sprite] = self._next_order; self._next_order += 1
+
+    def remove(self, sprite):
+        entry = self.spans.pop(sprite, None)
+        if entry is None: return
+        layer, (x0, y0, x1, y1), center = entry
+        cells = self.layers[layer]
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket and sprite in bucket: bucket.remove(sprite)
+        bucket = self.points[layer].get(center)
+        if bucket and sprite in bucket: bucket.remove(sprite)
+        self.order.pop(sprite, None)
+
+    def update(self, sprite):
+        """Atualiza as células de um sprite que se moveu (ex.: knockback) mantendo a ordem."""
+        entry = self.spans.get(sprite)
+        if entry is None: return
+        if entry[1] == self._span(sprite.rect) and entry[2] == self._cell(*sprite.rect.center): return
+        order = self.order[sprite]
+        self.remove(sprite); self.insert(entry[0], sprite); self.order[sprite] = order
+
+    def query(self, rect, layer):
+        """Sprites vivos da camada cujo rect colide com `rect`, na ordem de inserção."""
+        cells = self.layers.get(layer)
+        if not cells: return []
+        x0, y0, x1, y1 = self._span(rect)
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket: found.update(bucket)
+        hits = [s for s in found if s.alive() and rect.colliderect(s.rect)]
+        if len(hits) > 1: hits.sort(key=self.order.__getitem__)
+        return hits
+
+    def query_radius(self, center, radius, layer):
+        """Sprites vivos cujo rect intersecta o círculo (center, radius), na ordem de inserção."""
+        x, y = center
+        left, top = math.floor(x - radius), math.floor(y - radius)
+        area = pygame.Rect(left, top, math.ceil(x + radius) - left + 1, math.ceil(y + radius) - top + 1)
+        r2 = radius * radius
+        return [s for s in self.query(area, layer) if rect_distance_sq(s.rect, x, y) <= r2]
+
+    def nearest(self, center, layer, k=1, max_dist=None, exclude=()):
+        """
+        Os k sprites vivos mais próximos de `center` (entre centros, estritamente < max_dist),
+        do mais perto para o mais longe; empate fica com quem foi inserido antes.
+        Varre anéis de células a partir da célula do centro e para assim que nenhum anel
+        restante pode conter alguém mais perto do que o k-ésimo encontrado.
+        """
+        points = self.points.get(layer); b = self.bounds.get(layer)
+        if not points or b is None: return []
+        cs = self.cell_size; x, y = center
+        ccx, ccy = self._cell(x, y)
+        # menor distância do ponto até a borda da própria célula
+        margin = min(x - ccx * cs, (ccx + 1) * cs - x, y - ccy * cs, (ccy + 1) * cs - y)
+        max_ring = max(ccx - b[0], b[2] - ccx, ccy - b[1], b[3] - ccy)
+        limit = float('inf') if max_dist is None else max_dist * max_dist
+        order = self.order
+        best = []   # heap de (-dist², -ordem, sprite): o topo é o pior dos k
+        for ring in range(max_ring + 1):
+            if ring:
+                reach = ((ring - 1) * cs + margin) ** 2
+                if reach >= limit or (len(best) == k and reach > -best[0][0]): break
+            for cell in _ring_cells(ccx, ccy, ring):
+                bucket = points.get(cell)
+                if not bucket: continue
+                for s in bucket:
+                    r = s.rect
+                    d2 = (r.centerx - x) ** 2 + (r.centery - y) ** 2
+                    if d2 >= limit or s in exclude or not s.alive(): continue
+                    item = (-d2, -order[s], s)
+                    if len(best) < k: heapq.heappush(best, item)
+                    elif item > best[0]: heapq.heapreplace(best, item)
+        return [s for _, _, s in sorted(best, reverse=True)]
+
+def _ring_cells(cx, cy, ring):
+    """Células na borda do quadrado de raio `ring` (distância de Chebyshev) em volta de (cx, cy)."""
+    if ring == 0:
+        yield (cx, cy); return
+    for x in range(cx - ring, cx + ring + 1):
+        yield (x, cy - ring); yield (x, cy + ring)
+    for y in range(cy - ring + 1, cy + ring):
+        yield (cx - ring, y); yield (cx + ring, y)
+
+def rect_distance_sq(rect, x, y):
+    """Distância² do ponto (x, y) até o ponto mais próximo do rect (0 se estiver dentro)."""
+    dx = max(rect.left - x, 0, x - rect.right); dy = max(rect.top - y, 0, y - rect.bottom)
+    return dx * dx + dy * dy
+
+def center_distance_sq(a, b):
+    """Distância² entre os centros de dois rects."""
+    return (a.centerx - b.centerx) ** 2 + (a.centery - b.centery) ** 2
+
+def segment_box_t(ax, ay, dx, dy, x0, y0, x1, y1):
+    """
+    Fração t em [0, 1] em que o segmento (ax, ay) + t·(dx, dy) entra na caixa [x0, x1) x [y0, y1)
+    (teste de slabs); aceita arrays NumPy (broadcast) e devolve inf onde não há contato.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_x, inv_y = np.divide(1.0, dx), np.divide(1.0, dy)
+        tx0, tx1 = (x0 - ax) * inv_x, (x1 - ax) * inv_x
+        ty0, ty1 = (y0 - ay) * inv_y, (y1 - ay) * inv_y
+        # eixo parado: dentro do slab vale o intervalo todo, fora dele nunca encosta
+        in_x = (ax >= x0) & (ax < x1); in_y = (ay >= y0) & (ay < y1)
+        near_x = np.where(dx == 0, np.where(in_x, -np.inf, np.inf), np.minimum(tx0, tx1))
+        far_x = np.where(dx == 0, np.where(in_x, np.inf, -np.inf), np.maximum(tx0, tx1))
+        near_y = np.where(dy == 0, np.where(in_y, -np.inf, np.inf), np.minimum(ty0, ty1))
+        far_y = np.where(dy == 0, np.where(in_y, np.inf, -np.inf), np.maximum(ty0, ty1))
+    t_in = np.maximum(np.maximum(near_x, near_y), 0.0); t_out = np.minimum(far_x, far_y)
+    return np.where((t_in <= t_out) & (t_in <= 1.0) & (t_out >= 0.0), t_in, np.inf)
+
+def _cell_key(cx, cy):
+    """Chave int64 de uma célula (escalares ou arrays); a ordem segue (cx, cy)."""
+    return (np.int64(cx) + (1 << 23)) << 24 | (np.int64(cy) + (1 << 23))
+
+def _expand(counts):
+    """Para `counts` (n,): índice de origem e posição 0..count-1 de cada item, como um laço duplo achatado."""
+    owner = np.repeat(np.arange(len(counts)), counts)
+    return owner, np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+class StaticRectIndex:
+    """
+    Índice fixo de rects (obstáculos do mapa), montado uma vez por mapa: cada rect fica
+    nas células de `cell_size` que toca. segment_cast percorre só as células cruzadas pelo
+    segmento (DDA), na ordem, e para na primeira com contato. sweep_rect/sweep_boxes testam
+    rects em movimento contra os obstáculos alargados pela metade do tamanho deles (soma
+    de Minkowski): projétil rápido não atravessa obstáculo entre dois passos.
+
+    Linha de visão: line_of_sight consulta uma tabela por célula de `vis_cell` px que diz,
+    para cada célula a até `vis_radius` células, se *todo* segmento entre as duas células
+    está livre (o segmento centro a centro alargado pela meia célula não toca obstáculo).
+    A tabela é só um filtro conservador: "livre" é resposta exata, o resto (e os pares mais
+    distantes) é confirmado com segment_cast. Cada tabela é calculada de uma vez, em
+    NumPy, na primeira consulta, e fica até o mapa mudar.
+    """
+    def __init__(self, rects, cell_size=64, vis_cell=32, vis_radius=8):
+        self.rects = [pygame.Rect(r) for r in rects]; self.cell_size = cell_size
+        self.boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in self.rects], np.float64).reshape(-1, 4)
+        self.cells = defaultdict(list)
+        for i, r in enumerate(self.rects):
+            for cx in range(r.left // cell_size, (r.right - 1) // cell_size + 1):
+                for cy in range(r.top // cell_size, (r.bottom - 1) // cell_size + 1): self.cells[(cx, cy)].append(i)
+        # as mesmas células em arrays (chaves ordenadas + CSR) para o sweep_boxes em lote
+        keys = sorted(self.cells, key=lambda k: _cell_key(*k))
+        self._cell_keys = np.array([_cell_key(*k) for k in keys], np.int64)
+        self._cell_start = np.cumsum([0] + [len(self.cells[k]) for k in keys]).astype(np.int64)
+        self._cell_items = np.array([i for k in keys for i in self.cells[k]], np.int64)
+        self.vis_cell = vis_cell; self.vis_radius = vis_radius; self._visibility = {}
+        offsets = np.arange(-vis_radius, vis_radius + 1)
+        self._vis_offsets = np.stack(np.meshgrid(offsets, offsets, indexing='ij'), -1).reshape(-1, 2) * vis_cell  # (dy, dx)
+
+    def __bool__(self): return bool(self.rects)
+
+    def _segment_cells(self, a, b):
+        cs = self.cell_size; (x0, y0), (x1, y1) = a, b
+        cx, cy = int(x0 // cs), int(y0 // cs); ex, ey = int(x1 // cs), int(y1 // cs)
+        dx, dy = x1 - x0, y1 - y0; inf = float('inf')
+        step_x, step_y = (1 if dx > 0 else -1), (1 if dy > 0 else -1)
+        t_max_x = ((cx + (dx > 0)) * cs - x0) / dx if dx else inf; t_delta_x = cs / abs(dx) if dx else inf
+        t_max_y = ((cy + (dy > 0)) * cs - y0) / dy if dy else inf; t_delta_y = cs / abs(dy) if dy else inf
+        # cada célula sai com o t em que o segmento deixa ela
+        for _ in range(abs(ex - cx) + abs(ey - cy)):
+            yield (cx, cy), min(t_max_x, t_max_y)
+            if t_max_x < t_max_y: cx += step_x; t_max_x += t_delta_x
+            else: cy += step_y; t_max_y += t_delta_y
+        yield (cx, cy), 1.0
+
+    def segment_cast(self, a, b):
+        """(t, rect) do primeiro obstáculo no segmento a -> b (t = fração do caminho) ou None."""
+        if not self.rects: return None
+        ax, ay = a; dx, dy = b[0] - ax, b[1] - ay; seen = set(); best = None
+        for cell, t_exit in self._segment_cells(a, b):
+            for i in self.cells.get(cell, ()):
+                if i in seen: continue
+                seen.add(i); x0, y0, x1, y1 = self.boxes[i].tolist()
+                t = float(segment_box_t(ax, ay, dx, dy, x0, y0, x1, y1))
+                if t != float('inf') and (best is None or t < best[0]): best = (t, self.rects[i])
+            # quem ainda não apareceu só entra no segmento depois desta célula
+            if best is not None and best[0] <= t_exit: return best
+        return best
+
+    def sweep_rect(self, rect, dx, dy):
+        """(t, obstáculo) do primeiro contato de `rect` andando (dx, dy), ou None."""
+        if not self.rects: return None
+        cs = self.cell_size; area = rect.union(rect.move(dx, dy)); hw, hh = rect.width / 2, rect.height / 2
+        candidates = {i for cx in range(area.left // cs, (area.right - 1) // cs + 1)
+                      for cy in range(area.top // cs, (area.bottom - 1) // cs + 1) for i in self.cells.get((cx, cy), ())}
+        best = None; ax, ay = rect.center
+        for i in sorted(candidates):
+            x0, y0, x1, y1 = self.boxes[i].tolist()
+            t = float(segment_box_t(ax, ay, dx, dy, x0 - hw, y0 - hh, x1 + hw, y1 + hh))
+            if t != float('inf') and (best is None or t < best[0]): best = (t, self.rects[i])
+        return best
+
+    def sweep_boxes(self, x, y, dx, dy, w, h):
+        """
+        Versão em lote de sweep_rect: caixas (x, y, w, h) andando (dx, dy), tudo arrays de
+        tamanho n. Devolve o t do primeiro contato de cada uma (inf = caminho livre).
+        """
+        n = len(x); out = np.full(n, np.inf)
+        if not self.rects or not n: return out
+        # candidatos: obstáculos das células que a área varrida toca (1 px a mais de cada
+        # lado, porque a caixa encostando na borda já conta como contato)
+        cs = self.cell_size; x1, y1 = x + dx, y + dy
+        cx0 = ((np.minimum(x, x1) - 1) // cs).astype(np.int64); cx1 = ((np.maximum(x, x1) + w) // cs).astype(np.int64)
+        cy0 = ((np.minimum(y, y1) - 1) // cs).astype(np.int64); cy1 = ((np.maximum(y, y1) + h) // cs).astype(np.int64)
+        nx = cx1 - cx0 + 1; box, k = _expand(nx * (cy1 - cy0 + 1))
+        key = _cell_key(cx0[box] + k % nx[box], cy0[box] + k // nx[box])
+        slot = np.minimum(np.searchsorted(self._cell_keys, key), len(self._cell_keys) - 1)
+        found = self._cell_keys[slot] == key; box, slot = box[found], slot[found]
+        start = self._cell_start[slot]; pair, k = _expand(self._cell_start[slot + 1] - start)
+        box = box[pair]; b = self.boxes[self._cell_items[start[pair] + k]]
+        hw, hh = w[box] / 2, h[box] / 2
+        t = segment_box_t(x[box] + hw, y[box] + hh, dx[box], dy[box], b[:, 0] - hw, b[:, 1] - hh, b[:, 2] + hw, b[:, 3] + hh)
+        np.minimum.at(out, box, t)  # obstáculo em várias células aparece repetido: o mínimo não muda
+        return out
+
+    def _visibility_row(self, cell):
+        row = self._visibility.get(cell)
+        if row is None:
+            vc = self.vis_cell; r = self.vis_radius
+            cy, cx = (cell[0] + 0.5) * vc, (cell[1] + 0.5) * vc
+            reach = (r + 1) * vc; b = self.boxes; pad = vc / 2 + 1  # meia célula (+1 px: borda encostada conta)
+            near = b[(b[:, 2] > cx - reach) & (b[:, 0] < cx + reach) & (b[:, 3] > cy - reach) & (b[:, 1] < cy + reach)]
+            dy, dx = self._vis_offsets[:, 0].astype(np.float64), self._vis_offsets[:, 1].astype(np.float64)
+            if len(near):
+                t = segment_box_t(cx, cy, dx[:, None], dy[:, None], near[:, 0] - pad, near[:, 1] - pad, near[:, 2] + pad, near[:, 3] + pad)
+                row = np.isinf(t).all(axis=1)
+            else: row = np.ones(len(dx), bool)
+            row = self._visibility[cell] = row.reshape(2 * r + 1, 2 * r + 1)
+        return row
+
+    def line_of_sight(self, a, b):
+        """True se nenhum obstáculo corta a -> b; mesma resposta de segment_cast, que só roda quando a tabela não garante."""
+        if not self.rects: return True
+        vc = self.vis_cell; r = self.vis_radius
+        ca = (int(a[1] // vc), int(a[0] // vc)); dr, dc = int(b[1] // vc) - ca[0], int(b[0] // vc) - ca[1]
+        if abs(dr) <= r and abs(dc) <= r and self._visibility_row(ca)[dr + r, dc + r]: return True
+        return self.segment_cast(a, b) is None
@@ -0,0 +1,78 @@
+# spawner.py
+import random
+from collections import deque
+from settings import *
+from enemy import Grunt, Tank, Bomber, Assassin, edge_position
+from quality import quality_governor
+from world import camera
+
+FIRST_WAVE_DELAY = 2000   # ms até a primeira onda (era o intervalo do spawn antigo)
+WAVE_BREAK = 5000         # ms de respiro entre o último inimigo de uma onda e a próxima
+WAVE_BASE, WAVE_GROWTH = 5, 2                 # inimigos na onda 1 e a mais por onda
+WAVE_INTERVAL, WAVE_INTERVAL_STEP, WAVE_MIN_INTERVAL = 1800, 100, 500  # ms entre inimigos de uma onda
+PACK_SPACING = 70         # px entre inimigos de um mesmo bando na borda
+SPAWN_BATCH = 2           # instâncias criadas por passo, no máximo; o resto espera na fila
+LIVE_ENEMY_BUDGET = 60    # teto de inimigos comuns vivos no degrau de qualidade mais alto
+BUDGET_BY_QUALITY = (1.0, 0.9, 0.8, 0.7, 0.6, 0.5)  # fração do teto por degrau (quality.QUALITY_TIERS)
+POOL_PREWARM = {Grunt: 24, Tank: 8, Bomber: 12, Assassin: 8}
+
+def available_enemies(player_level):
+    enemy_pool = [Grunt, Tank]
+    if player_level >= 3: enemy_pool.append(Bomber)
+    if player_level >= 4: enemy_pool.append(Assassin)
+    return enemy_pool
+
+class SpawnDirector:
+    """
+    Diretor de ondas (o "Sistema de Ondas" do melhorias.txt). Cada onda é planejada inteira
+    quando começa: quantos inimigos, de que tipo, em que instante e em que ponto da borda,
+    em bandos que entram juntos pelo mesmo lado. Os pontos são relativos à tela e só viram
+    coordenadas de mundo no spawn, na borda de onde a câmera estiver então. O plano fica
+    numa fila ordenada por instante; update() tira dela só o que venceu, instancia no
+    máximo SPAWN_BATCH por passo (dos pools pré-aquecidos) e para no orçamento de vivos.
+    Enquanto o orçamento está cheio o relógio da onda não anda, então o ritmo cai sozinho
+    quando o jogo (ou a máquina, via degrau de qualidade) não dá conta, sem rajada depois.
+    """
+    def __init__(self, screen_dims=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.screen_dims = screen_dims; self.reset()
+
+    def reset(self):
+        self.wave = 0; self.clock = 0; self.queue = deque(); self.break_timer = FIRST_WAVE_DELAY
+
+    def prewarm(self):
+        for enemy_class, count in POOL_PREWARM.items(): enemy_class.prewarm(count, self.screen_dims, False, (-100, -100))
+
+    def interrupt(self):
+        """Descarta o resto da onda (luta de chefe); a próxima vem depois do respiro."""
+        self.queue.clear(); self.break_timer = WAVE_BREAK
+
+    def budget(self):
+        return max(SPAWN_BATCH, int(LIVE_ENEMY_BUDGET * BUDGET_BY_QUALITY[quality_governor.level]))
+
+    def plan_wave(self, player_level):
+        self.wave += 1; n = self.wave
+        remaining = WAVE_BASE + WAVE_GROWTH * (n - 1)
+        interval = max(WAVE_MIN_INTERVAL, WAVE_INTERVAL - WAVE_INTERVAL_STEP * (n - 1))
+        kinds = available_enemies(player_level); t = self.clock
+        while remaining:
+            pack = min(remaining, random.randint(1, 1 + n // 3)); enemy_class = random.choice(kinds)
+            side = random.choice(['top', 'left', 'right']); x, y = edge_position((0, 0, *self.screen_dims), side)
+            for i in range(pack):
+                offset = (i - (pack - 1) / 2) * PACK_SPACING
+                self.queue.append((t, enemy_class, (x + offset, y) if side == 'top' else (x, y + offset)))
+            remaining -= pack; t += interval * pack
+
+    def update(self, dt, enemies, player_level, is_night):
+        if not self.queue:
+            self.break_timer -= dt
+            if self.break_timer <= 0: self.plan_wave(player_level); self.break_timer = WAVE_BREAK
+            return
+        budget = self.budget()
+        if len(enemies) >= budget: return
+        self.clock += dt; queue = self.queue
+        for _ in range(SPAWN_BATCH):
+            if not queue or queue[0][0] > self.clock or len(enemies) >= budget: break
+            _, enemy_class, (x, y) = queue.popleft()
+            enemies.add(enemy_class.spawn(self.screen_dims, is_night, (camera.rect.x + x, camera.rect.y + y)))
+
+spawn_director = SpawnDirector()
@@ -0,0 +1,7 @@
+# tests/conftest.py
+import os
+import sys
+
+# os módulos do jogo ficam na raiz do repositório; sem janela nem áudio nos testes
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy'); os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -0,0 +1,66 @@
+# tests/test_bullets.py
+import math
+import pygame
+import pytest
+from bullets import BulletEngine, PATTERNS
+from navigation import obstacle_map
+from world import camera
+
+class Target:
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect); self.damage = []
+    def take_damage(self, amount): self.damage.append(amount)
+
+@pytest.fixture
+def engine():
+    camera.reset(camera.world.center)
+    return BulletEngine(capacity=4)
+
+def test_cone_fires_one_bullet_per_angle_in_order(engine):
+    origin = camera.rect.center; target = (origin[0] + 100, origin[1])
+    engine.fire('draken_cone', origin, target)
+    angles = PATTERNS['draken_cone']['angles']
+    assert engine.count == len(angles)  # capacidade cresceu sozinha
+    for i, offset in enumerate(angles):
+        vx, vy = engine.vel[i].tolist()
+        assert math.atan2(vy, vx) == pytest.approx(offset) and math.hypot(vx, vy) == pytest.approx(10)
+
+def test_fire_cone_times_out_and_survivors_keep_order(engine):
+    center = camera.rect.center
+    for angle in (0.0, 1.0, 2.0): engine.spawn('fire_cone', center, angle)
+    for _ in range(6): engine.update(100)
+    assert engine.count == 3
+    engine.hit_player(Target((engine.pos[1][0], engine.pos[1][1], 4, 4)))  # 'consume': o do meio some
+    assert engine.count == 2 and [round(math.atan2(vy, vx), 6) for vx, vy in engine.vel[:2].tolist()] == [0.0, 2.0]
+    engine.update(100)
+    assert engine.count == 0
+
+def test_meteor_repeats_then_blast_hits_once(engine):
+    center = camera.rect.center; engine.spawn('meteor', center)
+    player = Target((center[0] - 5, center[1] - 5, 10, 10))
+    engine.hit_player(player); engine.hit_player(player)
+    assert player.damage == [35, 35]  # telegraph: 'repeat'
+    engine.update(700)
+    assert engine.count == 1 and engine.state[0] == 1
+    engine.hit_player(player); engine.hit_player(player)
+    assert player.damage == [35, 35, 35]  # explosão: 'once'
+    engine.update(150)
+    assert engine.count == 0
+
+def test_bullets_leaving_the_active_area_are_culled(engine):
+    x, y, w, h = camera.active
+    engine.spawn('fire_cone', (x + w + 4, y + h // 2), 0.0)  # ainda encosta na borda; no passo seguinte sai
+    engine.spawn('fire_cone', (x + w // 2, y + h // 2), 0.0)
+    engine.update(1000 / 60)
+    assert engine.count == 1
+
+def test_rock_stops_fast_bullet_between_steps(engine):
+    cx, cy = camera.rect.center
+    obstacle_map.load([pygame.Rect(cx + 12, cy - 20, 2, 40)]); obstacle_map.follow(camera.active)
+    try:
+        engine.spawn('fire_cone', (cx, cy), 0.0); engine.spawn('fire_cone', (cx, cy), math.pi)
+        engine.update(1000 / 60)  # 10 px por passo: a bala da direita encosta na pedra fina
+        engine.update(1000 / 60)
+        assert engine.count == 1 and engine.vel[0][0] < 0
+    finally:
+        obstacle_map.load([]); obstacle_map.follow(camera.active)
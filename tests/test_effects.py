@@ -0,0 +1,76 @@
+# tests/test_effects.py
+import pygame
+import pytest
+from effects import StatusEffects
+
+
+class Dummy(pygame.sprite.Sprite):
+    def __init__(self, hp=100):
+        super().__init__()
+        self.hp = hp; self.move_scale = 1.0; self.rect = pygame.Rect(0, 0, 10, 10)
+
+
+def run(effects, ms, step=1000 / 60):
+    killed = []; t = 0.0
+    while t < ms:
+        killed += effects.update(step); t += step
+    return killed
+
+
+@pytest.fixture
+def target():
+    group = pygame.sprite.Group(); t = Dummy(); group.add(t)  # alive() precisa de um grupo
+    return t
+
+
+def test_fire_3000ms_ticks_twice_then_expires(target):
+    fx = StatusEffects(); fx.apply(target, 'fire', 3000, 5)
+    hits = []
+    for _ in range(240):
+        hp = target.hp; fx.update(1000 / 60)
+        if target.hp != hp: hits.append(fx.now)
+    assert len(hits) == 2
+    assert hits[0] == pytest.approx(1000, abs=17) and hits[1] == pytest.approx(2000, abs=34)
+    assert target.hp == 90 and not fx.has(target, 'fire')
+
+
+def test_fire_refresh_restarts_interval(target):
+    fx = StatusEffects(); fx.apply(target, 'fire', 3000, 5)
+    run(fx, 900); fx.apply(target, 'fire', 3000, 5)
+    run(fx, 900)
+    assert target.hp == 100  # o intervalo recomeçou na reaplicação
+    run(fx, 200)
+    assert target.hp == 95
+
+
+def test_poison_stacks_up_to_max(target):
+    fx = StatusEffects()
+    for _ in range(8): fx.apply(target, 'poison', 2000, 1)
+    fx.update(500)
+    assert target.hp == 95  # 5 pilhas x 1
+
+
+def test_slow_keeps_strongest(target):
+    fx = StatusEffects(); fx.apply(target, 'slow', 1000, magnitude=0.3); fx.apply(target, 'slow', 3000, magnitude=0.8)
+    assert target.move_scale == 0.3
+    fx.update(2000)
+    assert target.move_scale == 0.3  # ficou com a duração maior também
+    fx.update(1001)
+    assert target.move_scale == 1.0
+
+
+def test_stun_extends_up_to_cap(target):
+    fx = StatusEffects()
+    for _ in range(5): fx.apply(target, 'stun', 1000)
+    assert target.move_scale == 0.0
+    fx.update(2999)
+    assert fx.has(target, 'stun')
+    fx.update(2)
+    assert not fx.has(target, 'stun') and target.move_scale == 1.0
+
+
+def test_tick_kill_is_returned_once(target):
+    target.hp = 5
+    fx = StatusEffects(); fx.apply(target, 'fire', 3000, 5)
+    assert run(fx, 3000) == [target]
+    assert not target.alive()
@@ -0,0 +1,90 @@
+# tests/test_navigation.py
+import numpy as np
+import pygame
+from navigation import ObstacleMap, FlowField, UNREACHED, NAV_MARGIN
+
+CELL = 32
+
+
+def walled_field(target=(288, 48)):
+    """Mapa 320x320 com um muro vertical em x=144..176 de y=0 a y=224: a passagem é por baixo."""
+    nav = ObstacleMap(world=(0, 0, 320, 320), cell=CELL); nav.load([pygame.Rect(144, 0, 32, 224)]); nav.follow(nav.world)
+    field = FlowField(nav); field.update(target)
+    return nav, field
+
+
+def walk(nav, field, pos, limit=100):
+    """Segue as direções célula a célula; devolve as células visitadas até a do alvo."""
+    row, col = nav.cell_of(*pos); path = [(row, col)]
+    for _ in range(limit):
+        if field.dist[row, col] == 0: return path
+        dx, dy = field.dir[row, col]
+        col += int(np.sign(round(dx, 6))); row += int(np.sign(round(dy, 6))); path.append((row, col))
+    return path
+
+
+def test_wall_cells_are_unreachable():
+    nav, field = walled_field()
+    assert (field.dist[nav.blocked] == UNREACHED).all()
+    assert (field.dist[~nav.blocked] != UNREACHED).all()
+
+
+def test_routes_around_wall():
+    nav, field = walled_field()
+    start = (48, 48)
+    dx, dy = field.direction(*start)
+    assert dy > 0  # do outro lado do muro, desce em direção à passagem
+    path = walk(nav, field, start)
+    assert field.dist[path[-1]] == 0
+    assert not any(nav.blocked[cell] for cell in path)
+    wall_rows = np.flatnonzero(nav.blocked.any(axis=1))
+    assert max(row for row, _ in path) > wall_rows.max()  # passou por baixo do muro
+    # o caminho tem o tamanho da BFS (ortogonais e diagonais contam 1)
+    assert len(path) - 1 <= field.dist[nav.cell_of(*start)]
+
+
+def test_recomputes_only_when_target_changes_cell():
+    nav, field = walled_field()
+    assert not field.update((290, 50))  # mesma célula
+    assert field.update((290, 90))
+    nav.load(nav.rects); nav.follow(nav.world)
+    assert field.update((290, 90))  # mapa recarregado: versão nova
+
+
+def test_steer_falls_back_next_to_target():
+    nav, field = walled_field()
+    pos = np.array([[48.0, 48.0], [280.0, 48.0]]); fallback = np.array([[1.0, 0.0], [1.0, 0.0]])
+    out = field.steer(pos, fallback)
+    assert out[0, 1] > 0 and out[1].tolist() == [1.0, 0.0]
+
+
+def rock_chunk(col, row, chunk=512):
+    """Uma pedra 40x40 no meio de cada chunk, como uma decoração de chão."""
+    return [pygame.Rect(col * chunk + 236, row * chunk + 236, 40, 40)]
+
+
+def test_window_follows_area_and_stays_bounded():
+    world = pygame.Rect(0, 0, 512 * 40, 512 * 40); loaded = []
+    nav = ObstacleMap(world=world, cell=CELL)
+    nav.load(lambda col, row: loaded.append((col, row)) or rock_chunk(col, row))
+    area = pygame.Rect(0, 0, 1120, 920); area.center = world.center
+    assert nav.follow(area) and not nav.follow(area.move(NAV_MARGIN // 2, 0))  # ainda dentro da janela
+    assert nav.window.contains(area) and nav.window.width <= area.width + 2 * NAV_MARGIN + CELL
+    assert all(nav.window.colliderect(r.inflate(32, 32)) for r in nav.rects) and nav.rects
+    for step in range(1, 60):
+        nav.follow(area.move(step * 300, 0).clamp(world))
+        assert len(nav.chunks) <= nav.capacity
+        assert nav.blocked.shape == (nav.rows, nav.cols) and nav.rows * nav.cols <= 100 * 100
+    assert len(set(loaded)) > nav.capacity  # passou por mais chunks do que guarda
+
+
+def test_streamed_field_routes_in_window_coordinates():
+    world = pygame.Rect(0, 0, 512 * 8, 512 * 8)
+    nav = ObstacleMap(world=world, cell=CELL); nav.load(rock_chunk)
+    area = pygame.Rect(0, 0, 800, 600); area.center = (512 * 4 + 256, 512 * 4 + 256); nav.follow(area)
+    field = FlowField(nav); rock = pygame.Rect(512 * 4 + 236, 512 * 4 + 236, 40, 40)
+    field.update((rock.centerx + 120, rock.centery))
+    assert nav.origin != (0, 0) and nav.blocked[nav.cell_of(*rock.center)]
+    dx, dy = field.direction(rock.centerx - 100, rock.centery)
+    assert abs(dy) > 0  # a pedra está no caminho: desvia
+    assert field.direction(*world.topleft) is None  # fora da janela: reto
@@ -0,0 +1,96 @@
+# tests/test_spatial.py
+import random
+import numpy as np
+import pygame
+from spatial import SpatialHash, StaticRectIndex, rect_distance_sq, segment_box_t
+
+def make_sprites(rng, n, area=800, max_size=90):
+    group = pygame.sprite.Group(); sprites = []
+    for _ in range(n):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rng.randrange(-50, area), rng.randrange(-50, area), rng.randrange(1, max_size), rng.randrange(1, max_size))
+        group.add(sprite); sprites.append(sprite)
+    return group, sprites
+
+def test_query_matches_brute_force_in_insertion_order():
+    rng = random.Random(1)
+    group, sprites = make_sprites(rng, 300)
+    grid = SpatialHash(cell_size=64); grid.rebuild('enemies', group)
+    for sprite in sprites[::7]: sprite.kill()  # mortos depois do rebuild não voltam nas consultas
+    for _ in range(500):
+        area = pygame.Rect(rng.randrange(-100, 850), rng.randrange(-100, 850), rng.randrange(1, 200), rng.randrange(1, 200))
+        expected = [s for s in sprites if s.alive() and area.colliderect(s.rect)]
+        assert grid.query(area, 'enemies') == expected
+
+def test_update_keeps_order_after_move():
+    rng = random.Random(2)
+    group, sprites = make_sprites(rng, 50)
+    grid = SpatialHash(cell_size=64); grid.rebuild('enemies', group)
+    for sprite in sprites:
+        sprite.rect.move_ip(rng.randrange(-200, 200), rng.randrange(-200, 200)); grid.update(sprite)
+    area = pygame.Rect(-300, -300, 1500, 1500)
+    assert grid.query(area, 'enemies') == sprites
+
+def test_query_radius_matches_brute_force():
+    rng = random.Random(3)
+    group, sprites = make_sprites(rng, 300)
+    grid = SpatialHash(cell_size=64); grid.rebuild('enemies', group)
+    for _ in range(500):
+        x, y, r = rng.uniform(-50, 850), rng.uniform(-50, 850), rng.uniform(0, 250)
+        expected = [s for s in sprites if rect_distance_sq(s.rect, x, y) <= r * r]
+        assert grid.query_radius((x, y), r, 'enemies') == expected
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(4)
+    group, sprites = make_sprites(rng, 300)
+    grid = SpatialHash(cell_size=64); grid.rebuild('enemies', group)
+    order = {s: i for i, s in enumerate(sprites)}
+    for _ in range(300):
+        x, y = rng.uniform(-200, 1000), rng.uniform(-200, 1000)
+        k = rng.randrange(1, 6); max_dist = rng.choice([None, rng.uniform(10, 300)])
+        exclude = set(rng.sample(sprites, 3))
+        d2 = lambda s: (s.rect.centerx - x) ** 2 + (s.rect.centery - y) ** 2
+        pool = [s for s in sprites if s not in exclude and (max_dist is None or d2(s) < max_dist * max_dist)]
+        expected = sorted(pool, key=lambda s: (d2(s), order[s]))[:k]
+        assert grid.nearest((x, y), 'enemies', k, max_dist, exclude) == expected
+
+def make_rocks(rng, n=60, area=800):
+    return [pygame.Rect(rng.randrange(0, area), rng.randrange(0, area), rng.randrange(2, 70), rng.randrange(2, 70)) for _ in range(n)]
+
+def brute_cast(rects, a, b, hw=0.0, hh=0.0):
+    """Menor t entre todos os obstáculos (alargados por hw, hh), sem grade; None = livre."""
+    box = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], float)
+    t = segment_box_t(a[0], a[1], b[0] - a[0], b[1] - a[1], box[:, 0] - hw, box[:, 1] - hh, box[:, 2] + hw, box[:, 3] + hh).min()
+    return None if t == np.inf else float(t)
+
+def test_segment_cast_matches_brute_force():
+    rng = random.Random(4); rocks = make_rocks(rng); index = StaticRectIndex(rocks)
+    for _ in range(2000):
+        a = (rng.uniform(-50, 850), rng.uniform(-50, 850)); b = (rng.uniform(-50, 850), rng.uniform(-50, 850))
+        hit = index.segment_cast(a, b); expected = brute_cast(rocks, a, b)
+        assert (hit and hit[0]) == expected or abs(hit[0] - expected) < 1e-9
+
+def test_sweep_rect_and_sweep_boxes_match_brute_force():
+    rng = random.Random(5); rocks = make_rocks(rng); index = StaticRectIndex(rocks)
+    moving = [pygame.Rect(rng.randrange(-20, 800), rng.randrange(-20, 800), rng.randrange(1, 30), rng.randrange(1, 30)) for _ in range(1000)]
+    moves = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in moving]
+    moves[:20] = [(0.0, 0.0)] * 20
+    batch = index.sweep_boxes(*(np.array(v, float) for v in zip(*[(r.x, r.y, dx, dy, r.w, r.h) for r, (dx, dy) in zip(moving, moves)])))
+    for rect, (dx, dy), t_batch in zip(moving, moves, batch):
+        a = rect.center; expected = brute_cast(rocks, a, (a[0] + dx, a[1] + dy), rect.width / 2, rect.height / 2)
+        hit = index.sweep_rect(rect, dx, dy)
+        assert (hit and hit[0]) == expected or abs(hit[0] - expected) < 1e-9
+        center = (rect.x + rect.w / 2, rect.y + rect.h / 2)  # o lote usa o centro float; o rect.center do pygame arredonda
+        expected = brute_cast(rocks, center, (center[0] + dx, center[1] + dy), rect.width / 2, rect.height / 2)
+        assert t_batch == np.inf if expected is None else abs(t_batch - expected) < 1e-9
+
+def test_sweep_boxes_touching_cell_edge():
+    index = StaticRectIndex([pygame.Rect(64, 0, 10, 10)])  # borda esquerda na divisa de células
+    t = index.sweep_boxes(np.array([50.0]), np.array([0.0]), np.array([4.0]), np.array([0.0]), np.array([10.0]), np.array([10.0]))
+    assert t[0] == 1.0
+
+def test_line_of_sight_is_exact():
+    rng = random.Random(6); rocks = make_rocks(rng, 80); index = StaticRectIndex(rocks, vis_cell=32, vis_radius=8)
+    for _ in range(3000):
+        a = (rng.uniform(0, 800), rng.uniform(0, 800)); b = (a[0] + rng.uniform(-300, 300), a[1] + rng.uniform(-300, 300))
+        assert index.line_of_sight(a, b) == (brute_cast(rocks, a, b) is None)
@@ -1,26 +1,162 @@
 # ui.py
 import pygame
 import os
+import math
+import random
+import functools
+from collections import OrderedDict
 from settings import *
+from lighting import light_map, PLAYER_LIGHT_RADIUS
 
 # =========================
 #   Helpers (sprites / fonte)
 # =========================
 
-def load_sprite(file_name, size=None):
+# Flags de variante do load_sprite (fazem parte da chave do cache)
+FLIP_X = 1        # espelhado na horizontal
+TRANSLUCENT = 2   # alpha 128 (ex.: ilusões da Morgana)
+FLASH = 4         # clarão branco de dano (BLEND_RGB_ADD com branco)
+
+ATLAS_WIDTH = 1024
+ATLAS_MAX_SIDE = 128  # sprites com os dois lados <= isso vão para o atlas
+
+# (arquivo, tamanho, flags) -> Surface compartilhada. NUNCA desenhe nelas nem mude o alpha:
+# a mesma Surface é usada por todos os inimigos/cartas daquele tipo.
+_SPRITE_CACHE = {}
+_ATLAS = None
+
+# Tudo que o jogo usa durante a partida; o main() chama preload_sprites() uma vez no início
+PRELOAD_SPRITES = [
+    ('grama.png', (64, 64), 0), ('Rocha.png', (48, 48), 0),
+    ('Grunt-1.png', (60, 60), 0), ('Grunt-2.png', (60, 60), 0),
+    ('Tank-1.png', (70, 70), 0), ('Tank-2.png', (70, 70), 0),
+    ('Morgana-Flutuando.png', (90, 120), 0), ('Morgana-Flutuando.png', (90, 120), TRANSLUCENT),
+    ('Morgana-Casting.png', (90, 120), 0), ('Morgana-Dano.png', (90, 120), 0),
+    ('Morgana-Kiting-Direita.png', (90, 120), 0),
+    ('Draken-Idle.png', (110, 110), 0), ('Draken-Chase-Direita.png', (110, 110), 0),
+    ('Draken-Rajada.png', (110, 110), 0), ('Draken-Chuva.png', (110, 110), 0),
+    ('Draken-Dano.png', (110, 110), 0),
+    ('Rex-Idle.png', (150, 150), 0), ('Rex-direita.png', (150, 150), 0), ('Rex-Walk-2.png', (150, 150), 0),
+    ('Rex-Prepare-Dash.png', (150, 150), 0), ('Rex-Dash.png', (150, 150), 0), ('Rex-Dano.png', (150, 150), 0),
+    ('Pergaminho-VidaMax.png', (160, 240), 0), ('Pergaminho-Cooldown.png', (160, 240), 0),
+    ('Pergaminho-Fogo.png', (160, 240), 0), ('Pergaminho-Raio.png', (160, 240), 0),
+    ('Pergaminho-regen.png', (160, 240), 0),
+]
+# Variantes geradas no carregamento: frames piscando dos inimigos comuns e chefes virados para a esquerda
+PRELOAD_SPRITES += [(f, s, FLASH) for f, s, flags in PRELOAD_SPRITES if f.startswith(('Grunt', 'Tank'))]
+PRELOAD_SPRITES += [(f, s, FLIP_X) for f, s, flags in PRELOAD_SPRITES if not flags and f.startswith(('Rex', 'Morgana', 'Draken'))]
+
+def _load_image(file_name, size=None):
     path = os.path.join('assets', 'sprites', file_name)
     try:
         image = pygame.image.load(path).convert_alpha()
         if size:
             return pygame.transform.scale(image, size)
         return image
-    except pygame.error:
+    except (pygame.error, FileNotFoundError):
         print(f"AVISO: Sprite '{path}' não encontrado. Usando fallback.")
         w, h = size if size else (50, 50)
         surf = pygame.Surface((w, h), pygame.SRCALPHA)
         surf.fill(MAGENTA)
         return surf
 
+def load_sprite(file_name, size=None, flags=0):
+    key = (file_name, tuple(size) if size else None, flags)
+    surf = _SPRITE_CACHE.get(key)
+    if surf is None:
+        if flags:
+            # variantes derivam da versão base (que pode ser uma view do atlas)
+            surf = load_sprite(file_name, size)
+            surf = pygame.transform.flip(surf, True, False) if flags & FLIP_X else surf.copy()
+            if flags & FLASH:
+                surf.fill(WHITE, special_flags=pygame.BLEND_RGB_ADD)
+            if flags & TRANSLUCENT:
+                surf.set_alpha(128)
+        else:
+            surf = _load_image(file_name, size)
+        _SPRITE_CACHE[key] = surf
+    return surf
+
+_SOLID_CACHE = {}  # formas geradas (retângulos, círculos, elipses) -> Surface compartilhada
+
+def solid_sprite(size, color, alpha=None):
+    """Retângulo de cor sólida compartilhado. Com alpha, Surface SRCALPHA com set_alpha(alpha)."""
+    key = (tuple(size), tuple(color), alpha)
+    surf = _SOLID_CACHE.get(key)
+    if surf is None:
+        surf = _SOLID_CACHE[key] = pygame.Surface(size, pygame.SRCALPHA if alpha is not None else 0)
+        surf.fill(color)
+        if alpha is not None: surf.set_alpha(alpha)
+    return surf
+
+def circle_sprite(radius, color, width=0):
+    """Círculo (RGBA) de raio `radius` numa Surface SRCALPHA 2r x 2r, compartilhada."""
+    key = ('circle', radius, tuple(color), width)
+    surf = _SOLID_CACHE.get(key)
+    if surf is None:
+        surf = _SOLID_CACHE[key] = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius, width)
+    return surf
+
+def ellipse_sprite(size, color):
+    """Elipse preenchendo uma Surface SRCALPHA de tamanho `size`, compartilhada."""
+    key = ('ellipse', tuple(size), tuple(color))
+    surf = _SOLID_CACHE.get(key)
+    if surf is None:
+        surf = _SOLID_CACHE[key] = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, color, surf.get_rect())
+    return surf
+
+def build_sprite_atlas(entries):
+    """Empacota sprites pequenos numa única textura (prateleiras) e guarda subsurfaces no cache."""
+    global _ATLAS
+    images = [((file_name, tuple(size), 0), _load_image(file_name, size)) for file_name, size in entries]
+    images.sort(key=lambda item: item[1].get_height(), reverse=True)
+    placements = []
+    x = y = shelf_h = 0
+    for key, image in images:
+        w, h = image.get_size()
+        if x + w > ATLAS_WIDTH:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        placements.append((key, image, pygame.Rect(x, y, w, h)))
+        x += w; shelf_h = max(shelf_h, h)
+    if not placements:
+        return None
+    _ATLAS = pygame.Surface((ATLAS_WIDTH, y + shelf_h), pygame.SRCALPHA).convert_alpha()
+    _ATLAS.fill((0, 0, 0, 0))
+    for key, image, rect in placements:
+        _ATLAS.blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)  # cópia exata do RGBA
+        _SPRITE_CACHE[key] = _ATLAS.subsurface(rect)
+    return _ATLAS
+
+def preload_sprites(entries=PRELOAD_SPRITES):
+    """Carrega (e escala) todos os sprites de uma vez. Precisa de display já criado (convert_alpha)."""
+    small = {(f, tuple(s)) for f, s, flags in entries
+             if s and max(s) <= ATLAS_MAX_SIDE and (f, tuple(s), 0) not in _SPRITE_CACHE}
+    build_sprite_atlas(sorted(small))
+    for file_name, size, flags in entries:
+        load_sprite(file_name, size, flags)
+
+# Fontes e textos renderizados são cacheados: o HUD pede as mesmas fontes/strings todo frame
+MEDIEVAL_FONT_CANDIDATES = [
+    os.path.join('assets', 'fonts', 'UnifrakturCook-Bold.ttf'),
+    os.path.join('assets', 'fonts', 'Cinzel-Black.ttf'),
+    os.path.join('assets', 'fonts', 'MedievalSharp.ttf'),
+    os.path.join('assets', 'fonts', 'OldLondon.ttf'),
+]
+TEXT_CACHE_SIZE = 256
+_FONT_CACHE = {}  # (caminho, tamanho) -> Font
+_medieval_font_path = None
+_medieval_font_resolved = False
+
+def get_font(path, size):
+    """Fonte compartilhada por (caminho, tamanho). path=None usa a fonte padrão do pygame."""
+    key = (path, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.Font(path, size)
+    return font
+
 def load_medieval_font(size):
     """
     Tenta carregar uma fonte 'medieval' de assets/fonts/.
@@ -30,28 +166,28 @@ def load_medieval_font(size):
       - MedievalSharp.ttf
       - OldLondon.ttf
     Se não achar, usa a fonte padrão do pygame.
+    O arquivo é procurado só na primeira chamada; as fontes ficam no cache de get_font.
     """
-    candidates = [
-        os.path.join('assets', 'fonts', 'UnifrakturCook-Bold.ttf'),
-        os.path.join('assets', 'fonts', 'Cinzel-Black.ttf'),
-        os.path.join('assets', 'fonts', 'MedievalSharp.ttf'),
-        os.path.join('assets', 'fonts', 'OldLondon.ttf'),
-    ]
-    for p in candidates:
-        try:
-            if os.path.exists(p):
-                return pygame.font.Font(p, size)
-        except Exception:
-            pass
-    return pygame.font.Font(None, size)
-
-# cache do fundo de menu
-_MENU_BG = None
+    global _medieval_font_path, _medieval_font_resolved
+    if not _medieval_font_resolved:
+        _medieval_font_resolved = True
+        for p in MEDIEVAL_FONT_CANDIDATES:
+            try:
+                if os.path.exists(p):
+                    get_font(p, size)
+                    _medieval_font_path = p
+                    break
+            except Exception:
+                pass
+    return get_font(_medieval_font_path, size)
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(font, text, color, antialias=True):
+    """font.render com cache LRU. A Surface é compartilhada: só blit, nunca desenhe nela."""
+    return font.render(text, antialias, color)
+
 def get_menu_bg():
-    global _MENU_BG
-    if _MENU_BG is None:
-        _MENU_BG = load_sprite('Fundo.png', (SCREEN_WIDTH, SCREEN_HEIGHT))
-    return _MENU_BG
+    return load_sprite('Fundo.png', (SCREEN_WIDTH, SCREEN_HEIGHT))
 
 # =========================
 #   Layout / Grid
@@ -59,6 +195,7 @@ def get_menu_bg():
 GRID = 16
 MARGIN = 16
 SHOW_FPS = False  # deixe True se quiser ver o FPS no HUD
+SHOW_SCENERY = False  # pedras decorativas (SCENERY_LAYERS) assadas no chão, sem custo por frame
 
 def g(n):  # múltiplo de grid (sempre int)
     return int(n * GRID)
@@ -94,24 +231,23 @@ def draw_gradient_rect(surface, rect, color_top, color_bottom):
         b = int(color_top[2] + (color_bottom[2] - color_top[2]) * t)
         pygame.draw.line(surface, (r, g, b), (x, y + i), (x + w - 1, y + i))
 
-def draw_parchment_panel(surface, rect, border=3, corner_radius=10, alpha=200):
-    x, y, w, h = rect
-    x = int(x); y = int(y); w = int(w); h = int(h)
-    panel = pygame.Surface((w, h), pygame.SRCALPHA)
+def make_parchment_panel(w, h, border=3, corner_radius=10, alpha=200):
+    panel = pygame.Surface((int(w), int(h)), pygame.SRCALPHA)
+    w, h = panel.get_size()
     pygame.draw.rect(panel, (*PARCHMENT, alpha), (0, 0, w, h), border_radius=corner_radius)
     pygame.draw.rect(panel, (*PARCHMENT_DARK, int(alpha * 0.35)), (3, 3, w - 6, h - 6), border_radius=corner_radius)
     pygame.draw.rect(panel, (*GOLD, alpha), (0, 0, w, h), border, border_radius=corner_radius)
-    surface.blit(panel, (x, y))
+    return panel
 
-def draw_fancy_bar(surface, x, y, w, h, ratio, fg_top, fg_bottom, label_text, label_color=INK, tick_every=10):
-    x = int(x); y = int(y); w = int(w); h = int(h)
-    ratio = max(0.0, min(1.0, float(ratio)))
+def draw_parchment_panel(surface, rect, border=3, corner_radius=10, alpha=200):
+    x, y, w, h = rect
+    surface.blit(make_parchment_panel(w, h, border, corner_radius, alpha), (int(x), int(y)))
 
+def _draw_bar_body(surface, x, y, w, h, fill_w, fg_top, fg_bottom, tick_every):
     pygame.draw.rect(surface, GOLD, (x - 3, y - 3, w + 6, h + 6), border_radius=8)
     pygame.draw.rect(surface, GOLD_LIGHT, (x - 2, y - 2, w + 4, h + 4), 2, border_radius=8)
     pygame.draw.rect(surface, PARCHMENT, (x, y, w, h), border_radius=6)
 
-    fill_w = int(w * ratio)
     if fill_w > 0:
         draw_gradient_rect(surface, (x, y, fill_w, h), fg_top, fg_bottom)
         pygame.draw.rect(surface, (0, 0, 0), (x, y, fill_w, h), 1, border_radius=6)
@@ -123,9 +259,14 @@ def draw_fancy_bar(surface, x, y, w, h, ratio, fg_top, fg_bottom, label_text, la
 
     pygame.draw.rect(surface, INK, (x, y, w, h), 2, border_radius=6)
 
+def draw_fancy_bar(surface, x, y, w, h, ratio, fg_top, fg_bottom, label_text, label_color=INK, tick_every=10):
+    x = int(x); y = int(y); w = int(w); h = int(h)
+    ratio = max(0.0, min(1.0, float(ratio)))
+    _draw_bar_body(surface, x, y, w, h, int(w * ratio), fg_top, fg_bottom, tick_every)
+
     if label_text:
         lbl_font = load_medieval_font(24)
-        lbl_surf = lbl_font.render(label_text, True, label_color)
+        lbl_surf = render_text(lbl_font, label_text, label_color)
         surface.blit(lbl_surf, (x + 8, y - lbl_surf.get_height()))
 
 def draw_heart(surface, center, size=14, color=(200, 0, 0)):
@@ -138,18 +279,14 @@ def draw_heart(surface, center, size=14, color=(200, 0, 0)):
 
 def draw_scroll_tag(surface, text, pos):
     font = load_medieval_font(22)
-    txt = font.render(text, True, INK)
+    txt = render_text(font, text, INK)
     pad = 8
     rect = pygame.Rect(0, 0, txt.get_width() + pad * 2, txt.get_height() + pad * 2)
     rect.topleft = (int(pos[0]), int(pos[1]))
     draw_parchment_panel(surface, rect, border=2, corner_radius=8, alpha=210)
     surface.blit(txt, (rect.x + pad, rect.y + pad))
 
-def draw_ability_slot(surface, center, size, key_text, cooldown_ms, cooldown_total_ms):
-    x, y = center
-    x = int(x); y = int(y)
-    r = int(size // 2)
-
+def _draw_hexagon(surface, x, y, r):
     # hexágono estilo runa
     pts = []
     for i in range(6):
@@ -165,6 +302,12 @@ def draw_ability_slot(surface, center, size, key_text, cooldown_ms, cooldown_tot
     pygame.draw.polygon(surface, (40, 40, 40), inner_pts, 0)
     pygame.draw.polygon(surface, GOLD_LIGHT, inner_pts, 2)
 
+def draw_ability_slot(surface, center, size, key_text, cooldown_ms, cooldown_total_ms):
+    x, y = center
+    x = int(x); y = int(y)
+    r = int(size // 2)
+    _draw_hexagon(surface, x, y, r)
+
     # cooldown overlay
     if cooldown_total_ms and cooldown_ms > 0:
         ratio = max(0.0, min(1.0, cooldown_ms / float(cooldown_total_ms)))
@@ -174,7 +317,7 @@ def draw_ability_slot(surface, center, size, key_text, cooldown_ms, cooldown_tot
         surface.blit(overlay, (x - r, y + r - h))
 
         sec = max(0, int((cooldown_ms + 999) // 1000))
-        num = pygame.font.Font(None, 28).render(str(sec), True, WHITE)
+        num = render_text(get_font(None, 28), str(sec), WHITE)
         surface.blit(num, num.get_rect(center=(x, y)))
     else:
         glow = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
@@ -182,7 +325,7 @@ def draw_ability_slot(surface, center, size, key_text, cooldown_ms, cooldown_tot
         surface.blit(glow, (x - r, y - r))
 
     # letra da tecla
-    key = load_medieval_font(24).render(key_text, True, WHITE)
+    key = render_text(load_medieval_font(24), key_text, WHITE)
     surface.blit(key, key.get_rect(center=(x, y)))
 
 # =========================
@@ -214,9 +357,9 @@ class UpgradeCard(pygame.sprite.Sprite):
 
 def draw_tooltip(surface, card):
     font_title = load_medieval_font(28)
-    font_desc = pygame.font.Font(None, 24)
-    title_surf = font_title.render(card.title, True, INK)
-    desc_surf = font_desc.render(card.description, True, WHITE)
+    font_desc = get_font(None, 24)
+    title_surf = render_text(font_title, card.title, INK)
+    desc_surf = render_text(font_desc, card.description, WHITE)
     width = max(title_surf.get_width(), desc_surf.get_width()) + 20
     height = title_surf.get_height() + desc_surf.get_height() + 15
     tooltip_surf = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -230,7 +373,7 @@ def draw_level_up_screen(screen, font, upgrade_cards):
     overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
     overlay.fill((0, 0, 0, 200))
     screen.blit(overlay, (0, 0))
-    title_text = load_medieval_font(52).render("LEVEL UP! ESCOLHA UM PERGAMINHO:", True, YELLOW)
+    title_text = render_text(load_medieval_font(52), "LEVEL UP! ESCOLHA UM PERGAMINHO:", YELLOW)
     screen.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH // 2, g(6))))
     hovered_card = None
     for card in upgrade_cards:
@@ -243,6 +386,9 @@ def draw_level_up_screen(screen, font, upgrade_cards):
 # =========================
 #   Boss UI (TOP-LEFT)
 # =========================
+# Faixa do topo onde ficam a barra do chefe (e o rótulo acima dela) e o selo "CHEFE!"
+BOSS_UI_RECT = pygame.Rect(0, 0, MARGIN + g(30), MARGIN + g(4))
+
 def draw_boss_health_bar(surface, boss):
     if boss and boss.alive():
         # barra no topo-esquerdo
@@ -260,7 +406,7 @@ def draw_boss_health_bar(surface, boss):
 def draw_boss_prompt(screen, font):
     # selo pequeno "CHEFE!" abaixo da barra do chefe (top-left)
     tag_font = load_medieval_font(24)
-    text = tag_font.render("CHEFE!", True, YELLOW)
+    text = render_text(tag_font, "CHEFE!", YELLOW)
     bg = pygame.Surface((text.get_width() + 12, text.get_height() + 6), pygame.SRCALPHA)
     bg.fill((0, 0, 0, 120))
     rect = bg.get_rect(topleft=(MARGIN + g(10), MARGIN + g(1.8)))  # alinhado próximo à barra
@@ -270,93 +416,335 @@ def draw_boss_prompt(screen, font):
 # =========================
 #   HUD (ancorado nas bordas)
 # =========================
+class RetainedHud:
+    """
+    HUD em modo retido. A moldura estática (painéis, coração, hexágonos) é pré-renderizada
+    uma vez; barras e overlays de cooldown só são redesenhados quando o valor que mostram
+    muda, e os textos vêm do cache de render_text. Por frame sobram só blits, na mesma
+    ordem do desenho imediato, então o resultado é idêntico pixel a pixel.
+    """
+    def __init__(self):
+        # --- Painel Score/Abates (TOP-RIGHT) ---
+        right_w = g(14)  # 224
+        self.right_rect = pygame.Rect(SCREEN_WIDTH - MARGIN - right_w, MARGIN, right_w, g(3))
+        self.right_panel = make_parchment_panel(right_w, g(3), border=2, corner_radius=10, alpha=210)
+
+        # --- Painel HP/XP (BOTTOM-LEFT) ---
+        panel_w = g(20)  # 320
+        panel_h = g(6)   # 96
+        self.panel_rect = pygame.Rect(MARGIN, SCREEN_HEIGHT - MARGIN - panel_h, panel_w, panel_h)
+        self.left_panel = make_parchment_panel(panel_w, panel_h, border=2, corner_radius=10, alpha=210)
+        self.hp_rect = pygame.Rect(self.panel_rect.x + g(1), self.panel_rect.y + g(0.6), panel_w - g(2), g(1.25))
+        self.xp_rect = pygame.Rect(self.hp_rect.x, self.panel_rect.bottom - g(1.9), self.hp_rect.w, g(1.0))
+        self.heart = pygame.Surface((20, 20), pygame.SRCALPHA)
+        draw_heart(self.heart, (10, 10), size=14, color=(200, 30, 30))
+        self.heart_pos = (self.hp_rect.x - 10 - 10, self.hp_rect.y + self.hp_rect.h // 2 - 10)
+        self._bars = {}  # nome -> (fill_w, Surface)
+
+        # --- Habilidades (BOTTOM-RIGHT) ---
+        size = g(4)        # 64
+        padding = g(1)     # 16
+        total = 4
+        total_w = total * size + (total - 1) * padding
+        start_x = SCREEN_WIDTH - MARGIN - total_w + size // 2
+        base_y = SCREEN_HEIGHT - MARGIN - size // 2
+        self.slot_r = r = int(size // 2)
+        self.slot_centers = [(start_x + i * (size + padding), base_y) for i in range(total)]
+        self.hexagon = pygame.Surface((r * 2 + 8, r * 2 + 8), pygame.SRCALPHA)
+        _draw_hexagon(self.hexagon, r + 4, r + 4, r)
+        self.glow = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.glow, (255, 255, 120, 80), (r, r), r)
+        self._overlays = {}  # altura -> Surface
+
+        # --- Borda de HP baixo: 4 faixas em vez de uma Surface da tela inteira ---
+        self.border_thickness = t = g(0.5)  # 8px
+        self.border_h = pygame.Surface((SCREEN_WIDTH, t), pygame.SRCALPHA)
+        self.border_v = pygame.Surface((t, SCREEN_HEIGHT - 2 * t), pygame.SRCALPHA)
+
+        # Tudo que o HUD pode pintar (rótulos das barras sobem acima do painel, FPS fica abaixo
+        # do placar); o renderer de dirty rects refaz essas áreas todo frame
+        slots = pygame.Rect(0, 0, total_w + 8, size + 8); slots.center = (SCREEN_WIDTH - MARGIN - total_w // 2, base_y)
+        self.rects = [self.right_rect.inflate(0, g(3)).move(0, g(1.5)), self.panel_rect.inflate(g(4), g(4)), slots]
+        self.border_rects = [
+            pygame.Rect(0, 0, SCREEN_WIDTH, t), pygame.Rect(0, SCREEN_HEIGHT - t, SCREEN_WIDTH, t),
+            pygame.Rect(0, t, t, SCREEN_HEIGHT - 2 * t), pygame.Rect(SCREEN_WIDTH - t, t, t, SCREEN_HEIGHT - 2 * t),
+        ]
+
+    def _bar_layer(self, name, rect, ratio, fg_top, fg_bottom, tick_every):
+        fill_w = int(rect.w * max(0.0, min(1.0, float(ratio))))
+        cached = self._bars.get(name)
+        if cached is None or cached[0] != fill_w:
+            layer = cached[1] if cached else pygame.Surface((rect.w + 6, rect.h + 6), pygame.SRCALPHA)
+            layer.fill((0, 0, 0, 0))
+            _draw_bar_body(layer, 3, 3, rect.w, rect.h, fill_w, fg_top, fg_bottom, tick_every)
+            cached = self._bars[name] = (fill_w, layer)
+        return cached[1]
+
+    def _cooldown_overlay(self, h):
+        overlay = self._overlays.get(h)
+        if overlay is None:
+            overlay = self._overlays[h] = pygame.Surface((self.slot_r * 2, h), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+        return overlay
+
+    def _draw_bar(self, screen, name, rect, ratio, fg_top, fg_bottom, label_text, tick_every):
+        screen.blit(self._bar_layer(name, rect, ratio, fg_top, fg_bottom, tick_every), (rect.x - 3, rect.y - 3))
+        lbl_surf = render_text(load_medieval_font(24), label_text, INK)
+        screen.blit(lbl_surf, (rect.x + 8, rect.y - lbl_surf.get_height()))
+
+    def draw(self, screen, player, score, kills, fps):
+        screen.blit(self.right_panel, self.right_rect)
+        txt = render_text(load_medieval_font(22), f"Score {score}  |  Abates {kills}", INK)
+        screen.blit(txt, txt.get_rect(center=self.right_rect.center))
+
+        if SHOW_FPS:
+            fps_surf = render_text(get_font(None, 20), f"{int(fps)} FPS", (220, 220, 220))
+            screen.blit(fps_surf, (SCREEN_WIDTH - fps_surf.get_width() - MARGIN, self.right_rect.bottom + 4))
+
+        # HP
+        screen.blit(self.left_panel, self.panel_rect)
+        hp_ratio = player.hp / player.max_hp if player.max_hp > 0 else 0
+        screen.blit(self.heart, self.heart_pos)
+        self._draw_bar(screen, 'hp', self.hp_rect, hp_ratio, HEALTH_RED, HEALTH_DARK, "Vita", 10)
+
+        # Texto HP discreto à direita
+        hp_text = render_text(load_medieval_font(20), f"{int(player.hp)}/{player.max_hp}", INK)
+        screen.blit(hp_text, (self.hp_rect.right - hp_text.get_width(), self.hp_rect.y - hp_text.get_height()))
+
+        # XP + Level
+        xp_ratio = player.xp / player.xp_to_next_level if player.xp_to_next_level > 0 else 1
+        self._draw_bar(screen, 'xp', self.xp_rect, xp_ratio, MANA_LIGHT, MANA_BLUE, f"Lv. {player.level}", 25)
+
+        # Habilidades
+        r = self.slot_r
+        abilities = (player.valkyrie, player.shield, player.thunder_leap, player.phoenix_call)
+        for key_text, ability, (x, y) in zip("QEFR", abilities, self.slot_centers):
+            screen.blit(self.hexagon, (x - r - 4, y - r - 4))
+            cooldown_ms, cooldown_total_ms = ability.cooldown_timer, ability.cooldown
+            if cooldown_total_ms and cooldown_ms > 0:
+                ratio = max(0.0, min(1.0, cooldown_ms / float(cooldown_total_ms)))
+                h = int(r * 2 * ratio)
+                screen.blit(self._cooldown_overlay(h), (x - r, y + r - h))
+                sec = max(0, int((cooldown_ms + 999) // 1000))
+                num = render_text(get_font(None, 28), str(sec), WHITE)
+                screen.blit(num, num.get_rect(center=(x, y)))
+            else:
+                screen.blit(self.glow, (x - r, y - r))
+            key = render_text(load_medieval_font(24), key_text, WHITE)
+            screen.blit(key, key.get_rect(center=(x, y)))
+
+        # --- Efeito: borda pulsante quando HP baixo ---
+        if hp_ratio < 0.25:
+            t = pygame.time.get_ticks() / 250.0
+            alpha = int(80 + 40 * (0.5 + 0.5 * math.sin(t)))
+            th = self.border_thickness
+            self.border_h.fill((255, 0, 0, alpha)); self.border_v.fill((255, 0, 0, alpha))
+            screen.blit(self.border_h, (0, 0)); screen.blit(self.border_h, (0, SCREEN_HEIGHT - th))
+            screen.blit(self.border_v, (0, th)); screen.blit(self.border_v, (SCREEN_WIDTH - th, th))
+
+_HUD = None
 def draw_hud(screen, player, score, kills, font, fps):
-    # --- Painel Score/Abates (TOP-RIGHT) ---
-    right_w = g(14)  # 224
-    right_rect = pygame.Rect(SCREEN_WIDTH - MARGIN - right_w, MARGIN, right_w, g(3))
-    draw_parchment_panel(screen, right_rect, border=2, corner_radius=10, alpha=210)
-
-    line_font = load_medieval_font(22)
-    txt = line_font.render(f"Score {score}  |  Abates {kills}", True, INK)
-    screen.blit(txt, txt.get_rect(center=(right_rect.centerx, right_rect.centery)))
-
-    if SHOW_FPS:
-        fps_font = pygame.font.Font(None, 20)
-        fps_surf = fps_font.render(f"{int(fps)} FPS", True, (220, 220, 220))
-        screen.blit(fps_surf, (SCREEN_WIDTH - fps_surf.get_width() - MARGIN, right_rect.bottom + 4))
-
-    # --- Painel HP/XP (BOTTOM-LEFT) ---
-    panel_w = g(20)  # 320
-    panel_h = g(6)   # 96
-    panel_rect = pygame.Rect(MARGIN, SCREEN_HEIGHT - MARGIN - panel_h, panel_w, panel_h)
-    draw_parchment_panel(screen, panel_rect, border=2, corner_radius=10, alpha=210)
-
-    # HP
-    hp_ratio = player.hp / player.max_hp if player.max_hp > 0 else 0
-    bar_hp_x = panel_rect.x + g(1)
-    bar_hp_y = panel_rect.y + g(0.6)
-    bar_hp_w = panel_w - g(2)
-    bar_hp_h = g(1.25)  # 20
-    draw_heart(screen, (bar_hp_x - 10, bar_hp_y + bar_hp_h // 2), size=14, color=(200, 30, 30))
-    draw_fancy_bar(screen, bar_hp_x, bar_hp_y, bar_hp_w, bar_hp_h, hp_ratio, HEALTH_RED, HEALTH_DARK, "Vita")
-
-    # Texto HP discreto à direita
-    small = load_medieval_font(20)
-    hp_text = small.render(f"{int(player.hp)}/{player.max_hp}", True, INK)
-    screen.blit(hp_text, (bar_hp_x + bar_hp_w - hp_text.get_width(), bar_hp_y - hp_text.get_height()))
-
-    # XP + Level
-    xp_ratio = player.xp / player.xp_to_next_level if player.xp_to_next_level > 0 else 1
-    bar_xp_x = bar_hp_x
-    bar_xp_y = panel_rect.bottom - g(1.9)  # sobe um pouco
-    bar_xp_w = bar_hp_w
-    bar_xp_h = g(1.0)  # 16
-    draw_fancy_bar(screen, bar_xp_x, bar_xp_y, bar_xp_w, bar_xp_h, xp_ratio, MANA_LIGHT, MANA_BLUE, f"Lv. {player.level}", label_color=INK, tick_every=25)
-
-    # --- Habilidades (BOTTOM-RIGHT) ---
-    size = g(4)        # 64
-    padding = g(1)     # 16
-    total = 4
-    total_w = total * size + (total - 1) * padding
-    start_x = SCREEN_WIDTH - MARGIN - total_w + size // 2
-    base_y = SCREEN_HEIGHT - MARGIN - size // 2
-
-    abilities_info = [
-        ("Q", player.valkyrie),
-        ("E", player.shield),
-        ("F", player.thunder_leap),
-        ("R", player.phoenix_call),
-    ]
-    for i, (key, ability) in enumerate(abilities_info):
-        cx = start_x + i * (size + padding)
-        draw_ability_slot(screen, (cx, base_y), size, key, ability.cooldown_timer, ability.cooldown)
-
-    # --- Efeito: borda pulsante quando HP baixo ---
-    if hp_ratio < 0.25:
-        t = pygame.time.get_ticks() / 250.0
-        alpha = int(80 + 40 * (0.5 + 0.5 * pygame.math.sin(t)))
-        border = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        # moldura grossa nas bordas
-        thickness = g(0.5)  # 8px
-        pygame.draw.rect(border, (255, 0, 0, alpha), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), thickness)
-        screen.blit(border, (0, 0))
+    global _HUD
+    if _HUD is None:
+        _HUD = RetainedHud()
+    _HUD.draw(screen, player, score, kills, fps)
+
+def hud_dirty_rects(player):
+    global _HUD
+    if _HUD is None:
+        _HUD = RetainedHud()
+    low_hp = player.max_hp > 0 and player.hp / player.max_hp < 0.25
+    return _HUD.rects + _HUD.border_rects if low_hp else _HUD.rects
+
+# =========================
+#   Profiler (F3)
+# =========================
+PROFILER_PHASES = [
+    ('input', 'Input'), ('player', 'Jogador'), ('enemies', 'Inimigos'), ('projectiles', 'Projéteis'),
+    ('collisions', 'Colisões'), ('render', 'Mundo'), ('daynight', 'Dia/Noite'), ('hud', 'HUD'),
+    ('overlay', 'Profiler'), ('flip', 'Flip'),
+]
+PROFILER_BG = (10, 10, 14, 190)
+PROFILER_OK = (120, 220, 120)
+PROFILER_HOT = (255, 90, 70)
+
+class ProfilerOverlay:
+    """
+    Painel do F3 na lateral esquerda: média e pico de cada fase na janela do
+    FrameProfiler, contadores vivos e o gráfico dos últimos frames contra o orçamento
+    de 1000/FPS ms. O texto só é refeito a cada `refresh_ms`; o gráfico, todo frame.
+    """
+    def __init__(self, refresh_ms=250, graph_size=(g(15), g(3))):
+        self.refresh_ms = refresh_ms; self.next_refresh = 0; self.panel = None
+        self.pos = (MARGIN, g(5.5))  # abaixo da barra do chefe, acima do painel de HP
+        self.budget = 1000 / FPS
+        self.font = get_font(None, 18); self.line_h = self.font.get_linesize()
+        self.graph = pygame.Surface(graph_size, pygame.SRCALPHA)
+
+    def _text(self, text, color, x, y, right=False):
+        # números mudam a cada refresh: render direto para não esvaziar o cache do render_text
+        surf = self.font.render(text, True, color)
+        self.panel.blit(surf, (x - surf.get_width() if right else x, y))
+
+    def _build_panel(self, profiler, counts):
+        frame = profiler.frame_times
+        rows = 2 + len(PROFILER_PHASES) + 1 + len(counts)
+        w = self.graph.get_width() + 2 * 8; h = rows * self.line_h + self.graph.get_height() + 3 * 8
+        if self.panel is None or self.panel.get_size() != (w, h): self.panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        self.panel.fill(PROFILER_BG)
+        avg = sum(frame) / len(frame) if frame else 0.0; peak = max(frame) if frame else 0.0
+        x, y = 8, 8; col_mean, col_peak = w - 8 - g(4), w - 8
+        self._text(f"Frame {avg:.2f} ms  pico {peak:.2f}  / {self.budget:.2f}",
+                   PROFILER_HOT if peak > self.budget else WHITE, x, y); y += self.line_h
+        self._text("fase (ms)", GREY, x, y); self._text("média", GREY, col_mean, y, True); self._text("pico", GREY, col_peak, y, True)
+        y += self.line_h
+        for phase, label in PROFILER_PHASES:
+            buf = profiler.samples.get(phase)
+            mean = sum(buf) / len(buf) if buf else 0.0; top = max(buf) if buf else 0.0
+            # vermelho: a fase sozinha já estourou o orçamento do frame em algum frame da janela
+            color = PROFILER_HOT if top > self.budget else PROFILER_OK if buf else GREY
+            self._text(label, color, x, y); self._text(f"{mean:.3f}", color, col_mean, y, True)
+            self._text(f"{top:.3f}", color, col_peak, y, True); y += self.line_h
+        y += self.line_h // 2
+        for name, value in counts.items():
+            self._text(name, WHITE, x, y); self._text(str(value), WHITE, col_peak, y, True); y += self.line_h
+        self.graph_pos = (x, y + 8)
+
+    def _draw_graph(self, profiler):
+        graph = self.graph; w, h = graph.get_size()
+        graph.fill((0, 0, 0, 120))
+        scale = h / (2 * self.budget)  # orçamento na metade da altura
+        budget_y = h - 1 - int(self.budget * scale)
+        pygame.draw.line(graph, PROFILER_HOT, (0, budget_y), (w, budget_y))
+        frames = list(profiler.frame_times)[-w:]
+        if len(frames) > 1:
+            x0 = w - len(frames)
+            points = [(x0 + i, h - 1 - min(h - 1, int(ms * scale))) for i, ms in enumerate(frames)]
+            pygame.draw.lines(graph, PROFILER_OK, False, points)
+            for i, ms in enumerate(frames):
+                if ms > self.budget: pygame.draw.line(graph, PROFILER_HOT, (x0 + i, h - 1), points[i])
+
+    def draw(self, screen, profiler, counts):
+        now = pygame.time.get_ticks()
+        if self.panel is None or now >= self.next_refresh:
+            self._build_panel(profiler, counts); self.next_refresh = now + self.refresh_ms
+        self._draw_graph(profiler)
+        self.rect = self.panel.get_rect(topleft=self.pos)
+        screen.blit(self.panel, self.pos)
+        screen.blit(self.graph, (self.pos[0] + self.graph_pos[0], self.pos[1] + self.graph_pos[1]))
+
+_PROFILER_OVERLAY = None
+def draw_profiler_overlay(screen, profiler, counts):
+    global _PROFILER_OVERLAY
+    if _PROFILER_OVERLAY is None:
+        _PROFILER_OVERLAY = ProfilerOverlay()
+    _PROFILER_OVERLAY.draw(screen, profiler, counts)
+
+def profiler_overlay_rect():
+    return _PROFILER_OVERLAY.rect if _PROFILER_OVERLAY and _PROFILER_OVERLAY.panel else None
 
 # =========================
 #   Background & Dia/Noite
 # =========================
-def draw_background(surface, grass_tile):
-    """Preenche a tela com o tile de grama (ou outra textura)."""
-    tile_w, tile_h = grass_tile.get_size()
-    for x in range(0, SCREEN_WIDTH, tile_w):
-        for y in range(0, SCREEN_HEIGHT, tile_h):
-            surface.blit(grass_tile, (x, y))
+# Camadas decorativas assadas no chão: (arquivo, tamanho, quantidade por tela, seed). As
+# posições saem da seed e do chunk, então são sempre as mesmas; só entram se SHOW_SCENERY
+# (ou settings.OBSTACLES) estiver ligado.
+SCENERY_LAYERS = [
+    ('Rocha.png', (48, 48), 7, 11),
+]
+TERRAIN_CHUNK = 512              # lado (px) de cada pedaço de chão assado
+TERRAIN_CACHE_CHUNKS = 16        # teto de chunks assados na memória (nunca menos que tela + margem)
+TERRAIN_PREFETCH = 128           # px além da tela em que os chunks já são assados antes de aparecer
+TERRAIN_PREFETCH_PER_FRAME = 1   # chunks da margem assados por frame; os visíveis saem na hora
+KEEP_CLEAR = 120                 # raio sem decoração em volta do centro do mundo (onde o jogador nasce)
+
+def chunk_decorations(col, row, world=ARENA_RECT, chunk=TERRAIN_CHUNK):
+    """(Surface, (x, y)) em coordenadas de mundo da decoração do chunk (col, row); inteira dentro do chunk."""
+    if not (SHOW_SCENERY or OBSTACLES): return []
+    wx, wy, ww, wh = world; cx, cy = wx + ww / 2, wy + wh / 2; x0, y0 = col * chunk, row * chunk
+    items = []
+    for file_name, size, count, seed in SCENERY_LAYERS:
+        rng = random.Random(f'{seed}:{col}:{row}')  # mesma decoração toda vez que o chunk é assado
+        expected = count * chunk * chunk / (SCREEN_WIDTH * SCREEN_HEIGHT)
+        image = load_sprite(file_name, size)
+        for _ in range(int(expected) + (rng.random() < expected % 1)):
+            x, y = x0 + rng.randrange(0, chunk - size[0]), y0 + rng.randrange(0, chunk - size[1])
+            if x < wx or y < wy or x + size[0] > wx + ww or y + size[1] > wy + wh: continue  # chunk da borda
+            if math.hypot(x + size[0] / 2 - cx, y + size[1] / 2 - cy) > KEEP_CLEAR: items.append((image, (x, y)))
+    return items
+
+class ChunkedTerrain:
+    """
+    Chão do mundo em chunks de TERRAIN_CHUNK px (tile + decoração do chunk), assados sob
+    demanda em volta da câmera e guardados num cache LRU de no máximo `capacity`
+    Surfaces: a memória não cresce com o tamanho do mapa. Os chunks que a tela mostra
+    são assados na hora; os da margem TERRAIN_PREFETCH vão sendo assados antes de
+    aparecer, no máximo TERRAIN_PREFETCH_PER_FRAME por frame, para a rolagem não engasgar.
+    """
+    def __init__(self, tile, view_size=(SCREEN_WIDTH, SCREEN_HEIGHT), world=ARENA_RECT, chunk=TERRAIN_CHUNK, capacity=TERRAIN_CACHE_CHUNKS):
+        self.tile = tile; self.world = pygame.Rect(world); self.chunk = chunk
+        self.chunks = OrderedDict()  # (coluna, linha) -> Surface, do menos para o mais recente
+        span = lambda n: -(-(n + 2 * TERRAIN_PREFETCH) // chunk) + 1  # chunks que uma faixa de n px pode tocar
+        self.capacity = max(capacity, span(view_size[0]) * span(view_size[1]))
+        self.baked = 0
+
+    def covering(self, rect):
+        c = self.chunk
+        return [(col, row) for row in range(rect.top // c, (rect.bottom - 1) // c + 1)
+                for col in range(rect.left // c, (rect.right - 1) // c + 1)]
+
+    def get(self, key):
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self.chunks[key] = self.bake(*key)
+            if len(self.chunks) > self.capacity: self.chunks.popitem(last=False)
+        else: self.chunks.move_to_end(key)
+        return surface
+
+    def bake(self, col, row):
+        c = self.chunk; x0, y0 = col * c, row * c
+        surface = pygame.Surface((c, c))
+        if pygame.display.get_surface(): surface = surface.convert()
+        tile_w, tile_h = self.tile.get_size()
+        # o tile segue a grade do mundo: as emendas entre chunks não aparecem
+        surface.blits([(self.tile, (x - x0, y - y0)) for x in range(x0 - x0 % tile_w, x0 + c, tile_w)
+                       for y in range(y0 - y0 % tile_h, y0 + c, tile_h)], doreturn=False)
+        surface.blits([(image, (x - x0, y - y0)) for image, (x, y) in chunk_decorations(col, row, self.world, c)], doreturn=False)
+        self.baked += 1
+        return surface
+
+    def draw(self, surface, view, areas=None):
+        """Desenha o chão do rect de mundo `view` (ou só `areas`, em coordenadas de tela) e adianta a margem."""
+        ox, oy = view.topleft; c = self.chunk; blits = []
+        for key in self.covering(view):
+            chunk_surface = self.get(key); x, y = key[0] * c - ox, key[1] * c - oy
+            if areas is None: blits.append((chunk_surface, (x, y))); continue
+            box = pygame.Rect(x, y, c, c)
+            for area in areas:
+                clip = area.clip(box)
+                if clip: blits.append((chunk_surface, clip, clip.move(-x, -y)))
+        surface.blits(blits, doreturn=False)
+        budget = TERRAIN_PREFETCH_PER_FRAME
+        for key in self.covering(view.inflate(TERRAIN_PREFETCH * 2, TERRAIN_PREFETCH * 2).clip(self.world)):
+            if key in self.chunks: self.chunks.move_to_end(key)
+            elif budget: self.get(key); budget -= 1
+
+_TERRAINS = {}
+def get_terrain(grass_tile):
+    terrain = _TERRAINS.get(grass_tile)
+    if terrain is None: terrain = _TERRAINS[grass_tile] = ChunkedTerrain(grass_tile)
+    return terrain
+
+def draw_background(surface, grass_tile, view, areas=None):
+    """Preenche a tela (ou só `areas`) com o chão do rect de mundo `view`: tile de grama + decoração, assados por chunk."""
+    get_terrain(grass_tile).draw(surface, view, areas)
 
 def is_night(cycle_timer):
     cycle_duration = 120000
     time_of_day = (cycle_timer % cycle_duration) / cycle_duration
     return 0.55 < time_of_day < 0.95
 
-def draw_day_night_cycle(surface, cycle_timer, player):
+def get_darkness(cycle_timer):
     cycle_duration = 120000
     time_of_day = (cycle_timer % cycle_duration) / cycle_duration
     darkness = 0
@@ -365,12 +753,15 @@ def draw_day_night_cycle(surface, cycle_timer, player):
             darkness = int((time_of_day - 0.5) * 2 * 180)
         else:
             darkness = int((1.0 - time_of_day) * 2 * 180)
-    darkness = max(0, min(darkness, 180))
+    return max(0, min(darkness, 180))
+
+def draw_day_night_cycle(surface, cycle_timer, player, lights=(), areas=None, origin=(0, 0)):
+    """Máscara de noite com a luz do jogador e as `lights` extras ((x, y), raio, no mundo) — ver lighting.py."""
+    darkness = get_darkness(cycle_timer)
     if darkness > 0:
-        light_mask = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        light_mask.fill((0, 0, 0, darkness))
-        pygame.draw.circle(light_mask, (0, 0, 0, 0), player.rect.center, 150)
-        surface.blit(light_mask, (0, 0))
+        ox, oy = origin
+        lights = [((x - ox, y - oy), r) for (x, y), r in [(player.rect.center, PLAYER_LIGHT_RADIUS), *lights]]
+        light_map.render(surface, darkness, lights, areas)
 
 # =========================
 #   Telas: Menu / Opções / Game Over
@@ -384,29 +775,29 @@ def _draw_bg_with_overlay(screen, alpha=120):
 def draw_main_menu(screen, font, selected_index):
     _draw_bg_with_overlay(screen, alpha=140)
     title_font = load_medieval_font(96)
-    subtitle_font = pygame.font.Font(None, 36)
+    subtitle_font = get_font(None, 36)
 
-    title = title_font.render("ACTION RPG", True, YELLOW)
-    shadow = title_font.render("ACTION RPG", True, BLACK)
+    title = render_text(title_font, "ACTION RPG", YELLOW)
+    shadow = render_text(title_font, "ACTION RPG", BLACK)
     screen.blit(shadow, shadow.get_rect(center=(SCREEN_WIDTH // 2 + 2, g(10) + 2)))
     screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, g(10))))
 
-    subtitle = subtitle_font.render("Top-Down Horde Survival", True, GREY)
+    subtitle = render_text(subtitle_font, "Top-Down Horde Survival", GREY)
     screen.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, g(12))))
 
     menu_items = ["Iniciar Jogo", "Opções", "Sair"]
     for i, item in enumerate(menu_items):
         color = YELLOW if i == selected_index else WHITE
-        text = pygame.font.Font(None, 40).render(item, True, color)
+        text = render_text(get_font(None, 40), item, color)
         screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, g(20) + i * g(3))))
 
-    hint = subtitle_font.render("↑/↓ para navegar • Enter para confirmar", True, GREY)
+    hint = render_text(subtitle_font, "↑/↓ para navegar • Enter para confirmar", GREY)
     screen.blit(hint, hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - g(3))))
 
 def draw_options(screen, font):
     _draw_bg_with_overlay(screen, alpha=140)
     title_font = load_medieval_font(72)
-    title = title_font.render("Opções", True, YELLOW)
+    title = render_text(title_font, "Opções", YELLOW)
     screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, g(8))))
 
     lines = [
@@ -418,30 +809,30 @@ def draw_options(screen, font):
         " ",
         "Dica: inimigos ficam mais fortes à noite!",
     ]
-    small = pygame.font.Font(None, 32)
+    small = get_font(None, 32)
     for i, line in enumerate(lines):
         color = WHITE if not line.strip().startswith("Dica") else GREY
-        txt = small.render(line, True, color)
+        txt = render_text(small, line, color)
         screen.blit(txt, (SCREEN_WIDTH // 2 - g(14), g(12) + i * g(2)))
 
-    back = small.render("Pressione ESC para voltar ao Menu", True, GREY)
+    back = render_text(small, "Pressione ESC para voltar ao Menu", GREY)
     screen.blit(back, back.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - g(3))))
 
 def draw_game_over(screen, font, selected_index):
     _draw_bg_with_overlay(screen, alpha=170)
     title_font = load_medieval_font(96)
-    title = title_font.render("GAME OVER", True, RED)
-    shadow = title_font.render("GAME OVER", True, BLACK)
+    title = render_text(title_font, "GAME OVER", RED)
+    shadow = render_text(title_font, "GAME OVER", BLACK)
     screen.blit(shadow, shadow.get_rect(center=(SCREEN_WIDTH // 2 + 2, g(12) + 2)))
     screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, g(12))))
 
     options = ["Reiniciar", "Voltar ao Menu"]
     for i, opt in enumerate(options):
         color = YELLOW if i == selected_index else WHITE
-        text = pygame.font.Font(None, 40).render(opt, True, color)
+        text = render_text(get_font(None, 40), opt, color)
         screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, g(18) + i * g(3))))
 
 def draw_pause(screen, font):
     pause_font = load_medieval_font(74)
-    pause_text = pause_font.render("PAUSADO", True, WHITE)
+    pause_text = render_text(pause_font, "PAUSADO", WHITE)
     screen.blit(pause_text, pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
@@ -0,0 +1,49 @@
+# world.py
+import pygame
+from settings import *
+
+class Camera:
+    """
+    Janela da tela sobre o mundo (ARENA_RECT). Há duas posições: `rect` segue o centro
+    do jogador na simulação (follow, a cada passo) e é o que a simulação usa para
+    culling, LOD e spawn; `origin` é o canto de onde o frame é desenhado, calculado em
+    place() a partir do centro interpolado, então o jogador não treme na tela.
+    lock() congela a câmera (luta de chefe): a arena vira a própria tela.
+    """
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), world=ARENA_RECT):
+        self.world = pygame.Rect(world); self.rect = pygame.Rect((0, 0), size)
+        self.reset(self.world.center)
+
+    def reset(self, center):
+        self.locked = False; self.origin = None; self.follow(center)
+
+    def follow(self, center):
+        if not self.locked: self.rect.center = center; self.rect.clamp_ip(self.world)
+        self.active = self.rect.inflate(ACTIVE_MARGIN * 2, ACTIVE_MARGIN * 2)
+
+    def lock(self): self.locked = True
+
+    def unlock(self): self.locked = False
+
+    @property
+    def bounds(self):
+        """Área em que o jogador pode andar: o mundo ou, com a câmera travada, a tela."""
+        return self.rect if self.locked else self.world
+
+    def place(self, center):
+        """Fixa `origin` para o frame centrado em `center`; devolve True se mudou (a tela inteira rolou)."""
+        if self.locked: origin = self.rect.topleft
+        else: view = self.rect.copy(); view.center = center; view.clamp_ip(self.world); origin = view.topleft
+        moved = origin != self.origin; self.origin = origin
+        return moved
+
+    @property
+    def view(self):
+        """Rect do mundo que está sendo desenhado (tamanho da tela, em `origin`)."""
+        return pygame.Rect(self.origin or self.rect.topleft, self.rect.size)
+
+    def to_world(self, pos):
+        ox, oy = self.origin or self.rect.topleft
+        return pos[0] + ox, pos[1] + oy
+
+camera = Camera()